@@ -42,6 +42,22 @@ def main():
         nargs="+",
         help="Documents to analyze (default: all cached documents)"
     )
+    study_parser.add_argument(
+        "--recompute",
+        action="store_true",
+        help="Ignore memoized agent results and call the LLM for every claim-document pair"
+    )
+    study_parser.add_argument(
+        "--resume",
+        metavar="JOURNAL",
+        help="Continue an interrupted study from its data/studies/study_journal_*.jsonl"
+    )
+    study_parser.add_argument(
+        "--routing",
+        choices=["off", "skip", "screen"],
+        default="off",
+        help="Skip or screen claim-document pairs that score low on word overlap (default: off)"
+    )
     
     # Marketing ingest command
     marketing_parser = subparsers.add_parser(
@@ -64,6 +80,67 @@ def main():
         help="Remove entire cache directory (requires confirmation)"
     )
     
+    # Cache management command
+    cache_parser = subparsers.add_parser(
+        "cache",
+        help="Inspect cache usage or evict regenerable artifacts"
+    )
+    cache_parser.add_argument(
+        "action",
+        choices=["stats", "gc"],
+        help="stats: show usage per document; gc: enforce the disk budget"
+    )
+    cache_parser.add_argument(
+        "--cache-dir",
+        action="append",
+        help="Cache directory to manage (repeatable, default: scientific and marketing caches)"
+    )
+    cache_parser.add_argument(
+        "--budget-mb",
+        type=float,
+        help="Disk budget in MB (default: CACHE_BUDGET_MB setting)"
+    )
+    cache_parser.add_argument(
+        "--include-figures",
+        action="store_true",
+        help="Also evict figure crops once other regenerable artifacts are gone"
+    )
+    cache_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what gc would remove without deleting anything"
+    )
+    
+    # Detection DPI evaluation command
+    eval_dpi_parser = subparsers.add_parser(
+        "eval-dpi",
+        help="Compare layout detection accuracy and speed at several DPIs"
+    )
+    eval_dpi_parser.add_argument(
+        "--dpis",
+        nargs="+",
+        type=int,
+        help="Detection DPIs to compare (default: 150 200 300 400)"
+    )
+    eval_dpi_parser.add_argument(
+        "--reference-dpi",
+        type=int,
+        help="DPI treated as ground truth (default: highest DPI)"
+    )
+    eval_dpi_parser.add_argument(
+        "--input-dir",
+        help="Directory of PDFs to evaluate (default: data/clinical_files)"
+    )
+    eval_dpi_parser.add_argument(
+        "--max-pages",
+        type=int,
+        help="Evaluate at most this many pages per PDF"
+    )
+    eval_dpi_parser.add_argument(
+        "--output",
+        help="Write detailed JSON results to this path"
+    )
+    
     args = parser.parse_args()
     
     # Route to appropriate command
@@ -72,10 +149,28 @@ def main():
         ingest_main(output_dir=args.output_dir)
     elif args.command == "run-study":
         from .run_study import main as study_main
-        study_main(claims_file=args.claims, documents=args.documents)
+        study_main(claims_file=args.claims, documents=args.documents, recompute=args.recompute, resume=args.resume, routing=args.routing)
     elif args.command == "ingest-marketing":
         from .ingest_marketing import main as marketing_main
         marketing_main(pdf_path=args.pdf_path, output_dir=args.output_dir)
+    elif args.command == "cache":
+        from .cache import main as cache_main
+        cache_main(
+            action=args.action,
+            cache_dirs=args.cache_dir,
+            budget_mb=args.budget_mb,
+            include_figures=args.include_figures,
+            dry_run=args.dry_run
+        )
+    elif args.command == "eval-dpi":
+        from .eval_dpi import main as eval_dpi_main
+        eval_dpi_main(
+            dpis=args.dpis,
+            reference_dpi=args.reference_dpi,
+            input_dir=args.input_dir,
+            max_pages=args.max_pages,
+            output=args.output
+        )
     elif args.command == "clear-all-cache":
         from .clean import main as clean_main
         clean_main()
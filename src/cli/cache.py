@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""CLI for inspecting and bounding the document cache size."""
+
+from pathlib import Path
+from typing import List, Optional
+
+from ..core.cache_manager import CacheManager
+from ..core.config import settings
+
+
+# Document caches managed by default
+DEFAULT_CACHE_DIRS = [
+    Path("data/scientific_cache"),
+    Path("data/marketing_cache"),
+]
+
+
+def _mb(n_bytes: int) -> str:
+    return f"{n_bytes / (1024 * 1024):.1f} MB"
+
+
+def _budget_bytes(budget_mb: Optional[float]) -> Optional[int]:
+    if budget_mb is None:
+        budget_mb = settings.cache_budget_mb
+    return int(budget_mb * 1024 * 1024) if budget_mb is not None else None
+
+
+def show_stats(manager: CacheManager) -> None:
+    """Print per-document cache usage broken down by artifact type."""
+    documents = manager.scan()
+    if not documents:
+        print("No cached documents found.")
+        return
+
+    for doc in sorted(documents, key=lambda d: d.total_bytes, reverse=True):
+        print(f"{doc.path}  {_mb(doc.total_bytes)}  (regenerable: {_mb(doc.regenerable_bytes)})")
+        for stats in sorted(doc.artifacts.values(), key=lambda a: a.bytes, reverse=True):
+            artifact_type = stats.artifact_type
+            marker = "regenerable" if artifact_type and artifact_type.regenerable else "kept"
+            print(f"    {stats.name:<28} {len(stats.files):>5} files  {_mb(stats.bytes):>10}  [{marker}]")
+
+    total = manager.total_bytes(documents)
+    print(f"\nTotal: {_mb(total)} across {len(documents)} documents")
+    if manager.budget_bytes is not None:
+        print(f"Budget: {_mb(manager.budget_bytes)}")
+
+
+def run_gc(manager: CacheManager, include_figures: bool, dry_run: bool) -> None:
+    """Evict regenerable artifacts until the cache fits the budget."""
+    if manager.budget_bytes is None:
+        print("No cache budget configured. Pass --budget-mb or set CACHE_BUDGET_MB.")
+        return
+
+    summary = manager.gc(include_figures=include_figures, dry_run=dry_run)
+    verb = "Would evict" if dry_run else "Evicted"
+    for entry in summary["evicted"]:
+        print(f"{verb} {entry['artifact']} from {entry['document']} ({entry['files']} files, {_mb(entry['bytes'])})")
+
+    print(f"\nCache size: {_mb(summary['bytes_before'])} → {_mb(summary['bytes_after'])} "
+          f"(budget {_mb(summary['budget_bytes'])})")
+
+
+def main(
+    action: str,
+    cache_dirs: Optional[List[str]] = None,
+    budget_mb: Optional[float] = None,
+    include_figures: bool = False,
+    dry_run: bool = False,
+):
+    """Main CLI entrypoint."""
+    dirs = [Path(d) for d in cache_dirs] if cache_dirs else DEFAULT_CACHE_DIRS
+    manager = CacheManager(dirs, budget_bytes=_budget_bytes(budget_mb))
+
+    if action == "stats":
+        show_stats(manager)
+    elif action == "gc":
+        run_gc(manager, include_figures=include_figures, dry_run=dry_run)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""CLI for comparing layout detection accuracy and speed across DPIs."""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+from ..injestion.scientific.dpi_evaluation import evaluate_detection_dpi
+
+
+# Default paths
+DEFAULT_INPUT_DIR = Path("data/clinical_files")
+
+
+def print_summary(results: dict) -> None:
+    """Print the per-DPI accuracy-vs-speed table."""
+    print(f"\nReference DPI: {results['reference_dpi']} "
+          f"(IoU ≥ {results['iou_threshold']}, coordinates at {results['coordinate_dpi']} DPI)\n")
+    print(f"{'DPI':>5} {'pages':>6} {'raster s/pg':>12} {'detect s/pg':>12} "
+          f"{'blocks':>7} {'precision':>10} {'recall':>7} {'F1':>6} {'mIoU':>6}")
+    for dpi, row in sorted(results["summary"].items()):
+        print(f"{dpi:>5} {row['pages']:>6} {row['rasterize_s_per_page']:>12.2f} {row['detect_s_per_page']:>12.2f} "
+              f"{row['blocks']:>7} {row['precision']:>10.3f} {row['recall']:>7.3f} "
+              f"{row['f1']:>6.3f} {row['mean_iou']:>6.3f}")
+
+
+def main(
+    dpis: Optional[List[int]] = None,
+    reference_dpi: Optional[int] = None,
+    input_dir: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    output: Optional[str] = None,
+):
+    """Main CLI entrypoint."""
+    input_dir = Path(input_dir) if input_dir else DEFAULT_INPUT_DIR
+    pdf_files = sorted(input_dir.glob("*.pdf"))
+    if not pdf_files:
+        print(f"No PDF files found in {input_dir}")
+        return
+
+    print(f"Evaluating detection DPI on {len(pdf_files)} PDFs from {input_dir}")
+    results = evaluate_detection_dpi(
+        pdf_files,
+        dpis=dpis or [150, 200, 300, 400],
+        reference_dpi=reference_dpi,
+        max_pages=max_pages,
+    )
+    print_summary(results)
+
+    if output:
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(results, indent=2))
+        print(f"\nDetailed results saved to: {output_path}")
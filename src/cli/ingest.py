@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional
 
 from ..injestion.scientific.standard_pipeline import StandardPipeline
+from ..core.cache_manager import CacheManager
+from ..core.config import settings
 
 
 # Default paths
@@ -79,6 +81,14 @@ def process_all_pdfs(output_dir: Optional[Path] = None) -> None:
     print(f"  - Successful: {successful}")
     print(f"  - Failed: {failed}")
     print(f"  - Results saved in: {cache_dir}/")
+    
+    # Keep the cache within its configured disk budget
+    if settings.cache_budget_mb is not None:
+        manager = CacheManager([cache_dir], budget_bytes=int(settings.cache_budget_mb * 1024 * 1024))
+        summary = manager.gc()
+        if summary["evicted"]:
+            print(f"  - Cache trimmed to budget: "
+                  f"{summary['bytes_before'] / 2**20:.1f} MB → {summary['bytes_after'] / 2**20:.1f} MB")
 
 
 def main(output_dir=None):
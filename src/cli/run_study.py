@@ -6,6 +6,7 @@ from pathlib import Path
 import sys
 
 from ..fact_check.orchestrators import StudyOrchestrator
+from ..fact_check.core.http_pool import close_http_client
 
 # Configure logging to show all agent logs
 logging.basicConfig(
@@ -28,12 +29,15 @@ def get_default_documents():
     return sorted(documents)
 
 
-def main(claims_file=None, documents=None):
+def main(claims_file=None, documents=None, recompute=False, resume=None, routing="off"):
     """Main entry point.
     
     Args:
         claims_file: Path to claims JSON file
         documents: List of document names to analyze
+        recompute: Ignore memoized agent results from earlier studies
+        resume: Journal of an interrupted study to continue
+        routing: Claim-document routing mode (off, skip or screen)
     """
     # Use defaults if not provided
     if claims_file is None:
@@ -49,13 +53,34 @@ def main(claims_file=None, documents=None):
     if not Path(claims_file).exists():
         print(f"Error: Claims file not found: {claims_file}")
         sys.exit(1)
+    if resume is not None and not Path(resume).exists():
+        print(f"Error: Journal not found: {resume}")
+        sys.exit(1)
     
     # Configuration
     config = {
         "agent_config": {
             "fresh_response": True
         },
-        "max_concurrent_claims": 6  # Optimal for 32GB RAM, 10 CPU cores
+        # Agent runs in flight across all claims, documents and images
+        "max_concurrent_agents": 12,
+        # Opt-in: low-scoring claim-document pairs are skipped or get a cheap
+        # screening call instead of the full pipeline. Off by default because
+        # the threshold is not calibrated; known evidence pairs can score
+        # below it (e.g. FlublokPI for the "3x HA antigen" claim)
+        "routing": {
+            "mode": routing,
+            "threshold": 0.15
+        },
+        # Extract evidence for groups of claims per document in one call;
+        # the group size shrinks for long documents
+        "batch_extraction": {
+            "enabled": True,
+            "max_group_size": 6,
+            "token_budget": 120000
+        },
+        # Reuse agent results from earlier studies whose inputs are unchanged
+        "recompute": recompute
     }
     
     # Print study info
@@ -63,6 +88,12 @@ def main(claims_file=None, documents=None):
     print("=" * 30)
     print(f"Claims file: {claims_file}")
     print(f"Documents: {', '.join(documents)}")
+    if recompute:
+        print("Recomputing all agent results")
+    if resume is not None:
+        print(f"Resuming from: {resume}")
+    if routing != "off":
+        print(f"Claim-document routing: {routing}")
     print()
     
     # Create and run orchestrator
@@ -71,10 +102,18 @@ def main(claims_file=None, documents=None):
         documents=documents,
         cache_dir=Path(cache_dir),
         output_dir=Path(output_dir),
-        config=config
+        config=config,
+        resume_journal=Path(resume) if resume is not None else None
     )
     
+    async def run():
+        try:
+            await orchestrator.process()
+        finally:
+            # Close pooled gateway connections before the loop shuts down
+            await close_http_client()
+
     # Run async
-    asyncio.run(orchestrator.process())
+    asyncio.run(run())
 
 
@@ -0,0 +1,239 @@
+"""BM25 inverted index over the blocks of an extracted document.
+
+The index is built at ingest time and stored next to ``content.json`` as
+``extracted/block_index.json``. Fact-checking agents use it to send only the
+blocks relevant to a claim (plus their reading-order neighbours) instead of
+the whole document text.
+
+The index works on plain ``content.json`` dictionaries so it can be shared by
+the ingestion pipelines and the fact-checking agents without either importing
+the other.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "block_index.json"
+INDEX_VERSION = 1
+
+# Words, and numbers with an optional decimal part ("0.5", "95")
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+
+_STOPWORDS = frozenset("""
+a an and are as at be been but by can could did do does for from had has have
+if in into is it its may more most no not of on or our such than that the their
+them then there these they this those to was were which while who will with
+would
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into index terms, dropping stopwords."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def content_hash(content_json: Dict[str, Any]) -> str:
+    """Hash of the block ids, texts and reading order an index was built from."""
+    h = hashlib.sha256()
+    for block in content_json.get("blocks", []):
+        h.update(block.get("id", "").encode())
+        h.update(b"\0")
+        h.update((block.get("text") or "").encode())
+        h.update(b"\0")
+    h.update(json.dumps(content_json.get("reading_order", [])).encode())
+    return h.hexdigest()
+
+
+def index_path(extracted_dir: Path) -> Path:
+    """Path of the block index stored alongside ``content.json``."""
+    return Path(extracted_dir) / INDEX_NAME
+
+
+class BlockIndex:
+    """Okapi BM25 index over document blocks in reading order."""
+
+    def __init__(
+        self,
+        blocks: List[Dict[str, Any]],
+        postings: Dict[str, List[Tuple[int, int]]],
+        source_hash: str,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Args:
+            blocks: Block entries in reading order, each with ``id``,
+                ``page_index``, ``text`` and ``length`` (token count)
+            postings: Term -> list of (block position, term frequency)
+            source_hash: ``content_hash`` of the document the index covers
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalisation
+        """
+        self.blocks = blocks
+        self.postings = postings
+        self.source_hash = source_hash
+        self.k1 = k1
+        self.b = b
+        lengths = [blk["length"] for blk in blocks]
+        self.avgdl = sum(lengths) / len(lengths) if lengths else 0.0
+        self._position = {blk["id"]: pos for pos, blk in enumerate(blocks)}
+
+    # ------------------------------------------------------------------
+    # Construction and persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, content_json: Dict[str, Any], **params) -> "BlockIndex":
+        """Build an index from a ``content.json`` dictionary."""
+        blocks_by_id = {block["id"]: block for block in content_json.get("blocks", [])}
+
+        blocks = []
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for page_idx, page_blocks in enumerate(content_json.get("reading_order", [])):
+            for block_id in page_blocks:
+                block = blocks_by_id.get(block_id)
+                if not block or not block.get("text"):
+                    continue
+                terms = Counter(tokenize(block["text"]))
+                pos = len(blocks)
+                blocks.append({
+                    "id": block_id,
+                    "page_index": page_idx,
+                    "text": block["text"],
+                    "length": sum(terms.values()),
+                })
+                for term, tf in terms.items():
+                    postings.setdefault(term, []).append((pos, tf))
+
+        return cls(blocks, postings, content_hash(content_json), **params)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "source_hash": self.source_hash,
+            "k1": self.k1,
+            "b": self.b,
+            "blocks": self.blocks,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BlockIndex":
+        return cls(
+            blocks=data["blocks"],
+            postings={term: [tuple(p) for p in plist] for term, plist in data["postings"].items()},
+            source_hash=data["source_hash"],
+            k1=data.get("k1", 1.5),
+            b=data.get("b", 0.75),
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically."""
+        path = Path(path)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["BlockIndex"]:
+        """Load an index, returning None if it is missing or unreadable."""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != INDEX_VERSION:
+            return None
+        return cls.from_dict(data)
+
+    @classmethod
+    def for_document(cls, content_json: Dict[str, Any], extracted_dir: Path) -> "BlockIndex":
+        """Load the persisted index for a document, rebuilding it if stale.
+
+        Args:
+            content_json: The document's ``content.json`` data
+            extracted_dir: Directory holding ``content.json``
+
+        Returns:
+            An index matching the current document content
+        """
+        path = index_path(extracted_dir)
+        index = cls.load(path)
+        if index is not None and index.source_hash == content_hash(content_json):
+            return index
+
+        logger.info(f"Building block index for {extracted_dir}")
+        index = cls.build(content_json)
+        try:
+            index.save(path)
+        except OSError as e:
+            logger.warning(f"Could not save block index to {path}: {e}")
+        return index
+
+    # ------------------------------------------------------------------
+    # Retrieval
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """Return the ``top_k`` (block id, BM25 score) pairs for a query."""
+        n_blocks = len(self.blocks)
+        if not n_blocks:
+            return []
+
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            plist = self.postings.get(term)
+            if not plist:
+                continue
+            idf = math.log(1 + (n_blocks - len(plist) + 0.5) / (len(plist) + 0.5))
+            for pos, tf in plist:
+                norm = self.k1 * (1 - self.b + self.b * self.blocks[pos]["length"] / (self.avgdl or 1.0))
+                scores[pos] = scores.get(pos, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+        return [(self.blocks[pos]["id"], score) for pos, score in ranked]
+
+    def expand_neighbors(self, block_ids: Iterable[str], neighbors: int = 1) -> List[str]:
+        """Add reading-order neighbours to block ids, returned in reading order."""
+        positions = set()
+        for block_id in block_ids:
+            pos = self._position.get(block_id)
+            if pos is None:
+                continue
+            lo, hi = max(0, pos - neighbors), min(len(self.blocks) - 1, pos + neighbors)
+            positions.update(range(lo, hi + 1))
+        return [self.blocks[pos]["id"] for pos in sorted(positions)]
+
+    def render(self, block_ids: Iterable[str]) -> str:
+        """Join block texts in reading order with page markers and gap markers.
+
+        Non-adjacent runs of blocks are separated by ``[...]`` so the model
+        can tell that text was omitted between them.
+        """
+        positions = sorted(self._position[b] for b in set(block_ids) if b in self._position)
+
+        texts = []
+        prev_pos = None
+        prev_page = None
+        for pos in positions:
+            block = self.blocks[pos]
+            if block["page_index"] != prev_page:
+                texts.append(f"[Page {block['page_index'] + 1}]")
+            elif prev_pos is not None and pos != prev_pos + 1:
+                texts.append("[...]")
+            texts.append(block["text"])
+            prev_pos, prev_page = pos, block["page_index"]
+
+        return "\n\n".join(texts)
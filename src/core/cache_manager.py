@@ -0,0 +1,310 @@
+"""Disk budget management for processed document caches.
+
+Every document directory below a cache root (``data/scientific_cache/<doc>``)
+is made up of artefacts with very different value:
+
+* ``extracted/content.json`` and ``agents/`` are the primary outputs and are
+  expensive (or impossible) to recreate – they are **never** evicted.
+* Page rasters, layout visualisations and readable exports can be
+  regenerated from the source PDF or from ``content.json`` at any time.
+
+The :class:`CacheManager` classifies files into artefact types, records the
+last access time of each document in a small ``manifest.json`` and, when the
+cache exceeds its byte budget, evicts regenerable artefacts from the least
+recently used documents first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass(frozen=True)
+class ArtifactType:
+    """A class of cached files sharing a location and eviction policy."""
+    name: str
+    # Paths relative to the document directory; a trailing "/" matches a
+    # whole subtree
+    patterns: tuple
+    regenerable: bool
+    # Lower tiers are evicted first; ``None`` means never evicted
+    eviction_tier: Optional[int] = None
+
+
+# Order matters: the first matching type claims a file.
+ARTIFACT_TYPES: List[ArtifactType] = [
+    ArtifactType("content", ("extracted/content.json",), regenerable=False),
+    ArtifactType("agents", ("agents/",), regenerable=False),
+    ArtifactType("manifest", (MANIFEST_NAME,), regenerable=False),
+    ArtifactType(
+        "raw_layout_visualizations",
+        ("raw_layouts/visualizations/",),
+        regenerable=True,
+        eviction_tier=0,
+    ),
+    ArtifactType("visualizations", ("visualizations/",), regenerable=True, eviction_tier=0),
+    ArtifactType("pages", ("pages/",), regenerable=True, eviction_tier=1),
+    ArtifactType(
+        "readable_exports",
+        ("extracted/document.md", "extracted/document.txt", "extracted/document.html"),
+        regenerable=True,
+        eviction_tier=2,
+    ),
+    ArtifactType("block_index", ("extracted/block_index.json",), regenerable=True, eviction_tier=2),
+    # Figure crops can be re-rendered from the PDF, but the image analyzer
+    # reads them directly, so they are only evicted on explicit request.
+    ArtifactType("figures", ("extracted/figures/",), regenerable=True),
+    ArtifactType("layouts", ("raw_layouts/", "merged/", "layout/", "reading_order/"), regenerable=False),
+]
+
+_TYPES_BY_NAME = {t.name: t for t in ARTIFACT_TYPES}
+_OTHER = "other"
+
+
+# ---------------------------------------------------------------------------
+# Manifest helpers
+# ---------------------------------------------------------------------------
+
+
+def manifest_path(doc_dir: Path) -> Path:
+    """Path of the manifest file for a document cache directory."""
+    return Path(doc_dir) / MANIFEST_NAME
+
+
+def load_manifest(doc_dir: Path) -> Dict[str, Any]:
+    """Load a document manifest, returning an empty one when missing or corrupt."""
+    path = manifest_path(doc_dir)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+        return {}
+
+
+def save_manifest(doc_dir: Path, manifest: Dict[str, Any]) -> None:
+    """Atomically write a document manifest."""
+    path = manifest_path(doc_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False))
+    os.replace(tmp, path)
+
+
+def touch_document(doc_dir: Path, **fields: Any) -> None:
+    """Record an access to a cached document (and optionally extra fields)."""
+    doc_dir = Path(doc_dir)
+    if not doc_dir.is_dir():
+        return
+    manifest = load_manifest(doc_dir)
+    manifest["last_access"] = time.time()
+    manifest.update(fields)
+    try:
+        save_manifest(doc_dir, manifest)
+    except OSError as e:
+        # Access tracking is best effort and must never break a pipeline run
+        logger.debug(f"Could not update manifest for {doc_dir}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ArtifactStats:
+    """Size of one artefact type within a document."""
+    name: str
+    files: List[Path] = field(default_factory=list)
+    bytes: int = 0
+
+    @property
+    def artifact_type(self) -> Optional[ArtifactType]:
+        return _TYPES_BY_NAME.get(self.name)
+
+
+@dataclass
+class DocumentStats:
+    """Size and access information for one cached document."""
+    name: str
+    path: Path
+    last_access: float
+    artifacts: Dict[str, ArtifactStats] = field(default_factory=dict)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(a.bytes for a in self.artifacts.values())
+
+    @property
+    def regenerable_bytes(self) -> int:
+        return sum(
+            a.bytes for a in self.artifacts.values()
+            if a.artifact_type is not None and a.artifact_type.regenerable
+        )
+
+
+def _classify(rel_path: Path) -> str:
+    """Return the artefact type name for a path relative to the document dir."""
+    rel = rel_path.as_posix()
+    for artifact_type in ARTIFACT_TYPES:
+        for pattern in artifact_type.patterns:
+            if rel == pattern or (pattern.endswith("/") and rel.startswith(pattern)):
+                return artifact_type.name
+    return _OTHER
+
+
+class CacheManager:
+    """Track and bound the disk usage of one or more cache roots."""
+
+    def __init__(self, cache_dirs: List[Path | str], budget_bytes: Optional[int] = None):
+        """
+        Initialize cache manager.
+
+        Args:
+            cache_dirs: Cache roots containing one directory per document
+            budget_bytes: Maximum total size; ``None`` disables eviction
+        """
+        self.cache_dirs = [Path(d) for d in cache_dirs]
+        self.budget_bytes = budget_bytes
+
+    def scan(self) -> List[DocumentStats]:
+        """Collect per-document artefact statistics for all cache roots."""
+        documents = []
+        for root in self.cache_dirs:
+            if not root.exists():
+                continue
+            for doc_dir in sorted(p for p in root.iterdir() if p.is_dir()):
+                documents.append(self._scan_document(doc_dir))
+        return documents
+
+    def _scan_document(self, doc_dir: Path) -> DocumentStats:
+        manifest = load_manifest(doc_dir)
+        artifacts: Dict[str, ArtifactStats] = {}
+        newest_mtime = 0.0
+
+        for path in doc_dir.rglob("*"):
+            if not path.is_file():
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            name = _classify(path.relative_to(doc_dir))
+            stats = artifacts.setdefault(name, ArtifactStats(name))
+            stats.files.append(path)
+            stats.bytes += st.st_size
+            newest_mtime = max(newest_mtime, st.st_mtime)
+
+        # Documents that predate manifests fall back to their newest file
+        last_access = manifest.get("last_access") or newest_mtime
+        return DocumentStats(doc_dir.name, doc_dir, float(last_access), artifacts)
+
+    def total_bytes(self, documents: Optional[List[DocumentStats]] = None) -> int:
+        documents = documents if documents is not None else self.scan()
+        return sum(d.total_bytes for d in documents)
+
+    def gc(
+        self,
+        budget_bytes: Optional[int] = None,
+        include_figures: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Evict regenerable artefacts until the cache fits in its budget.
+
+        Eviction proceeds tier by tier (visualisations, then page rasters,
+        then readable exports, then – if requested – figure crops). Within a
+        tier, documents are visited least recently used first.
+
+        Args:
+            budget_bytes: Override the configured budget
+            include_figures: Also evict figure crops as a last resort
+            dry_run: Report what would be removed without deleting anything
+
+        Returns:
+            Summary with sizes before/after and the evicted artefacts
+        """
+        budget = budget_bytes if budget_bytes is not None else self.budget_bytes
+        documents = self.scan()
+        total = self.total_bytes(documents)
+        summary: Dict[str, Any] = {
+            "budget_bytes": budget,
+            "bytes_before": total,
+            "bytes_after": total,
+            "evicted": [],
+            "dry_run": dry_run,
+        }
+        if budget is None or total <= budget:
+            return summary
+
+        tiers = sorted({t.eviction_tier for t in ARTIFACT_TYPES if t.eviction_tier is not None})
+        plan = [[t.name for t in ARTIFACT_TYPES if t.eviction_tier == tier] for tier in tiers]
+        if include_figures:
+            plan.append(["figures"])
+
+        lru_documents = sorted(documents, key=lambda d: d.last_access)
+        for type_names in plan:
+            for doc in lru_documents:
+                for type_name in type_names:
+                    if total <= budget:
+                        break
+                    stats = doc.artifacts.get(type_name)
+                    if not stats or not stats.bytes:
+                        continue
+                    if not dry_run:
+                        self._evict(doc, stats)
+                    total -= stats.bytes
+                    summary["evicted"].append({
+                        "document": doc.name,
+                        "artifact": type_name,
+                        "files": len(stats.files),
+                        "bytes": stats.bytes,
+                    })
+                    logger.info(
+                        f"Evicted {type_name} for {doc.name} "
+                        f"({len(stats.files)} files, {stats.bytes / 1e6:.1f} MB)"
+                    )
+
+        summary["bytes_after"] = total
+        if total > budget:
+            logger.warning(
+                f"Cache still exceeds budget after eviction: "
+                f"{total / 1e6:.1f} MB > {budget / 1e6:.1f} MB (remaining data is not regenerable)"
+            )
+        return summary
+
+    def _evict(self, doc: DocumentStats, stats: ArtifactStats) -> None:
+        """Delete the files of one artefact type and record it in the manifest."""
+        for path in stats.files:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Failed to delete {path}: {e}")
+
+        # Remove directories left empty by the eviction
+        for parent in sorted({p.parent for p in stats.files}, key=lambda p: len(p.parts), reverse=True):
+            if parent != doc.path:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    pass
+
+        manifest = load_manifest(doc.path)
+        evicted = manifest.setdefault("evicted", {})
+        evicted[stats.name] = {"at": time.time(), "bytes": stats.bytes, "files": len(stats.files)}
+        try:
+            save_manifest(doc.path, manifest)
+        except OSError as e:
+            logger.debug(f"Could not update manifest for {doc.path}: {e}")
+        stats.files = []
+        stats.bytes = 0
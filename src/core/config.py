@@ -42,11 +42,84 @@ class Settings(BaseSettings):
         description="Logging level (DEBUG, INFO, WARNING, ERROR)"
     )
     
+    # LLM Rate Limits (shared by every client in the process)
+    llm_requests_per_minute: int | None = Field(
+        None,
+        description="Provider requests-per-minute limit the fact-check client stays under (unset = unlimited)"
+    )
+    llm_tokens_per_minute: int | None = Field(
+        None,
+        description="Provider tokens-per-minute limit, checked against locally estimated prompt tokens (unset = unlimited)"
+    )
+    
+    # LLM HTTP Connection Pool
+    llm_http_max_connections: int = Field(
+        100,
+        description="Maximum open connections from the fact-check client to the gateway"
+    )
+    llm_http_max_keepalive_connections: int = Field(
+        20,
+        description="Idle connections kept alive for reuse"
+    )
+    llm_http_keepalive_expiry: float = Field(
+        30.0,
+        description="Seconds an idle connection is kept before closing"
+    )
+    llm_http2: bool = Field(
+        False,
+        description="Use HTTP/2 to the gateway (requires the 'h2' package)"
+    )
+    llm_request_timeout: float = Field(
+        600.0,
+        description="Default per-request timeout in seconds (long medical documents can take minutes)"
+    )
+    
     # Cache Configuration
     filesystem_cache_dir: str = Field(
         "data/scientific_cache",
         description="Base directory for filesystem cache"
     )
+    cache_budget_mb: float | None = Field(
+        None,
+        description="Disk budget for document caches; regenerable artifacts are evicted beyond it"
+    )
+    
+    document_cache_mb: float = Field(
+        256,
+        description="Memory budget for parsed documents shared by fact-checking agents in one process"
+    )
+    
+    # Evidence Context Retrieval
+    evidence_context_mode: str = Field(
+        "retrieval",
+        description="Document context sent to extraction agents: 'retrieval' (relevant blocks) or 'full'"
+    )
+    retrieval_top_k: int = Field(
+        12,
+        description="Number of best-matching blocks retrieved per claim"
+    )
+    retrieval_neighbors: int = Field(
+        1,
+        description="Reading-order neighbours added around each retrieved block"
+    )
+    retrieval_min_document_chars: int = Field(
+        12000,
+        description="Documents shorter than this are always sent in full"
+    )
+    
+    # Evidence Verification
+    quote_match_threshold: float = Field(
+        0.5,
+        description="Minimum local match score for a quote to count as present; lower-scoring quotes are rejected without an LLM call"
+    )
+    verification_batch_size: int = Field(
+        8,
+        description="Quotes judged per verifier call (1 = one call per quote)"
+    )
+    max_concurrent_verifications: int = Field(
+        3,
+        description="Verifier batches run concurrently per claim-document pair; each also takes a slot of the study-wide max_concurrent_agents budget"
+    )
     
     
     @computed_field
@@ -0,0 +1,167 @@
+"""Deterministic fuzzy location of quotes in extracted document blocks.
+
+Extraction agents return quotes with OCR artifacts corrected (split words
+joined, spacing restored, ``0``/``O`` and ``l``/``I`` confusions fixed), so
+quotes rarely match the stored block text character for character. The
+locator normalizes both sides so those corrections do not matter, indexes the
+document as one stream of character n-grams in reading order and anchors a
+quote by voting for the alignment offset its n-grams agree on. A quote may
+span several blocks and pages.
+
+Like the block index, the locator works on plain ``content.json``
+dictionaries so that ingestion and fact-checking code can both use it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Characters OCR commonly confuses are folded onto one representative
+_CONFUSABLES = str.maketrans({"0": "o", "1": "l", "i": "l", "|": "l"})
+
+# n-grams occurring more often than this carry no locating information
+_MAX_POSTINGS = 256
+
+
+def normalize(text: str) -> str:
+    """Fold text to lowercase alphanumerics with OCR confusions merged.
+
+    Whitespace and punctuation are dropped entirely, which makes split words
+    ("immunogen i city") and missing spaces ("fromFlublok") irrelevant.
+    """
+    text = unicodedata.normalize("NFKC", text).lower().translate(_CONFUSABLES)
+    return "".join(ch for ch in text if ch.isalnum())
+
+
+@dataclass
+class QuoteMatch:
+    """Where a quote was found in a document."""
+
+    score: float  # Share of the quote's n-grams found at the anchored position
+    blocks: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def block_ids(self) -> List[str]:
+        return [block["block_id"] for block in self.blocks]
+
+    @property
+    def pages(self) -> List[int]:
+        return sorted({block["page"] for block in self.blocks})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "score": round(self.score, 4),
+            "block_ids": self.block_ids,
+            "pages": self.pages,
+            "blocks": self.blocks,
+        }
+
+
+class QuoteLocator:
+    """Character n-gram index over a document's blocks in reading order."""
+
+    def __init__(self, content_json: Dict[str, Any], n: int = 5):
+        """
+        Args:
+            content_json: The document's ``content.json`` data
+            n: n-gram length over normalized text
+        """
+        self.n = n
+        blocks_by_id = {block["id"]: block for block in content_json.get("blocks", [])}
+
+        parts = []
+        self._starts: List[int] = []  # Offset of each block in the stream
+        self._blocks: List[Dict[str, Any]] = []
+        offset = 0
+        for page_idx, page_blocks in enumerate(content_json.get("reading_order", [])):
+            for block_id in page_blocks:
+                block = blocks_by_id.get(block_id)
+                if not block or not block.get("text"):
+                    continue
+                text = normalize(block["text"])
+                if not text:
+                    continue
+                self._starts.append(offset)
+                self._blocks.append({
+                    "block_id": block_id,
+                    "page": page_idx + 1,
+                    "bbox": block.get("bbox"),
+                })
+                parts.append(text)
+                offset += len(text)
+        self._stream = "".join(parts)
+
+        self._postings: Dict[str, List[int]] = {}
+        for pos in range(len(self._stream) - n + 1):
+            self._postings.setdefault(self._stream[pos:pos + n], []).append(pos)
+
+    def locate(self, quote: str) -> Optional[QuoteMatch]:
+        """Find the best-matching position of a quote.
+
+        Args:
+            quote: Quote text as returned by an extraction agent
+
+        Returns:
+            The match with its score and the blocks it spans, or None if the
+            quote shares no n-gram with the document
+        """
+        text = normalize(quote)
+        n = self.n
+        if len(text) < n:
+            # Too short to index; fall back to an exact substring search
+            pos = self._stream.find(text) if text else -1
+            return self._match(1.0, pos, pos + len(text)) if pos >= 0 else None
+
+        grams = [text[j:j + n] for j in range(len(text) - n + 1)]
+
+        # Vote for alignment offsets (document position minus quote position).
+        # Offsets are bucketed so small insertions and deletions still agree.
+        bucket = max(8, len(text) // 20)
+        votes: Counter = Counter()
+        for j, gram in enumerate(grams):
+            positions = self._postings.get(gram)
+            if not positions or len(positions) > _MAX_POSTINGS:
+                continue
+            for pos in positions:
+                votes[(pos - j) // bucket] += 1
+        if not votes:
+            return None
+
+        # Score the strongest candidates by the n-grams found near the anchor
+        best: Optional[Tuple[float, int, int]] = None
+        for offset_bucket, _ in votes.most_common(3):
+            anchor = offset_bucket * bucket
+            matched, first, last = self._coverage(grams, anchor, tolerance=2 * bucket)
+            score = matched / len(grams)
+            if best is None or score > best[0]:
+                best = (score, first, last + n)
+        score, start, end = best
+        return self._match(score, start, end)
+
+    def _coverage(self, grams: List[str], anchor: int, tolerance: int) -> Tuple[int, int, int]:
+        """Count quote n-grams occurring within ``tolerance`` of ``anchor + j``."""
+        matched = 0
+        first, last = len(self._stream), -1
+        for j, gram in enumerate(grams):
+            positions = self._postings.get(gram)
+            if not positions:
+                continue
+            expected = anchor + j
+            i = bisect.bisect_left(positions, expected - tolerance)
+            if i < len(positions) and positions[i] <= expected + tolerance:
+                matched += 1
+                first = min(first, positions[i])
+                last = max(last, positions[i])
+        if last < 0:
+            first = last = max(anchor, 0)
+        return matched, first, last
+
+    def _match(self, score: float, start: int, end: int) -> QuoteMatch:
+        """Build a match covering stream offsets ``[start, end)``."""
+        first = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        last = max(bisect.bisect_left(self._starts, end) - 1, first)
+        return QuoteMatch(score=score, blocks=[dict(b) for b in self._blocks[first:last + 1]])
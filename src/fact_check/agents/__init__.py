@@ -6,6 +6,8 @@ from .evidence_verifier_v2 import EvidenceVerifierV2
 from .completeness_checker import CompletenessChecker
 from .evidence_presenter import EvidencePresenter
 from .image_evidence_analyzer import ImageEvidenceAnalyzer
+from .claim_screener import ClaimScreener
+from .multi_claim_extractor import MultiClaimExtractor
 
 __all__ = [
     "BaseAgent", 
@@ -14,5 +16,7 @@ __all__ = [
     "EvidenceVerifierV2",
     "CompletenessChecker",
     "EvidencePresenter",
-    "ImageEvidenceAnalyzer"
+    "ImageEvidenceAnalyzer",
+    "ClaimScreener",
+    "MultiClaimExtractor"
 ]
\ No newline at end of file
@@ -18,6 +18,10 @@ class AgentError(Exception):
 class BaseAgent(ABC):
     """Base class for all fact-checking agents"""
     
+    # Version of the agent's prompt and output format. Bump it when either
+    # changes so memoized results (see utils.agent_memo) are recomputed.
+    prompt_version = "1"
+    
     def __init__(
         self, 
         pdf_name: str, 
@@ -78,6 +82,13 @@ class BaseAgent(ABC):
         """
         pass
     
+    @property
+    def token_usage(self) -> Optional[Dict[str, int]]:
+        """Token usage of the agent's LLM client, or None if it has none."""
+        llm_client = getattr(self, "llm_client", None)
+        usage = getattr(llm_client, "usage", None)
+        return dict(usage) if usage is not None else None
+    
     def validate_inputs(self) -> bool:
         """
         Check if all required inputs exist.
@@ -123,6 +134,7 @@ class BaseAgent(ABC):
             # Update metadata
             self.metadata["completed_at"] = datetime.now().isoformat()
             self.metadata["status"] = "completed"
+            self.metadata["token_usage"] = self.token_usage
             self._save_metadata()
             
             # Save outputs
@@ -136,11 +148,27 @@ class BaseAgent(ABC):
             self.metadata["completed_at"] = datetime.now().isoformat()
             self.metadata["status"] = "failed"
             self.metadata["error"] = str(e)
+            self.metadata["token_usage"] = self.token_usage
             self._save_metadata()
             
             logger.error(f"{self.agent_name} failed: {e}")
             raise AgentError(f"{self.agent_name} processing failed: {e}") from e
     
+    def restore(self, result: Dict[str, Any]) -> None:
+        """
+        Record a memoized result as this agent's output without running it.
+        
+        Args:
+            result: Output of an earlier identical run
+        """
+        now = datetime.now().isoformat()
+        self.metadata["started_at"] = now
+        self.metadata["completed_at"] = now
+        self.metadata["status"] = "completed"
+        self.metadata["memoized"] = True
+        self._save_metadata()
+        self.save_outputs(result)
+    
     def save_outputs(self, data: Dict[str, Any]) -> None:
         """
         Save agent outputs to files.
@@ -0,0 +1,105 @@
+"""Agent for cheaply screening whether a document is worth checking for a claim."""
+
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .base import BaseAgent, AgentError
+from ..core.responses_client import ResponsesClient
+from ..models.llm_outputs import ScreenerOutput
+from ..utils.document_cache import get_document
+from ..utils.llm_parser import LLMResponseParser
+from ..config.agent_models import get_model_for_agent
+
+logger = logging.getLogger(__name__)
+
+
+class ClaimScreener(BaseAgent):
+    """
+    Decide from a few retrieved passages whether a document may hold evidence.
+
+    Used by the study orchestrator for claim-document pairs whose routing
+    score falls below the threshold. The prompt only contains the best
+    matching blocks, so the call is far cheaper than the full pipeline.
+    """
+
+    @property
+    def agent_name(self) -> str:
+        return "claim_screener"
+
+    @property
+    def required_inputs(self) -> List[str]:
+        return ["extracted/content.json"]
+
+    def __init__(
+        self,
+        pdf_name: str,
+        claim_id: str,
+        cache_dir: Path = Path("data/scientific_cache"),
+        config: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize claim screener agent."""
+        super().__init__(pdf_name, cache_dir, config)
+        self.claim_id = claim_id
+
+        # Override agent directory to be claim-specific
+        self.agent_dir = self.pdf_dir / "agents" / "claims" / claim_id / self.agent_name
+        self.agent_dir.mkdir(parents=True, exist_ok=True)
+
+        # Set up LLM client
+        self.llm_client = ResponsesClient()
+        # Use centrally configured model for this agent
+        self.llm_client.model = get_model_for_agent(self.agent_name)
+
+    async def process(self) -> Dict[str, Any]:
+        """
+        Screen the document for the claim.
+
+        Returns:
+            Dictionary with the relevance decision
+        """
+        claim = self.config.get("claim")
+        if not claim:
+            raise AgentError("No claim provided in config")
+
+        document = get_document(self.pdf_dir / "extracted" / "content.json")
+
+        index = document.block_index
+        hits = index.search(claim, top_k=self.config.get("screening_top_k", 5))
+
+        output = {
+            "claim_id": self.claim_id,
+            "claim": claim,
+            "document": self.pdf_name,
+            "passages_checked": [block_id for block_id, _ in hits],
+            "model_used": self.llm_client.model
+        }
+
+        if not hits:
+            output.update({"relevant": False, "explanation": "No passage shares terms with the claim"})
+            return output
+
+        excerpts = index.render(index.expand_neighbors([block_id for block_id, _ in hits], neighbors=1))
+        prompt = f'''Decide whether this document could contain evidence about the claim.
+
+You are given the passages of the document that best match the claim. Answer
+"relevant": true if they discuss the claim's subject closely enough that the
+full document may support or address it. Answer false only if the document is
+clearly about something else.
+
+CLAIM: {claim}
+
+DOCUMENT EXCERPTS:
+{excerpts}'''
+
+        result = await LLMResponseParser.parse_with_retry(
+            llm_client=self.llm_client,
+            prompt=prompt,
+            output_model=ScreenerOutput,
+            max_retries=1,
+            temperature=0.0
+        )
+
+        output.update({"relevant": result.relevant, "explanation": result.explanation})
+        logger.info(f"Screened {self.pdf_name} for {self.claim_id}: relevant={result.relevant}")
+        return output
@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from .base import BaseAgent, AgentError
+from ..utils import document_utils
+from ..utils.document_cache import get_document
 from ..core.responses_client import ResponsesClient
 from ..models.llm_outputs import ExtractorOutput
 from ..utils.llm_parser import LLMResponseParser
@@ -75,20 +77,20 @@ class CompletenessChecker(BaseAgent):
         logger.info(f"Loading extracted evidence from: {extractor_path}")
         extractor_data = self.load_json(extractor_path)
 
-        # Load document
-        content_path = self.pdf_dir / "extracted" / "content.json"
-        document_data = self.load_json(content_path)
-        
-        # Import document utilities
-        from ..utils import document_utils
-        
-        # Get normalized text using utility
-        normalized_text = document_utils.get_text(document_data, include_figures=True)
+        # Load document from the shared document cache
+        document = get_document(self.pdf_dir / "extracted" / "content.json")
         
         claim = self.config.get("claim")
         if not claim:
             raise AgentError("No claim provided in config")
         
+        # Get the relevant document context (or full text) for the claim
+        context = document_utils.get_claim_context(
+            document,
+            claim,
+            mode=self.config.get("context_mode")
+        )
+        
         logger.info(f"\nClaim being analyzed: '{claim}'")
         
         # Get existing evidence
@@ -105,7 +107,7 @@ class CompletenessChecker(BaseAgent):
         logger.info(f"\nSearching for additional evidence beyond the {len(existing_quotes)} existing quotes...")
         additional_snippets = await self._check_for_additional_evidence(
             claim=claim,
-            document_text=normalized_text,
+            context=context,
             existing_quotes=existing_quotes
         )
         
@@ -122,6 +124,11 @@ class CompletenessChecker(BaseAgent):
             "claim_id": self.claim_id,
             "claim": claim,
             "document": self.pdf_name,
+            "context": {
+                "mode": context["mode"],
+                "characters": len(context["text"]),
+                "block_ids": context["block_ids"]
+            },
             "additional_evidence_check": {
                 "checked_for_more": True,
                 "found_additional": len(additional_snippets) > 0,
@@ -164,12 +171,17 @@ class CompletenessChecker(BaseAgent):
     async def _check_for_additional_evidence(
         self, 
         claim: str, 
-        document_text: str,
+        context: Dict[str, Any],
         existing_quotes: List[str]
     ) -> List[Dict[str, Any]]:
         """
         Check if there's any additional supporting evidence we missed.
         
+        Args:
+            claim: Claim text
+            context: Document context from document_utils.get_claim_context
+            existing_quotes: Quotes already extracted for the claim
+        
         Returns:
             List of new evidence snippets
         """
@@ -181,7 +193,8 @@ class CompletenessChecker(BaseAgent):
         
         try:
             # Build the full prompt for finding additional evidence
-            full_prompt = f'''Extract quotes from the document that support this claim.
+            # The document leads the prompt so its prefix is cached across claims
+            task = f'''Extract quotes from the document that support this claim.
 
 Rules:
 - Base your extraction solely on what is explicitly stated in the document - do not infer or assume information not present
@@ -225,10 +238,10 @@ Return your response as a JSON object:
             "relevance_explanation": "1-2 sentences explaining how this supports the claim"
         }}
     ]
-}}
-
-DOCUMENT:
-{document_text}'''
+}}'''
+            full_prompt = document_utils.document_first_prompt(
+                context["text"], task, heading=document_utils.context_heading(context)
+            )
 
             # Call LLM directly using parser
             logger.info("Making LLM call with parse_with_retry...")
@@ -5,14 +5,39 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from ..utils import document_utils
+from ..utils.document_cache import CachedDocument, get_document
 from ..core.responses_client import ResponsesClient
-from ..models.llm_outputs import ExtractorOutput
+from ..models.llm_outputs import ExtractorOutput, ExtractorSnippet
 from ..utils.llm_parser import LLMResponseParser
 from .base import BaseAgent, AgentError
 from ..config.agent_models import get_model_for_agent
 
 logger = logging.getLogger(__name__)
 
+# Extraction rules shared by single-claim and multi-claim extraction prompts
+EXTRACTION_RULES = """Rules:
+- Base your extraction solely on what is explicitly stated in the document - do not infer or assume information not present
+- Preserve the exact meaning and all factual content from the document
+- Correct obvious OCR artifacts that break readability:
+  * Fix split words and broken spacing (e.g., "immunogen i city" → "immunogenicity")
+  * Repair character substitutions from poor OCR (e.g., "0" instead of "O")
+  * Restore proper word boundaries and punctuation
+- Do NOT change any substantive content, numbers, or technical terms
+- Do NOT fix grammatical issues or writing style from the original
+- Extract complete segments without using ellipsis (...)
+- A quote supports the claim if it provides evidence, data, or statements that directly relate to and affirm the claim
+
+Quality standards:
+- Context: Include enough surrounding text so the quote can be understood independently
+- Attribution: When statements reference sources or studies, include those references in the quote
+- Precision: Preserve all numbers, statistics, and measurements exactly as intended (including decimal places, confidence intervals, and units)
+
+Correction standard:
+"Restore what the original document clearly intended to say, fixing only mechanical extraction errors"
+
+Relevance standard:
+"Would this quote help convince a skeptical reader that the claim is true?\""""
+
 
 class EvidenceExtractor(BaseAgent):
     """Extract relevant text snippets for claims from documents"""
@@ -68,38 +93,25 @@ class EvidenceExtractor(BaseAgent):
         
         logger.info(f"Extracting evidence for {self.claim_id}: {claim[:50]}...")
         
-        # Load document JSON directly
-        content_path = self.pdf_dir / "extracted" / "content.json"
-        document_data = self.load_json(content_path)
+        # Load document from the shared document cache
+        document = get_document(self.pdf_dir / "extracted" / "content.json")
         
-        # Get normalized text using utility
-        normalized_text = document_utils.get_text(document_data, include_figures=True)
+        # Get the relevant document context (or full text) for the claim
+        context = document_utils.get_claim_context(
+            document,
+            claim,
+            mode=self.config.get("context_mode")
+        )
+        logger.info(
+            f"Using {context['mode']} context: {len(context['text'])} of "
+            f"{context['full_text_characters']} characters"
+        )
         
         # Build extraction prompt
-        prompt = f'''Extract quotes from the document that support this claim.
+        # The document leads the prompt so its prefix is cached across claims
+        task = f'''Extract quotes from the document that support this claim.
 
-Rules:
-- Base your extraction solely on what is explicitly stated in the document - do not infer or assume information not present
-- Preserve the exact meaning and all factual content from the document
-- Correct obvious OCR artifacts that break readability:
-  * Fix split words and broken spacing (e.g., "immunogen i city" → "immunogenicity")
-  * Repair character substitutions from poor OCR (e.g., "0" instead of "O")
-  * Restore proper word boundaries and punctuation
-- Do NOT change any substantive content, numbers, or technical terms
-- Do NOT fix grammatical issues or writing style from the original
-- Extract complete segments without using ellipsis (...)
-- A quote supports the claim if it provides evidence, data, or statements that directly relate to and affirm the claim
-
-Quality standards:
-- Context: Include enough surrounding text so the quote can be understood independently
-- Attribution: When statements reference sources or studies, include those references in the quote
-- Precision: Preserve all numbers, statistics, and measurements exactly as intended (including decimal places, confidence intervals, and units)
-
-Correction standard:
-"Restore what the original document clearly intended to say, fixing only mechanical extraction errors"
-
-Relevance standard:
-"Would this quote help convince a skeptical reader that the claim is true?"
+{EXTRACTION_RULES}
 
 CLAIM: {claim}
 
@@ -111,10 +123,10 @@ Return your response as a JSON object:
             "relevance_explanation": "1-2 sentences explaining how this supports the claim"
         }}
     ]
-}}
-
-DOCUMENT:
-{normalized_text}'''
+}}'''
+        prompt = document_utils.document_first_prompt(
+            context["text"], task, heading=document_utils.context_heading(context)
+        )
 
         try:
             # Parse with retry
@@ -127,63 +139,96 @@ DOCUMENT:
                 # Removed max_output_tokens - let model use what it needs
             )
             
-            # Structure output
-            output = {
-                "claim_id": self.claim_id,
-                "claim": claim,
-                "document": {
-                    "pdf_name": self.pdf_name,
-                    "source_pdf": document_data.get("source_pdf", ""),
-                    "total_pages": len(document_data.get("reading_order", [])),
-                    "total_blocks": len(document_data.get("blocks", [])),
-                    "total_characters": len(normalized_text)
-                },
-                "extraction_result": {
-                    "success": True,
-                    "total_snippets_found": len(extracted.snippets),
-                    "error": None
-                },
-                "extracted_evidence": []
-            }
-            
-            # Add snippets without position tracking
-            for i, snippet in enumerate(extracted.snippets):
-                snippet_data = {
-                    "id": i + 1,
-                    "quote": snippet.quote,
-                    "relevance_explanation": snippet.relevance_explanation
-                }
-                output["extracted_evidence"].append(snippet_data)
-            
-            output["model_used"] = self.llm_client.model
+            output = build_extractor_output(
+                claim_id=self.claim_id,
+                claim=claim,
+                pdf_name=self.pdf_name,
+                document=document,
+                context=context,
+                snippets=extracted.snippets,
+                model=self.llm_client.model
+            )
             
             return output
             
         except Exception as e:
             logger.error(f"Failed to extract evidence: {e}")
             # Return error structure
-            error_output = {
-                "claim_id": self.claim_id,
-                "claim": claim,
-                "document": {
-                    "pdf_name": self.pdf_name,
-                    "source_pdf": document_data.get("source_pdf", ""),
-                    "total_pages": len(document_data.get("reading_order", [])),
-                    "total_blocks": len(document_data.get("blocks", [])),
-                    "total_characters": len(normalized_text)
-                },
-                "extraction_result": {
-                    "success": False,
-                    "total_snippets_found": 0,
-                    "error": str(e)
-                },
-                "extracted_evidence": [],
-                "model_used": self.llm_client.model
-            }
+            error_output = build_extractor_output(
+                claim_id=self.claim_id,
+                claim=claim,
+                pdf_name=self.pdf_name,
+                document=document,
+                context=context,
+                snippets=[],
+                model=self.llm_client.model,
+                error=str(e)
+            )
             
             logger.info(f"\n{'='*60}")
             logger.info(f"EVIDENCE EXTRACTOR: Failed for claim {self.claim_id}")
             logger.info(f"{'='*60}\n")
             
             return error_output
+
+
+def build_extractor_output(
+    claim_id: str,
+    claim: str,
+    pdf_name: str,
+    document: CachedDocument,
+    context: Dict[str, Any],
+    snippets: List[ExtractorSnippet],
+    model: str,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the ``evidence_extractor/output.json`` structure for one claim.
     
+    Shared by the single-claim extractor and the multi-claim batch extractor
+    so downstream agents see the same format either way.
+    
+    Args:
+        claim_id: Claim identifier
+        claim: Claim text
+        pdf_name: Document name
+        document: Document from the shared document cache
+        context: Context returned by document_utils.get_claim_context
+        snippets: Extracted snippets
+        model: Model that produced the snippets
+        error: Error message if extraction failed
+        
+    Returns:
+        Extractor output dictionary
+    """
+    return {
+        "claim_id": claim_id,
+        "claim": claim,
+        "document": {
+            "pdf_name": pdf_name,
+            "source_pdf": document.content.get("source_pdf", ""),
+            "total_pages": len(document.content.get("reading_order", [])),
+            "total_blocks": len(document.content.get("blocks", [])),
+            "total_characters": context["full_text_characters"]
+        },
+        "context": {
+            "mode": context["mode"],
+            "characters": len(context["text"]),
+            "block_ids": context["block_ids"]
+        },
+        "extraction_result": {
+            "success": error is None,
+            "total_snippets_found": len(snippets),
+            "error": error
+        },
+        # Snippets are added without position tracking
+        "extracted_evidence": [
+            {
+                "id": i + 1,
+                "quote": snippet.quote,
+                "relevance_explanation": snippet.relevance_explanation
+            }
+            for i, snippet in enumerate(snippets)
+        ],
+        "model_used": model
+    }
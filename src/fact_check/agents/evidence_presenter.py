@@ -134,7 +134,8 @@ class EvidencePresenter(BaseAgent):
             "supporting_evidence": [
                 {
                     "quote": evidence["quote"],
-                    "explanation": evidence["explanation"]
+                    "explanation": evidence["explanation"],
+                    "location": evidence.get("location")
                 }
                 for evidence in verified_evidence
             ],
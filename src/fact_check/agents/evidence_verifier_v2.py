@@ -1,18 +1,47 @@
 """Agent for verifying evidence existence AND applicability to claims."""
 
+import asyncio
+import contextlib
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
+from src.core.config import settings
 from ..core.responses_client import ResponsesClient
 from ..utils import document_utils
-from ..models.llm_outputs import VerifierOutput
+from ..utils.document_cache import get_document
+from ..models.llm_outputs import VerifierOutput, BatchVerifierOutput
 from ..utils.llm_parser import LLMResponseParser
 from .base import BaseAgent, AgentError
 from ..config.agent_models import get_model_for_agent
 
+if TYPE_CHECKING:
+    from ..utils.concurrency import ConcurrencyBudget
+
 logger = logging.getLogger(__name__)
 
+# Quote matching and support standards shared by single and batched prompts
+_VERIFICATION_GUIDANCE = """IMPORTANT context about quote matching:
+- The quote may have been cleaned of OCR artifacts by the extractor
+- Look for the same factual content, not character-perfect matches
+- The extractor corrects mechanical errors like:
+  * Split words ("immunogen i city" → "immunogenicity") 
+  * Broken spacing ("fromFlublok" → "from Flublok")
+  * OCR character errors ("0" vs "O", "l" vs "I")
+- Focus on semantic equivalence - does it convey the same information?
+- The quote should contain all the same facts, numbers, and technical content
+- Consider it found if the meaning and data are preserved
+
+For supporting the claim, accept quotes that:
+- Directly state what the claim asserts, OR
+- Provide specific facts/numbers that substantiate the claim
+
+Reject quotes that:
+- Only tangentially relate to the topic
+- Require significant inference or assumptions
+- Are about something else but happen to mention similar words
+- Actually contradict the claim"""
+
 
 class EvidenceVerifierV2(BaseAgent):
     """
@@ -20,8 +49,16 @@ class EvidenceVerifierV2(BaseAgent):
     
     This agent combines quote verification with relevance checking, using the standard:
     "Would this evidence convince a skeptical reader?"
+    
+    Each quote is first anchored in the document's blocks locally. Quotes that
+    cannot be located are rejected without an LLM call, and verified quotes
+    carry the blocks, pages and bounding boxes they were found in.
     """
     
+    # Study-wide concurrency budget. When set, each verification call holds
+    # one of its slots, so the caller must not hold a slot for the whole run.
+    budget: Optional["ConcurrencyBudget"] = None
+    
     @property
     def agent_name(self) -> str:
         return "evidence_verifier_v2"
@@ -75,12 +112,15 @@ class EvidenceVerifierV2(BaseAgent):
 
         extractor_data = self.load_json(extractor_path)
         
-        # Load document
-        content_path = self.pdf_dir / "extracted" / "content.json"
-        document_data = self.load_json(content_path)
+        # Load document from the shared document cache
+        document = get_document(self.pdf_dir / "extracted" / "content.json")
         
         # Get full text
-        full_text = document_utils.get_text(document_data, include_figures=True)
+        full_text = document.text
+        
+        # Local quote locator for the existence check
+        locator = document.quote_locator
+        match_threshold = self.config.get("quote_match_threshold", settings.quote_match_threshold)
         
         claim = self.config.get("claim")
         if not claim:
@@ -91,26 +131,53 @@ class EvidenceVerifierV2(BaseAgent):
         # Process each extracted quote
         verified_evidence = []
         rejected_evidence = []
+        rejected_unlocated = 0
         
         extracted_quotes = extractor_data.get("combined_evidence", [])
         logger.info(f"\nFound {len(extracted_quotes)} quotes to verify")
         logger.info(f"Using model: {self.llm_client.model}")
         
-        for i, quote_data in enumerate(extracted_quotes, 1):
+        # Locate every quote first; only located quotes go to the LLM
+        locations = []
+        pending = []
+        for i, quote_data in enumerate(extracted_quotes):
+            match = locator.locate(quote_data.get("quote", ""))
+            locations.append(match.to_dict() if match else None)
+            if match is not None and match.score >= match_threshold:
+                pending.append(i)
+        
+        verifications = await self._verify_all(
+            claim=claim,
+            quotes=[extracted_quotes[i] for i in pending],
+            full_document=full_text
+        )
+        verification_by_index = dict(zip(pending, verifications))
+        
+        for i, quote_data in enumerate(extracted_quotes):
             quote = quote_data.get("quote", "")
             relevance_explanation = quote_data.get("relevance_explanation", "")
+            location = locations[i]
             
-            logger.info(f"\nVerifying quote {i}/{len(extracted_quotes)}:")
+            logger.info(f"\nVerifying quote {i + 1}/{len(extracted_quotes)}:")
             logger.info(f"  Quote: '{quote[:100]}...'")
             logger.info(f"  Original relevance: {relevance_explanation[:100]}...")
             
-            # Verify both existence and applicability
-            verification = await self._verify_evidence(
-                claim=claim,
-                quote=quote,
-                full_document=full_text,
-                relevance_explanation=relevance_explanation
-            )
+            # Quotes that could not be located were rejected without the LLM
+            if i not in verification_by_index:
+                score = location["score"] if location else 0.0
+                logger.info(f"  ✗ REJECTED: not found (match score {score:.2f})")
+                rejected_evidence.append({
+                    "id": quote_data.get("id"),
+                    "quote": quote,
+                    "reason": "not found",
+                    "original_explanation": relevance_explanation,
+                    "presence_explanation": f"No passage in the document matches the quote (best match score {score:.2f})",
+                    "location": location
+                })
+                rejected_unlocated += 1
+                continue
+            
+            verification = verification_by_index[i]
             
             if verification["keep"]:
                 logger.info(f"  ✓ VERIFIED: Quote supports claim")
@@ -122,7 +189,8 @@ class EvidenceVerifierV2(BaseAgent):
                     "explanation": verification["explanation"],
                     "presence_explanation": verification.get("presence_explanation", ""),
                     "support_explanation": verification.get("support_explanation", ""),
-                    "original_relevance": relevance_explanation
+                    "original_relevance": relevance_explanation,
+                    "location": location
                 })
             else:
                 logger.info(f"  ✗ REJECTED: {verification['reason']}")
@@ -130,7 +198,8 @@ class EvidenceVerifierV2(BaseAgent):
                     "id": quote_data.get("id"),
                     "quote": quote,
                     "reason": verification["reason"],
-                    "original_explanation": relevance_explanation
+                    "original_explanation": relevance_explanation,
+                    "location": location
                 })
         
         output = {
@@ -141,6 +210,8 @@ class EvidenceVerifierV2(BaseAgent):
                 "total_extracted": len(extracted_quotes),
                 "verified": len(verified_evidence),
                 "rejected": len(rejected_evidence),
+                "rejected_without_llm": rejected_unlocated,
+                "batch_size": self.config.get("verification_batch_size", settings.verification_batch_size),
                 "verification_rate": len(verified_evidence) / len(extracted_quotes) if extracted_quotes else 0
             },
             "verified_evidence": verified_evidence,
@@ -182,7 +253,8 @@ class EvidenceVerifierV2(BaseAgent):
         
         Uses the standard: "Would this convince a skeptical reader?"
         """
-        prompt = f"""You are verifying if a quote exists in the document AND genuinely supports a claim.
+        # The document leads the prompt so its prefix is cached across quotes and claims
+        task = f"""You are verifying if a quote exists in the document AND genuinely supports a claim.
 
 CLAIM: {claim}
 
@@ -191,31 +263,12 @@ QUOTE TO VERIFY: "{quote}"
 ORIGINAL RELEVANCE EXPLANATION: {relevance_explanation}
 
 Your task:
-1. Find this quote in the document below
+1. Find this quote in the document above
 2. Determine if it genuinely supports the claim
 
 CRITICAL: Base your verification solely on what is explicitly stated in the document. Do not infer or assume information not present in the text.
 
-IMPORTANT context about quote matching:
-- The quote may have been cleaned of OCR artifacts by the extractor
-- Look for the same factual content, not character-perfect matches
-- The extractor corrects mechanical errors like:
-  * Split words ("immunogen i city" → "immunogenicity") 
-  * Broken spacing ("fromFlublok" → "from Flublok")
-  * OCR character errors ("0" vs "O", "l" vs "I")
-- Focus on semantic equivalence - does it convey the same information?
-- The quote should contain all the same facts, numbers, and technical content
-- Consider it found if the meaning and data are preserved
-
-For supporting the claim, accept quotes that:
-- Directly state what the claim asserts, OR
-- Provide specific facts/numbers that substantiate the claim
-
-Reject quotes that:
-- Only tangentially relate to the topic
-- Require significant inference or assumptions
-- Are about something else but happen to mention similar words
-- Actually contradict the claim
+{_VERIFICATION_GUIDANCE}
 
 Return your response as a JSON object:
 {{
@@ -225,10 +278,8 @@ Return your response as a JSON object:
     "support_explanation": "explanation of why it does/doesn't support the claim (if quote not found, state this clearly)"
 }}
 
-IMPORTANT: If quote_found is false, your support_explanation MUST mention that the quote was not found in the document.
-
-FULL DOCUMENT:
-{full_document}"""
+IMPORTANT: If quote_found is false, your support_explanation MUST mention that the quote was not found in the document."""
+        prompt = document_utils.document_first_prompt(full_document, task, heading="FULL DOCUMENT")
 
         logger.debug(f"\nCalling LLM to verify quote...")
         
@@ -243,33 +294,168 @@ FULL DOCUMENT:
                 # Removed max_output_tokens - let model use what it needs
             )
             
-            # Convert to expected format
-            keep = result.quote_found and result.supports_claim
-            
-            if not result.quote_found:
-                reason = "not found"
-            elif not result.supports_claim:
-                reason = "does not support claim"
-            else:
-                reason = ""
-            
-            return {
-                "keep": keep,
-                "presence_explanation": result.found_explanation,
-                "support_explanation": result.support_explanation,
-                "explanation": result.support_explanation,
-                "reason": reason
-            }
+            return self._to_verification(result)
             
         except ValueError as e:
             logger.error(f"Failed to verify quote after retries: {e}")
             logger.error(f"Exception type: {type(e).__name__}")
             # Default to rejecting on error
-            return {
-                "keep": False,
-                "reason": "Verification failed",
-                "explanation": str(e),
-                "presence_explanation": "",
-                "support_explanation": ""
-            }
+            return self._failed_verification(e)
+    
+    async def _verify_all(
+        self,
+        claim: str,
+        quotes: List[Dict[str, Any]],
+        full_document: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify quotes in batches that run concurrently.
+        
+        Each batch is judged in one call against a single copy of the
+        document. A batch size of 1 falls back to one call per quote. At most
+        ``max_concurrent_verifications`` batches run at once for this pair,
+        and each holds a slot of the shared budget when one is set.
+        
+        Returns:
+            Verification results aligned with ``quotes``
+        """
+        if not quotes:
+            return []
+        
+        batch_size = max(1, self.config.get("verification_batch_size", settings.verification_batch_size))
+        max_concurrent = max(1, self.config.get("max_concurrent_verifications", settings.max_concurrent_verifications))
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        def budget_slot():
+            return self.budget.slot() if self.budget is not None else contextlib.nullcontext()
+        
+        async def verify_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore, budget_slot():
+                if len(batch) == 1:
+                    return [await self._verify_evidence(
+                        claim=claim,
+                        quote=batch[0].get("quote", ""),
+                        full_document=full_document,
+                        relevance_explanation=batch[0].get("relevance_explanation", "")
+                    )]
+                return await self._verify_batch(claim, batch, full_document)
+        
+        batches = [quotes[i:i + batch_size] for i in range(0, len(quotes), batch_size)]
+        logger.info(
+            f"\nVerifying {len(quotes)} located quotes in {len(batches)} batch(es) "
+            f"of up to {batch_size}, {max_concurrent} concurrent"
+        )
+        results = await asyncio.gather(*(verify_batch(batch) for batch in batches))
+        return [verification for batch_results in results for verification in batch_results]
     
+    async def _verify_batch(
+        self,
+        claim: str,
+        batch: List[Dict[str, Any]],
+        full_document: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify several quotes in a single call.
+        
+        Quotes the model leaves out of its answer are verified individually.
+        
+        Returns:
+            Verification results aligned with ``batch``
+        """
+        quotes_text = "\n\n".join(
+            f"QUOTE {n}: \"{q.get('quote', '')}\"\n"
+            f"ORIGINAL RELEVANCE EXPLANATION {n}: {q.get('relevance_explanation', '')}"
+            for n, q in enumerate(batch, 1)
+        )
+        
+        # The document leads the prompt so its prefix is cached across batches and claims
+        task = f"""You are verifying if each of several quotes exists in the document AND genuinely supports a claim.
+
+CLAIM: {claim}
+
+QUOTES TO VERIFY:
+{quotes_text}
+
+Your task, for EVERY quote independently:
+1. Find the quote in the document above
+2. Determine if it genuinely supports the claim
+
+CRITICAL: Base your verification solely on what is explicitly stated in the document. Do not infer or assume information not present in the text.
+
+{_VERIFICATION_GUIDANCE}
+
+Return your response as a JSON object with one verdict per quote, using the quote numbers above:
+{{
+    "verdicts": [
+        {{
+            "quote_number": 1,
+            "quote_found": true/false,
+            "found_explanation": "explanation of whether/where the quote appears (be specific about any differences found)",
+            "supports_claim": true/false,
+            "support_explanation": "explanation of why it does/doesn't support the claim (if quote not found, state this clearly)"
+        }}
+    ]
+}}
+
+IMPORTANT: If quote_found is false, the support_explanation MUST mention that the quote was not found in the document."""
+        prompt = document_utils.document_first_prompt(full_document, task, heading="FULL DOCUMENT")
+
+        logger.debug(f"\nCalling LLM to verify {len(batch)} quotes...")
+        
+        try:
+            result = await LLMResponseParser.parse_with_retry(
+                llm_client=self.llm_client,
+                prompt=prompt,
+                output_model=BatchVerifierOutput,
+                max_retries=2,
+                temperature=0.0
+            )
+        except ValueError as e:
+            logger.error(f"Failed to verify batch of {len(batch)} quotes after retries: {e}")
+            return [self._failed_verification(e) for _ in batch]
+        
+        verdicts = {v.quote_number: v for v in result.verdicts}
+        verifications = []
+        for n, quote_data in enumerate(batch, 1):
+            if n in verdicts:
+                verifications.append(self._to_verification(verdicts[n]))
+            else:
+                logger.warning(f"Batch verdict missing for quote {n}; verifying it individually")
+                verifications.append(await self._verify_evidence(
+                    claim=claim,
+                    quote=quote_data.get("quote", ""),
+                    full_document=full_document,
+                    relevance_explanation=quote_data.get("relevance_explanation", "")
+                ))
+        return verifications
+    
+    @staticmethod
+    def _to_verification(result) -> Dict[str, Any]:
+        """Convert a single or batched verifier verdict to the expected format."""
+        keep = result.quote_found and result.supports_claim
+        
+        if not result.quote_found:
+            reason = "not found"
+        elif not result.supports_claim:
+            reason = "does not support claim"
+        else:
+            reason = ""
+        
+        return {
+            "keep": keep,
+            "presence_explanation": result.found_explanation,
+            "support_explanation": result.support_explanation,
+            "explanation": result.support_explanation,
+            "reason": reason
+        }
+    
+    @staticmethod
+    def _failed_verification(error: Exception) -> Dict[str, Any]:
+        """Rejection recorded when the LLM could not produce a verdict."""
+        return {
+            "keep": False,
+            "reason": "Verification failed",
+            "explanation": str(error),
+            "presence_explanation": "",
+            "support_explanation": ""
+        }
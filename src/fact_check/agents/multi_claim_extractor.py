@@ -0,0 +1,171 @@
+"""Agent for extracting supporting evidence for several claims in one call."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .base import BaseAgent, AgentError
+from .evidence_extractor import EXTRACTION_RULES, build_extractor_output
+from ..utils import document_utils
+from ..utils.document_cache import get_document
+from ..core.responses_client import ResponsesClient
+from ..models.llm_outputs import MultiClaimExtractorOutput
+from ..utils.llm_parser import LLMResponseParser
+from ..config.agent_models import get_model_for_agent
+
+logger = logging.getLogger(__name__)
+
+
+class MultiClaimExtractor(BaseAgent):
+    """
+    Extract supporting evidence for a group of claims against one document.
+
+    The document is sent once and the model returns snippets keyed by claim
+    id. For every claim answered, the agent writes the regular
+    ``agents/claims/<claim_id>/evidence_extractor/output.json`` so the rest
+    of the claim pipeline runs unchanged. Claims the model leaves out are
+    reported as missing and should be extracted individually.
+    """
+
+    @property
+    def agent_name(self) -> str:
+        return "multi_claim_extractor"
+
+    @property
+    def required_inputs(self) -> List[str]:
+        return ["extracted/content.json"]
+
+    def __init__(
+        self,
+        pdf_name: str,
+        group_id: str,
+        claims: List[Dict[str, str]],
+        cache_dir: Path = Path("data/scientific_cache"),
+        config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize multi-claim extractor agent.
+
+        Args:
+            pdf_name: Name of the PDF document
+            group_id: Identifier of the claim group (e.g., "group_000")
+            claims: Claims in the group, each with "id" and "claim"
+            cache_dir: Base cache directory
+            config: Agent configuration
+        """
+        super().__init__(pdf_name, cache_dir, config)
+        self.group_id = group_id
+        self.claims = claims
+
+        self.agent_dir = self.pdf_dir / "agents" / "claim_groups" / group_id / self.agent_name
+        self.agent_dir.mkdir(parents=True, exist_ok=True)
+
+        # Set up LLM client
+        self.llm_client = ResponsesClient()
+        # Use centrally configured model for this agent
+        self.llm_client.model = get_model_for_agent(self.agent_name)
+
+    async def process(self) -> Dict[str, Any]:
+        """
+        Extract evidence for every claim in the group.
+
+        Returns:
+            Dictionary listing the claims extracted and those missing from
+            the model's answer
+        """
+        if not self.claims:
+            raise AgentError("No claims provided")
+
+        claim_ids = [c["id"] for c in self.claims]
+        logger.info(f"Extracting evidence for {len(self.claims)} claims from {self.pdf_name}: {claim_ids}")
+
+        document = get_document(self.pdf_dir / "extracted" / "content.json")
+        context = document_utils.get_claims_context(
+            document,
+            [c["claim"] for c in self.claims],
+            mode=self.config.get("context_mode")
+        )
+
+        claims_text = "\n".join(f"- {c['id']}: {c['claim']}" for c in self.claims)
+
+        # The document leads the prompt so its prefix is cached across groups
+        task = f'''Extract quotes from the document that support each of these claims.
+
+{EXTRACTION_RULES}
+
+Treat every claim independently: a quote may be listed under several claims,
+and a claim may have no supporting quotes at all.
+
+CLAIMS (id: claim):
+{claims_text}
+
+Return your response as a JSON object with one entry for EVERY claim id above
+(use an empty list when the document does not support the claim):
+{{
+    "snippets_by_claim": {{
+        "{claim_ids[0]}": [
+            {{
+                "quote": "quote with OCR artifacts corrected",
+                "relevance_explanation": "1-2 sentences explaining how this supports the claim"
+            }}
+        ]
+    }}
+}}'''
+        prompt = document_utils.document_first_prompt(
+            context["text"], task, heading=document_utils.context_heading(context)
+        )
+
+        result = await LLMResponseParser.parse_with_retry(
+            llm_client=self.llm_client,
+            prompt=prompt,
+            output_model=MultiClaimExtractorOutput,
+            max_retries=2,
+            temperature=0.0
+        )
+
+        extracted = []
+        missing = []
+        for claim in self.claims:
+            snippets = result.snippets_by_claim.get(claim["id"])
+            if snippets is None:
+                missing.append(claim["id"])
+                continue
+
+            output = build_extractor_output(
+                claim_id=claim["id"],
+                claim=claim["claim"],
+                pdf_name=self.pdf_name,
+                document=document,
+                context=context,
+                snippets=snippets,
+                model=self.llm_client.model
+            )
+            output["batch"] = {"group_id": self.group_id, "claim_ids": claim_ids}
+            self._save_claim_output(claim["id"], output)
+            extracted.append(claim["id"])
+            logger.info(f"  {claim['id']}: {len(snippets)} snippets")
+
+        if missing:
+            logger.warning(f"Multi-claim extraction omitted {missing} for {self.pdf_name}")
+
+        return {
+            "group_id": self.group_id,
+            "document": self.pdf_name,
+            "claim_ids": claim_ids,
+            "extracted": extracted,
+            "missing": missing,
+            "context": {
+                "mode": context["mode"],
+                "characters": len(context["text"]),
+                "block_ids": context["block_ids"]
+            },
+            "model_used": self.llm_client.model
+        }
+
+    def _save_claim_output(self, claim_id: str, output: Dict[str, Any]) -> None:
+        """Write a claim's extractor output where the claim pipeline expects it."""
+        output_dir = self.pdf_dir / "agents" / "claims" / claim_id / "evidence_extractor"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "output.json", 'w') as f:
+            json.dump(output, f, indent=2)
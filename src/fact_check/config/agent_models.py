@@ -5,6 +5,9 @@ AGENT_MODELS = {
     # Evidence extraction - uses general purpose model
     "evidence_extractor": "gpt-4.1",
     
+    # Multi-claim extraction - same model as single-claim extraction
+    "multi_claim_extractor": "gpt-4.1",
+    
     # Evidence verification - uses general purpose model
     "evidence_verifier_v2": "gpt-4.1",
     
@@ -17,6 +20,9 @@ AGENT_MODELS = {
     # Evidence presentation - uses general purpose model
     "evidence_presenter": "gpt-4.1",
     
+    # Claim-document screening - small excerpt, cheap model
+    "claim_screener": "gpt-4.1-mini",
+    
     # Default fallback for any agent not explicitly configured
     "default": "gpt-4.1"
 }
@@ -0,0 +1,68 @@
+"""Process-wide pooled HTTP client for gateway calls.
+
+All ``ResponsesClient`` instances share one ``httpx.AsyncClient`` so
+connections to the gateway are kept alive and reused instead of being opened
+for every request. The pool is bound to the event loop that created it; when
+a new loop starts (e.g. a second ``asyncio.run``) a fresh pool is created.
+Call ``close_http_client()`` before the loop ends to shut connections down
+cleanly.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Optional
+
+import httpx
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = settings.llm_http2
+    if http2 and not _http2_available():
+        logger.warning("LLM_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+        keepalive_expiry=settings.llm_http_keepalive_expiry,
+    )
+    logger.debug(
+        f"Creating pooled HTTP client (max_connections={limits.max_connections}, "
+        f"keepalive={limits.max_keepalive_connections}, http2={http2})"
+    )
+    return httpx.AsyncClient(limits=limits, http2=http2, timeout=settings.llm_request_timeout)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The pooled client for the running event loop, created on first use."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # A pool left over from a finished loop cannot be closed from here;
+        # its sockets are released when it is garbage collected
+        _client = _build_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client and its connections."""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -0,0 +1,250 @@
+"""Process-wide scheduler that keeps LLM traffic within the provider's rate limits.
+
+Every ``ResponsesClient`` in the process acquires capacity here before it
+sends a request. Two token buckets refill continuously: one for requests per
+minute and one for tokens per minute. A request is charged its locally
+estimated prompt tokens plus its output budget when it is dispatched, and
+the charge is corrected with the real usage when the response arrives.
+
+Waiting requests are served in priority order (text before vision) and FIFO
+within a class. Only the head of the queue may take capacity, so a large
+request is never starved by a stream of small ones behind it.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Priority classes; lower values are dispatched first
+PRIORITY_TEXT = 0
+PRIORITY_VISION = 1
+PRIORITY_NAMES = {PRIORITY_TEXT: "text", PRIORITY_VISION: "vision"}
+
+# Rough per-image input cost (a high-detail tile set) used when estimating
+_IMAGE_TOKEN_ESTIMATE = 765
+
+
+def estimate_request_tokens(request: Dict[str, Any]) -> int:
+    """Estimate the tokens a Responses API request counts against the TPM limit.
+
+    Text is estimated at about four characters per token; every image part
+    adds a fixed cost. The output budget is included because providers
+    reserve ``max_output_tokens`` against the limit when a request starts.
+    """
+    chars = len(request.get("instructions") or "")
+    images = 0
+    payload = request.get("input")
+    if isinstance(payload, str):
+        chars += len(payload)
+    elif isinstance(payload, list):
+        for message in payload:
+            content = message.get("content") if isinstance(message, dict) else None
+            if isinstance(content, str):
+                chars += len(content)
+                continue
+            for part in content or []:
+                if part.get("type") == "input_image":
+                    images += 1
+                else:
+                    chars += len(part.get("text") or "")
+    return chars // 4 + 1 + images * _IMAGE_TOKEN_ESTIMATE + (request.get("max_output_tokens") or 0)
+
+
+def request_priority(request: Dict[str, Any]) -> int:
+    """Priority class of a request: vision if any input part is an image."""
+    payload = request.get("input")
+    if isinstance(payload, list):
+        for message in payload:
+            content = message.get("content") if isinstance(message, dict) else None
+            if isinstance(content, list) and any(part.get("type") == "input_image" for part in content):
+                return PRIORITY_VISION
+    return PRIORITY_TEXT
+
+
+class TokenBucket:
+    """Continuously refilling bucket sized to a per-minute limit.
+
+    ``None`` means unlimited. The level may go negative when actual usage
+    exceeds the estimate charged up front; later requests then wait for the
+    debt to be paid off.
+    """
+
+    def __init__(self, per_minute: Optional[int]):
+        self.capacity = float(per_minute) if per_minute else None
+        self.level = self.capacity or 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.capacity is not None:
+            self.level = min(self.capacity, self.level + (now - self._updated) * self.capacity / 60.0)
+        self._updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if available now)."""
+        if self.capacity is None:
+            return 0.0
+        self._refill()
+        # Requests larger than the whole bucket go through once it is full
+        amount = min(amount, self.capacity)
+        missing = amount - self.level
+        return max(0.0, missing * 60.0 / self.capacity)
+
+    def take(self, amount: float) -> None:
+        if self.capacity is None:
+            return
+        self._refill()
+        self.level -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        """Charge (positive) or refund (negative) tokens after the fact."""
+        if self.capacity is None:
+            return
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+
+class RequestScheduler:
+    """Priority queue of LLM requests gated by RPM and TPM token buckets."""
+
+    def __init__(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int]):
+        """
+        Args:
+            requests_per_minute: Request rate limit, or None for unlimited
+            tokens_per_minute: Token rate limit, or None for unlimited
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+
+        # Waiters: (priority, sequence, estimated tokens, future)
+        self._queue: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self._metrics = {
+            name: {"requests": 0, "estimated_tokens": 0, "total_wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            for name in PRIORITY_NAMES.values()
+        }
+        self.actual_tokens = 0
+        self.peak_queue_depth = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def acquire(self, estimated_tokens: int, priority: int = PRIORITY_TEXT) -> float:
+        """Wait until the request may be sent and charge it to the buckets.
+
+        Args:
+            estimated_tokens: Locally estimated tokens for the request
+            priority: PRIORITY_TEXT or PRIORITY_VISION
+
+        Returns:
+            Seconds spent queued
+        """
+        self._bind_loop()
+        started = time.perf_counter()
+        future = self._loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), estimated_tokens, future))
+        self.peak_queue_depth = max(self.peak_queue_depth, len(self._queue))
+        self._wakeup.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = self._loop.create_task(self._dispatch())
+
+        await future
+
+        waited = time.perf_counter() - started
+        metrics = self._metrics[PRIORITY_NAMES[priority]]
+        metrics["requests"] += 1
+        metrics["estimated_tokens"] += estimated_tokens
+        metrics["total_wait_seconds"] += waited
+        metrics["max_wait_seconds"] = max(metrics["max_wait_seconds"], waited)
+        if waited >= 1.0:
+            logger.debug(f"{PRIORITY_NAMES[priority]} request queued {waited:.1f}s for rate-limit capacity")
+        return waited
+
+    def settle(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Correct a dispatched request's charge with its reported usage."""
+        if actual_tokens is None:
+            return
+        self.actual_tokens += actual_tokens
+        self.tokens.adjust(actual_tokens - estimated_tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        by_priority = {}
+        for name, metrics in self._metrics.items():
+            count = metrics["requests"]
+            by_priority[name] = {
+                **metrics,
+                "average_wait_seconds": metrics["total_wait_seconds"] / count if count else 0.0,
+            }
+        return {
+            "requests_per_minute": self.requests.capacity,
+            "tokens_per_minute": self.tokens.capacity,
+            "queue_depth": len(self._queue),
+            "peak_queue_depth": self.peak_queue_depth,
+            "actual_tokens": self.actual_tokens,
+            "by_priority": by_priority,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _bind_loop(self) -> None:
+        """Attach loop-bound state to the running loop.
+
+        The scheduler outlives individual ``asyncio.run`` calls; waiters and
+        the dispatcher of a finished loop are dropped, the buckets are kept.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._queue = []
+            self._wakeup = asyncio.Event()
+            self._dispatcher = None
+
+    async def _dispatch(self) -> None:
+        """Release queued requests in order as bucket capacity allows."""
+        while self._queue:
+            self._wakeup.clear()
+            _, _, estimated, future = self._queue[0]
+            if future.done():  # Cancelled while queued
+                heapq.heappop(self._queue)
+                continue
+
+            delay = max(self.requests.delay(1), self.tokens.delay(estimated))
+            if delay == 0.0:
+                heapq.heappop(self._queue)
+                self.requests.take(1)
+                self.tokens.take(estimated)
+                future.set_result(None)
+                continue
+
+            # Sleep until capacity returns, or until a new waiter (possibly
+            # of higher priority) arrives
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+
+_scheduler = RequestScheduler(
+    requests_per_minute=settings.llm_requests_per_minute,
+    tokens_per_minute=settings.llm_tokens_per_minute,
+)
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """The process-wide request scheduler."""
+    return _scheduler
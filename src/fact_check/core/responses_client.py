@@ -6,11 +6,15 @@ This client talks to the Solstice Gateway that implements the OpenAI
 OpenAI, but *clients are no longer required* to supply such a key.  An
 `Authorization` header is only sent when an explicit key is provided.
 """
+import json
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
 from src.core.config import settings
+from .http_pool import get_http_client
+from .request_scheduler import estimate_request_tokens, get_request_scheduler, request_priority
 try:
     from ..config.model_capabilities import extract_text_from_response
 except ImportError:
@@ -48,6 +52,14 @@ class ResponsesClient:
         if self.api_key:
             self.headers["Authorization"] = f"Bearer {self.api_key}"
 
+        # Token usage accumulated over all calls made by this client
+        self.usage = {
+            "calls": 0,
+            "input_tokens": 0,
+            "cached_input_tokens": 0,
+            "output_tokens": 0,
+        }
+
     async def create_response(
         self,
         input: str | list[dict] | None = None,
@@ -63,6 +75,8 @@ class ResponsesClient:
         max_output_tokens: int | None = None,
         *,
         fresh_response: bool = True,
+        reuse_cached: bool = False,
+        timeout: float | None = None,
         **kwargs,
     ) -> dict:
         """
@@ -83,6 +97,10 @@ class ResponsesClient:
             fresh_response: If True (default), ensures each request gets a fresh response
                 by adding a unique nonce. If False, allows cached responses for identical 
                 requests, improving speed and reducing costs.
+            reuse_cached: Let a gateway running in read-through mode answer a
+                temperature-0 request from its cache even when it carries a
+                fresh_response nonce.
+            timeout: Request timeout in seconds (defaults to LLM_REQUEST_TIMEOUT)
 
         Returns:
             Response object with output, tool calls, and usage info
@@ -95,6 +113,206 @@ class ResponsesClient:
             - These are independent: you can have fresh responses that aren't stored,
               or deduplicated responses that are stored
         """
+        request_data = self._build_request_data(
+            input=input,
+            model=model,
+            previous_response_id=previous_response_id,
+            instructions=instructions,
+            tools=tools,
+            tool_choice=tool_choice,
+            parallel_tool_calls=parallel_tool_calls,
+            store=store,
+            reasoning=reasoning,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            fresh_response=fresh_response,
+            **kwargs,
+        )
+
+        # Debug logging for LLM calls
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"\n{'='*60}")
+            logger.debug(f"🤖 LLM CALL - Model: {model}")
+            logger.debug(f"🌡️  Temperature: {temperature if temperature is not None else 'default'}")
+            logger.debug(f"📊 Max tokens: {max_output_tokens if max_output_tokens is not None else 'default'}")
+            logger.debug(f"🔄 Fresh responses: {'ENABLED' if fresh_response else 'DISABLED'}")
+            logger.debug(f"💾 Response storage: {'ENABLED' if store else 'DISABLED'}")
+            prompt = input if isinstance(input, str) else str(input)[:500]
+            logger.debug(f"📝 Prompt preview: {prompt[:200]}..." if len(prompt) > 200 else f"📝 Prompt: {prompt}")
+            logger.debug(f"{'='*60}\n")
+
+        # Wait for rate-limit capacity shared by every client in the process
+        scheduler = get_request_scheduler()
+        estimated_tokens = estimate_request_tokens(request_data)
+        await scheduler.acquire(estimated_tokens, request_priority(request_data))
+
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/v1/responses",
+            json=request_data,
+            headers={**self.headers, "X-Solstice-Cache-Reuse": "true"} if reuse_cached else self.headers,
+            timeout=timeout if timeout is not None else settings.llm_request_timeout,
+        )
+        try:
+            response.raise_for_status()
+            result = response.json()
+            self._record_usage(result)
+            scheduler.settle(estimated_tokens, (result.get("usage") or {}).get("total_tokens"))
+            
+            # Debug log the response
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    text = self.extract_text(result)
+                    logger.debug(f"\n{'='*60}")
+                    logger.debug(f"✅ LLM RESPONSE")
+                    logger.debug(f"📄 Response preview: {text[:300]}..." if len(text) > 300 else f"📄 Response: {text}")
+                    
+                    # Log usage information if available
+                    if "usage" in result:
+                        usage = result["usage"]
+                        logger.debug(f"📊 Token Usage:")
+                        logger.debug(f"   - Total tokens: {usage.get('total_tokens', 'N/A')}")
+                        # Support both Chat Completions API and Responses API field names
+                        input_tokens = usage.get('input_tokens', usage.get('prompt_tokens', 'N/A'))
+                        output_tokens = usage.get('output_tokens', usage.get('completion_tokens', 'N/A'))
+                        logger.debug(f"   - Input tokens: {input_tokens}")
+                        logger.debug(f"   - Output tokens: {output_tokens}")
+                        
+                        # Check for cached tokens in input_tokens_details (Responses API) or prompt_tokens_details (Chat API)
+                        details = usage.get("input_tokens_details") or usage.get("prompt_tokens_details")
+                        if details:
+                            cached_tokens = details.get("cached_tokens", 0)
+                            logger.debug(f"   - Cached tokens: {cached_tokens}")
+                            if cached_tokens > 0:
+                                logger.debug(f"   ⚡ CACHE HIT: {cached_tokens} tokens were cached!")
+                    
+                    logger.debug(f"{'='*60}\n")
+                except Exception as e:
+                    logger.debug(f"✅ LLM Response received (could not extract text: {e})")
+            
+            return result
+            
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 500:
+                error_detail = e.response.json().get("detail", "")
+                if "OpenAI SDK does not support Responses API" in error_detail:
+                    raise RuntimeError(
+                        "Gateway requires OpenAI SDK >= 1.50.0 for Responses API support. "
+                        "Please upgrade the SDK on the gateway server."
+                    ) from e
+            raise
+
+    async def stream_response(
+        self,
+        input: str | list[dict] | None = None,
+        model: str = "gpt-4.1-mini",
+        previous_response_id: str | None = None,
+        instructions: str | None = None,
+        tools: list[dict] | None = None,
+        tool_choice: str | dict | None = "auto",
+        parallel_tool_calls: bool = True,
+        store: bool = False,
+        reasoning: dict | None = None,
+        temperature: float | None = None,
+        max_output_tokens: int | None = None,
+        *,
+        fresh_response: bool = True,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream a response from the Responses API as it is generated.
+
+        Takes the same arguments as ``create_response``. Yields the gateway's
+        server-sent events as dicts: ``response.output_text.delta`` events
+        carry text under "delta", and the final ``response.completed`` event
+        carries the full response (the ``create_response`` result) under
+        "response".
+
+        Raises:
+            RuntimeError: If the gateway reports an error mid-stream
+        """
+        request_data = self._build_request_data(
+            input=input,
+            model=model,
+            previous_response_id=previous_response_id,
+            instructions=instructions,
+            tools=tools,
+            tool_choice=tool_choice,
+            parallel_tool_calls=parallel_tool_calls,
+            store=store,
+            reasoning=reasoning,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            fresh_response=fresh_response,
+            **kwargs,
+        )
+        request_data["stream"] = True
+
+        scheduler = get_request_scheduler()
+        estimated_tokens = estimate_request_tokens(request_data)
+        await scheduler.acquire(estimated_tokens, request_priority(request_data))
+
+        client = get_http_client()
+        async with client.stream(
+            "POST",
+            f"{self.base_url}/v1/responses",
+            json=request_data,
+            headers={**self.headers, "Accept": "text/event-stream"},
+            timeout=timeout if timeout is not None else settings.llm_request_timeout,
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                # Event types are repeated inside the data payload, so only
+                # "data:" lines need parsing
+                if not line.startswith("data:"):
+                    continue
+                event = json.loads(line[5:].strip())
+                event_type = event.get("type")
+                if event_type == "error":
+                    raise RuntimeError(f"Gateway stream error: {event.get('message', 'unknown error')}")
+                if event_type == "response.completed":
+                    result = event.get("response") or {}
+                    self._record_usage(result)
+                    scheduler.settle(estimated_tokens, (result.get("usage") or {}).get("total_tokens"))
+                yield event
+
+    async def stream_text(self, prompt: str, model: str = "gpt-4.1-mini", **kwargs) -> AsyncIterator[str]:
+        """
+        Stream the assistant's text as it is generated.
+
+        Args:
+            prompt: The user prompt
+            model: Model to use
+            **kwargs: Additional parameters for ``stream_response``
+
+        Yields:
+            Text deltas in order
+        """
+        async for event in self.stream_response(input=prompt, model=model, **kwargs):
+            if event.get("type") == "response.output_text.delta":
+                yield event.get("delta", "")
+
+    def _build_request_data(
+        self,
+        input: str | list[dict] | None,
+        model: str,
+        previous_response_id: str | None,
+        instructions: str | None,
+        tools: list[dict] | None,
+        tool_choice: str | dict | None,
+        parallel_tool_calls: bool,
+        store: bool,
+        reasoning: dict | None,
+        temperature: float | None,
+        max_output_tokens: int | None,
+        fresh_response: bool,
+        **kwargs,
+    ) -> dict:
+        """Gateway request body for ``create_response`` and ``stream_response``."""
         request_data = {
             "model": model,
         }
@@ -145,73 +363,18 @@ class ResponsesClient:
         # Add any extra kwargs (after nonce injection so that explicit kwargs
         # always win over internal defaults).
         request_data.update(kwargs)
-        
-        # Debug logging for LLM calls
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"\n{'='*60}")
-            logger.debug(f"🤖 LLM CALL - Model: {model}")
-            logger.debug(f"🌡️  Temperature: {temperature if temperature is not None else 'default'}")
-            logger.debug(f"📊 Max tokens: {max_output_tokens if max_output_tokens is not None else 'default'}")
-            logger.debug(f"🔄 Fresh responses: {'ENABLED' if fresh_response else 'DISABLED'}")
-            logger.debug(f"💾 Response storage: {'ENABLED' if store else 'DISABLED'}")
-            prompt = input if isinstance(input, str) else str(input)[:500]
-            logger.debug(f"📝 Prompt preview: {prompt[:200]}..." if len(prompt) > 200 else f"📝 Prompt: {prompt}")
-            logger.debug(f"{'='*60}\n")
+        return request_data
+
+    def _record_usage(self, result: dict) -> None:
+        """Add a response's token usage, including prompt-cache hits, to ``self.usage``."""
+        usage = result.get("usage") or {}
+        # Support both Responses API and Chat Completions API field names
+        details = usage.get("input_tokens_details") or usage.get("prompt_tokens_details") or {}
+        self.usage["calls"] += 1
+        self.usage["input_tokens"] += usage.get("input_tokens", usage.get("prompt_tokens")) or 0
+        self.usage["cached_input_tokens"] += details.get("cached_tokens") or 0
+        self.usage["output_tokens"] += usage.get("output_tokens", usage.get("completion_tokens")) or 0
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/v1/responses",
-                json=request_data,
-                headers=self.headers,
-                timeout=600.0,  # 10 minutes for complex medical documents
-            )
-            try:
-                response.raise_for_status()
-                result = response.json()
-                
-                # Debug log the response
-                if logger.isEnabledFor(logging.DEBUG):
-                    try:
-                        text = self.extract_text(result)
-                        logger.debug(f"\n{'='*60}")
-                        logger.debug(f"✅ LLM RESPONSE")
-                        logger.debug(f"📄 Response preview: {text[:300]}..." if len(text) > 300 else f"📄 Response: {text}")
-                        
-                        # Log usage information if available
-                        if "usage" in result:
-                            usage = result["usage"]
-                            logger.debug(f"📊 Token Usage:")
-                            logger.debug(f"   - Total tokens: {usage.get('total_tokens', 'N/A')}")
-                            # Support both Chat Completions API and Responses API field names
-                            input_tokens = usage.get('input_tokens', usage.get('prompt_tokens', 'N/A'))
-                            output_tokens = usage.get('output_tokens', usage.get('completion_tokens', 'N/A'))
-                            logger.debug(f"   - Input tokens: {input_tokens}")
-                            logger.debug(f"   - Output tokens: {output_tokens}")
-                            
-                            # Check for cached tokens in input_tokens_details (Responses API) or prompt_tokens_details (Chat API)
-                            details = usage.get("input_tokens_details") or usage.get("prompt_tokens_details")
-                            if details:
-                                cached_tokens = details.get("cached_tokens", 0)
-                                logger.debug(f"   - Cached tokens: {cached_tokens}")
-                                if cached_tokens > 0:
-                                    logger.debug(f"   ⚡ CACHE HIT: {cached_tokens} tokens were cached!")
-                        
-                        logger.debug(f"{'='*60}\n")
-                    except Exception as e:
-                        logger.debug(f"✅ LLM Response received (could not extract text: {e})")
-                
-                return result
-                
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 500:
-                    error_detail = e.response.json().get("detail", "")
-                    if "OpenAI SDK does not support Responses API" in error_detail:
-                        raise RuntimeError(
-                            "Gateway requires OpenAI SDK >= 1.50.0 for Responses API support. "
-                            "Please upgrade the SDK on the gateway server."
-                        ) from e
-                raise
-    
     def extract_text(self, response: dict, model: str = None) -> str:
         """
         Extract text content from Responses API response.
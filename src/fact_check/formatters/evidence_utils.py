@@ -16,7 +16,8 @@ def extract_text_evidence(supporting_evidence: List[Dict[str, Any]]) -> List[Dic
         {
             "type": "text",
             "quote": evidence.get("quote", ""),
-            "explanation": evidence.get("explanation", "")
+            "explanation": evidence.get("explanation", ""),
+            "location": evidence.get("location")
         }
         for evidence in supporting_evidence
     ]
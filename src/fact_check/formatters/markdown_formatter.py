@@ -85,6 +85,10 @@ class MarkdownFormatter(BaseFormatter):
                         for i, evidence in enumerate(text_items, 1):
                             quote = evidence["quote"]
                             explanation = evidence["explanation"]
+                            location = evidence.get("location")
+                            if location and location.get("pages"):
+                                pages = ", ".join(str(p) for p in location["pages"])
+                                explanation = f"{explanation} (p. {pages})"
                             md_lines.extend([
                                 f"{i}. > {quote}",
                                 f"   ",
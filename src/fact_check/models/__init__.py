@@ -3,13 +3,21 @@
 from .llm_outputs import (
     ExtractorSnippet,
     ExtractorOutput,
-    VerifierOutput
+    MultiClaimExtractorOutput,
+    VerifierOutput,
+    BatchVerdict,
+    BatchVerifierOutput,
+    ScreenerOutput
 )
 from .image_outputs import ImageAnalysisOutput
 
 __all__ = [
     "ExtractorSnippet",
     "ExtractorOutput", 
+    "MultiClaimExtractorOutput",
     "VerifierOutput",
+    "BatchVerdict",
+    "BatchVerifierOutput",
+    "ScreenerOutput",
     "ImageAnalysisOutput"
 ]
\ No newline at end of file
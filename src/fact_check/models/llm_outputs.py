@@ -1,7 +1,7 @@
 """Pydantic models for LLM outputs in fact-checking system."""
 
 from pydantic import BaseModel, Field, field_validator, ValidationInfo
-from typing import List
+from typing import Dict, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,13 @@ class ExtractorOutput(BaseModel):
     snippets: List[ExtractorSnippet] = Field(default_factory=list, description="List of supporting quotes")
 
 
+class MultiClaimExtractorOutput(BaseModel):
+    """Output from the evidence extractor LLM for several claims at once."""
+    snippets_by_claim: Dict[str, List[ExtractorSnippet]] = Field(
+        default_factory=dict, description="Supporting quotes keyed by claim id"
+    )
+
+
 class VerifierOutput(BaseModel):
     """Output from the evidence verifier LLM."""
     quote_found: bool = Field(..., description="Whether the quote was found in the document")
@@ -33,3 +40,19 @@ class VerifierOutput(BaseModel):
             # Be lenient - just log warning
             logger.warning("Quote not found but support_explanation doesn't mention this")
         return v
+
+
+class BatchVerdict(VerifierOutput):
+    """Verifier verdict for one quote of a batch."""
+    quote_number: int = Field(..., ge=1, description="Number of the quote in the batch (1-based)")
+
+
+class BatchVerifierOutput(BaseModel):
+    """Output from the evidence verifier LLM when verifying several quotes at once."""
+    verdicts: List[BatchVerdict] = Field(default_factory=list, description="One verdict per quote")
+
+
+class ScreenerOutput(BaseModel):
+    """Output from the claim screener LLM."""
+    relevant: bool = Field(..., description="Whether the document may contain evidence about the claim")
+    explanation: str = Field(..., min_length=1, description="One sentence explaining the decision")
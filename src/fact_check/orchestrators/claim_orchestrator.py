@@ -1,11 +1,12 @@
 """Streamlined orchestrator for processing claims with supporting evidence pipeline."""
 
+import asyncio
 import copy
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..agents import (
     EvidenceExtractor,
@@ -14,6 +15,9 @@ from ..agents import (
     EvidencePresenter,
     ImageEvidenceAnalyzer
 )
+from ..utils.agent_memo import AgentMemo
+from ..utils.concurrency import ConcurrencyBudget
+from ..utils.document_cache import get_document
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +31,10 @@ class ClaimOrchestrator:
         claim_text: str,
         documents: List[str],
         cache_dir: Path = Path("data/scientific_cache"),
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        batch_extracted: Optional[List[str]] = None,
+        budget: Optional[ConcurrencyBudget] = None,
+        memo: Optional[AgentMemo] = None
     ):
         """
         Initialize streamlined claim orchestrator.
@@ -38,12 +45,23 @@ class ClaimOrchestrator:
             documents: List of document names to process
             cache_dir: Base cache directory
             config: Configuration for agents
+            batch_extracted: Documents whose extractor output for this claim
+                was already written by a multi-claim extraction
+            budget: Concurrency budget shared with the rest of the study.
+                Defaults to a budget of ``max_concurrent_agents`` for this
+                claim alone.
+            memo: Memo of agent results shared with the rest of the study.
+                Defaults to one over ``cache_dir`` honouring the "recompute"
+                config flag.
         """
         self.claim_id = claim_id
         self.claim_text = claim_text
         self.documents = documents
         self.cache_dir = Path(cache_dir)
         self.config = config or {}
+        self.batch_extracted = set(batch_extracted or [])
+        self.budget = budget or ConcurrencyBudget(self.config.get("max_concurrent_agents", 8))
+        self.memo = memo or AgentMemo(self.cache_dir, recompute=self.config.get("recompute", False))
         
         # Agent configuration with claim
         # Use deep copy to avoid shared state between concurrent orchestrators
@@ -78,23 +96,27 @@ class ClaimOrchestrator:
             "documents": {}
         }
         
-        # Process each document
-        for document in self.documents:
+        # Process documents concurrently; the shared budget limits how many
+        # agent runs are in flight across the whole study
+        async def process_single_document(document):
             logger.info(f"  Processing document: {document}")
             
             try:
                 # Run streamlined pipeline
-                doc_result = await self._process_document(document)
-                results["documents"][document] = doc_result
+                return await self._process_document(document)
                 
             except Exception as e:
                 logger.error(f"    Failed to process {document}: {e}")
-                results["documents"][document] = {
+                return {
                     "success": False,
                     "error": str(e),
                     "supporting_evidence": []
                 }
         
+        doc_results = await asyncio.gather(*(process_single_document(doc) for doc in self.documents))
+        for document, doc_result in zip(self.documents, doc_results):
+            results["documents"][document] = doc_result
+        
         results["completed_at"] = datetime.now().isoformat()
         return results
     
@@ -113,8 +135,30 @@ class ClaimOrchestrator:
         # Track if pipeline was stopped early
         pipeline_stopped_early = False
         
+        # Memo keys cover the document content and, for each agent, the
+        # outputs of the agents before it
+        document_hash = self._document_hash(document)
+        inputs = ""
+        
         for agent_class, agent_name in self.pipeline:
+            if agent_name == "evidence_extractor" and document in self.batch_extracted:
+                logger.info(f"    Using multi-claim extraction for {agent_name}")
+                output = self._load_batch_extraction(document)
+                if document_hash and output is not None:
+                    # Memoize the group's answer as this claim's extraction
+                    key = self.memo.key(agent_name, agent_class.prompt_version, self.agent_config, document_hash)
+                    self.memo.store(document, key, agent_name, output)
+                    inputs = self.memo.chain(inputs, output)
+                doc_result["agents_run"].append({
+                    "agent": agent_name,
+                    "success": True,
+                    "batched": True,
+                    "timestamp": datetime.now().isoformat()
+                })
+                continue
+            
             logger.info(f"    Running {agent_name}...")
+            agent = None
             
             try:
                 # Use deep copy for agent config to ensure isolation
@@ -130,12 +174,21 @@ class ClaimOrchestrator:
 
                 # Execute via BaseAgent.run() which handles validation,
                 # metadata, and output persistence.
-                result = await agent.run()
+                if agent_name == "evidence_verifier_v2":
+                    # Verifier batches run concurrently; each takes its own slot
+                    agent.budget = self.budget
+                    result, memoized = await self._run_agent(agent, document_hash, inputs)
+                else:
+                    async with self.budget.slot():
+                        result, memoized = await self._run_agent(agent, document_hash, inputs)
+                inputs = self.memo.chain(inputs, result)
                 
                 doc_result["agents_run"].append({
                     "agent": agent_name,
                     "success": True,
-                    "timestamp": datetime.now().isoformat()
+                    "memoized": memoized,
+                    "timestamp": datetime.now().isoformat(),
+                    "token_usage": agent.token_usage
                 })
                 
                 # Collect verified evidence
@@ -153,7 +206,8 @@ class ClaimOrchestrator:
                     "agent": agent_name,
                     "success": False,
                     "error": str(e),
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now().isoformat(),
+                    "token_usage": agent.token_usage if agent else None
                 })
                 
                 # Decide whether to continue
@@ -195,6 +249,32 @@ class ClaimOrchestrator:
         doc_result["success"] = all(a["success"] for a in doc_result["agents_run"])
         return doc_result
     
+    def _document_hash(self, document: str) -> Optional[str]:
+        """Content hash of the document, or None if it cannot be loaded."""
+        try:
+            return get_document(self.cache_dir / document / "extracted" / "content.json").content_hash
+        except (OSError, ValueError):
+            return None
+    
+    def _load_batch_extraction(self, document: str) -> Optional[Dict[str, Any]]:
+        """Extractor output written for this claim by a multi-claim extraction."""
+        path = self.cache_dir / document / "agents" / "claims" / self.claim_id / "evidence_extractor" / "output.json"
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    async def _run_agent(self, agent, document_hash: Optional[str], inputs: str = "") -> Tuple[Dict[str, Any], bool]:
+        """Run an agent through the memo when the document hash is known.
+        
+        Returns:
+            The agent's result and whether it was reused from the memo
+        """
+        if document_hash is None:
+            return await agent.run(), False
+        return await self.memo.run(agent, document_hash, inputs)
+    
     
     
     async def _run_presenter(
@@ -241,7 +321,8 @@ class ClaimOrchestrator:
                 config=agent_config
             )
             
-            # Run presenter via BaseAgent.run()
+            # Run presenter via BaseAgent.run(); it makes no LLM calls, so it
+            # does not take a slot of the concurrency budget
             result = await presenter.run()
             
             # Update doc_result with presenter output
@@ -271,22 +352,20 @@ class ClaimOrchestrator:
             List of image analysis results (only those that support the claim)
         """
         # Load document content to get image metadata
-        from ..utils import document_utils
-        
         content_path = self.cache_dir / document / "extracted" / "content.json"
         if not content_path.exists():
             logger.info("    No content.json found, skipping image analysis")
             return []
         
         try:
-            with open(content_path, 'r') as f:
-                content_json = json.load(f)
+            cached = get_document(content_path)
         except Exception as e:
             logger.error(f"    Failed to load content.json: {e}")
             return []
         
         # Get all images with metadata
-        images = document_utils.get_images(content_json)
+        images = cached.images
+        document_hash = cached.content_hash
         
         if not images:
             logger.info("    No images found in document")
@@ -294,15 +373,12 @@ class ClaimOrchestrator:
         
         logger.info(f"    Found {len(images)} images to analyze")
         
-        # Analyze each image with controlled parallelism
-        import asyncio
-        
-        # Limit concurrent image analyses to prevent memory issues
-        max_concurrent = self.config.get("max_concurrent_images", 5)
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Analyze each image; concurrency is limited by the shared budget
+        token_usage = [None] * len(images)
+        memoized = [False] * len(images)
         
-        async def analyze_image_with_limit(image_metadata):
-            async with semaphore:
+        async def analyze_image_with_limit(i, image_metadata):
+            async with self.budget.slot():
                 # Deep copy config for each image analyzer to ensure isolation
                 analyzer = ImageEvidenceAnalyzer(
                     pdf_name=document,
@@ -311,13 +387,19 @@ class ClaimOrchestrator:
                     cache_dir=self.cache_dir,
                     config=copy.deepcopy(self.agent_config)
                 )
-                return await analyzer.run()
+                try:
+                    result, memoized[i] = await self._run_agent(
+                        analyzer, document_hash, self.memo.chain("", image_metadata)
+                    )
+                    return result
+                finally:
+                    token_usage[i] = analyzer.token_usage
         
         # Create tasks with semaphore limiting
-        tasks = [analyze_image_with_limit(img) for img in images]
+        tasks = [analyze_image_with_limit(i, img) for i, img in enumerate(images)]
         
         # Run all image analyses with controlled parallelism
-        logger.info(f"    Analyzing images with max {max_concurrent} concurrent processes...")
+        logger.info(f"    Analyzing images within a budget of {self.budget.limit} concurrent agent runs...")
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Process results
@@ -335,13 +417,16 @@ class ClaimOrchestrator:
                     "success": False,
                     "error": str(result),
                     "timestamp": datetime.now().isoformat(),
+                    "token_usage": token_usage[i],
                 })
             else:
                 # Track in agents_run with consistent naming
                 doc_result["agents_run"].append({
                     "agent": f"image_evidence_analyzer_{image_id}",
                     "success": True,
+                    "memoized": memoized[i],
                     "timestamp": datetime.now().isoformat(),
+                    "token_usage": token_usage[i],
                 })
 
                 # Only include images that support the claim
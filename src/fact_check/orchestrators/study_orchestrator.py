@@ -1,12 +1,23 @@
 """Streamlined study orchestrator for running fact-checking across multiple claims."""
 
+import asyncio
+import copy
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from .claim_orchestrator import ClaimOrchestrator
+from ..agents import ClaimScreener, EvidenceExtractor, MultiClaimExtractor
+from ..utils.agent_memo import AgentMemo
+from ..utils.concurrency import ConcurrencyBudget
+from ..core.request_scheduler import get_request_scheduler
+from ..utils.document_cache import get_document
+from ..utils.document_utils import estimate_tokens
+from ..utils.study_journal import StudyJournal, write_results_json
+from ..utils.claim_router import CorpusRouter, PROCESS, SKIP, SCREENED_IN, SCREENED_OUT
+from src.core.cache_manager import touch_document
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +31,8 @@ class StudyOrchestrator:
         documents: List[str],
         cache_dir: Path = Path("data/scientific_cache"),
         output_dir: Path = Path("data/studies"),
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        resume_journal: Optional[Path] = None
     ):
         """
         Initialize streamlined study orchestrator.
@@ -30,7 +42,15 @@ class StudyOrchestrator:
             documents: List of document names to check
             cache_dir: Base cache directory
             output_dir: Directory for study results
-            config: Configuration for agents and orchestration
+            config: Configuration for agents and orchestration. The optional
+                "routing" entry ({"mode": "off" | "skip" | "screen",
+                "threshold": float}) controls claim-to-document routing.
+                The optional "batch_extraction" entry ({"enabled": bool,
+                "max_group_size": int, "token_budget": int}) extracts
+                evidence for groups of claims per document in one call.
+                "recompute": True ignores memoized agent results.
+            resume_journal: Journal of an interrupted study to continue;
+                claims it already completed are not processed again
         """
         self.claims_file = Path(claims_file)
         self.documents = documents
@@ -38,11 +58,39 @@ class StudyOrchestrator:
         self.output_dir = Path(output_dir)
         self.config = config or {}
         
+        # Claim-to-document routing: pairs scoring below the threshold are
+        # skipped ("skip") or sent to a cheap screening call ("screen")
+        routing_config = self.config.get("routing", {})
+        self.routing_mode = routing_config.get("mode", "off")
+        self.routing_threshold = routing_config.get("threshold", 0.15)
+        self.router: Optional[CorpusRouter] = None
+        self.budget: Optional[ConcurrencyBudget] = None
+        
+        # Agent results are reused across studies unless inputs changed
+        self.memo = AgentMemo(self.cache_dir, recompute=self.config.get("recompute", False))
+        
+        # Multi-claim extraction: claims are grouped per document so that
+        # (document tokens x claims per group) stays within the token budget
+        batch_config = self.config.get("batch_extraction", {})
+        self.batch_extraction = {
+            "enabled": batch_config.get("enabled", False),
+            "max_group_size": batch_config.get("max_group_size", 6),
+            "token_budget": batch_config.get("token_budget", 120_000),
+        }
+        
         # Load claims
         self.claims = self._load_claims()
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Completed claims are journaled as they finish so an interrupted
+        # study can be resumed
+        if resume_journal is not None:
+            self.journal = StudyJournal(resume_journal)
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.journal = StudyJournal(self.output_dir / f"study_journal_{timestamp}.jsonl")
     
     def _load_claims(self) -> List[Dict[str, str]]:
         """Load claims from JSON file."""
@@ -67,74 +115,126 @@ class StudyOrchestrator:
         """
         logger.info(f"Starting streamlined study: {len(self.claims)} claims × {len(self.documents)} documents")
         
+        completed = self.journal.completed_claims()
+        pending_claims = [c for c in self.claims if c["id"] not in completed]
+        if completed:
+            logger.info(f"Resuming from {self.journal.path}: {len(completed)} claims already completed")
+        logger.info(f"Journaling completed claims to {self.journal.path}")
+        
+        # Mark documents as recently used so cache eviction keeps them warm
+        for document in self.documents:
+            touch_document(self.cache_dir / document)
+        
         study_results = {
             "metadata": {
                 "claims_file": str(self.claims_file),
                 "documents": self.documents,
                 "total_claims": len(self.claims),
+                "routing": {
+                    "mode": self.routing_mode,
+                    "threshold": self.routing_threshold
+                },
+                "batch_extraction": self.batch_extraction,
                 "started_at": datetime.now().isoformat()
             },
             "claims": {}
         }
         
-        # Process claims with limited parallelism
-        import asyncio
+        header = self.journal.header()
+        if header is None:
+            self.journal.write_header(study_results["metadata"])
+        else:
+            study_results["metadata"]["started_at"] = header["started_at"]
+            study_results["metadata"]["resumed_from"] = str(self.journal.path)
+            study_results["metadata"]["resumed_claims"] = len(completed)
+        
+        # Build the corpus-level relevance index once for all claims
+        if self.routing_mode != "off":
+            self.router = CorpusRouter(self.cache_dir, self.documents)
         
-        # Simple parallelism - process 2-3 claims at once
-        max_concurrent_claims = self.config.get("max_concurrent_claims", 2)
-        logger.info(f"Processing claims with max {max_concurrent_claims} concurrent")
+        # One concurrency budget for every agent run in the study. Claims and
+        # documents are scheduled freely; only agent runs hold a slot.
+        self.budget = ConcurrencyBudget(self.config.get("max_concurrent_agents", 8))
+        logger.info(f"Processing claims with max {self.budget.limit} concurrent agent runs")
         
-        semaphore = asyncio.Semaphore(max_concurrent_claims)
+        # Route every claim up front so multi-claim extraction only groups
+        # claims that will actually be checked against each document
+        routed = await asyncio.gather(*(
+            self._route_claim(c["id"], c["claim"]) for c in pending_claims
+        ))
+        routed_by_claim = {c["id"]: result for c, result in zip(pending_claims, routed)}
+        
+        batch_extracted: Dict[str, List[str]] = {}
+        if self.batch_extraction["enabled"]:
+            batch_extracted, batch_runs = await self._extract_claim_groups(
+                {claim_id: documents for claim_id, (documents, _) in routed_by_claim.items()}
+            )
+            self.journal.write_batch_extraction(batch_runs)
         
         async def process_single_claim(i, claim_data):
-            async with semaphore:
-                claim_id = claim_data["id"]
-                claim_text = claim_data["claim"]
-                
-                logger.info(f"\n[Claim {i+1}/{len(self.claims)}] Starting: {claim_text[:50]}...")
+            claim_id = claim_data["id"]
+            claim_text = claim_data["claim"]
+            
+            logger.info(f"\n[Claim {i+1}/{len(self.claims)}] Starting: {claim_text[:50]}...")
+            
+            # Documents selected for this claim by routing
+            documents, routing = routed_by_claim[claim_id]
+            
+            # Create claim orchestrator
+            claim_orchestrator = ClaimOrchestrator(
+                claim_id=claim_id,
+                claim_text=claim_text,
+                documents=documents,
+                cache_dir=self.cache_dir,
+                config=self.config,
+                batch_extracted=batch_extracted.get(claim_id),
+                budget=self.budget,
+                memo=self.memo
+            )
+            
+            # Process claim
+            try:
+                claim_results = await claim_orchestrator.process()
+                if routing:
+                    claim_results["routing"] = routing
                 
-                # Create claim orchestrator
-                claim_orchestrator = ClaimOrchestrator(
-                    claim_id=claim_id,
-                    claim_text=claim_text,
-                    documents=self.documents,
-                    cache_dir=self.cache_dir,
-                    config=self.config
-                )
+                # Print progress
+                logger.info(f"[Claim {i+1}/{len(self.claims)}] Completed: {claim_text[:50]}...")
+                self._print_claim_summary(claim_id, claim_text, claim_results)
                 
-                # Process claim
-                try:
-                    claim_results = await claim_orchestrator.process()
-                    
-                    # Print progress
-                    logger.info(f"[Claim {i+1}/{len(self.claims)}] Completed: {claim_text[:50]}...")
-                    self._print_claim_summary(claim_id, claim_text, claim_results)
-                    
-                    return claim_id, claim_results
-                    
-                except Exception as e:
-                    logger.error(f"[Claim {i+1}/{len(self.claims)}] Failed: {claim_id}: {e}")
-                    return claim_id, {
-                        "claim_id": claim_id,
-                        "claim": claim_text,
-                        "error": str(e),
-                        "documents": {}
-                    }
+            except Exception as e:
+                logger.error(f"[Claim {i+1}/{len(self.claims)}] Failed: {claim_id}: {e}")
+                claim_results = {
+                    "claim_id": claim_id,
+                    "claim": claim_text,
+                    "error": str(e),
+                    "documents": {},
+                    "routing": routing
+                }
+            
+            # Failed claims are journaled too; a resumed study retries them
+            self.journal.write_claim(claim_id, claim_results)
         
         # Create all tasks
         tasks = [
             process_single_claim(i, claim_data) 
             for i, claim_data in enumerate(self.claims)
+            if claim_data["id"] not in completed
         ]
         
-        # Run with controlled parallelism
-        results = await asyncio.gather(*tasks)
+        # Run all claims; the shared budget controls parallelism
+        await asyncio.gather(*tasks)
         
-        # Store results
-        for claim_id, claim_result in results:
-            study_results["claims"][claim_id] = claim_result
+        # Results are read back from the journal one claim at a time,
+        # including claims completed before a resume
+        study_results["claims"] = self.journal.claims()
+        if self.batch_extraction["enabled"]:
+            study_results["batch_extraction"] = self.journal.batch_extraction_runs()
         
         study_results["metadata"]["completed_at"] = datetime.now().isoformat()
+        study_results["metadata"]["concurrency"] = self.budget.stats()
+        study_results["metadata"]["rate_limits"] = get_request_scheduler().stats()
+        study_results["metadata"]["memo"] = self.memo.stats()
         
         # Generate summary
         study_results["summary"] = self._generate_summary(study_results)
@@ -144,6 +244,156 @@ class StudyOrchestrator:
         
         return study_results
     
+    async def _route_claim(self, claim_id: str, claim_text: str) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+        """
+        Score the claim against every document and pick the ones to process.
+        
+        Returns:
+            Documents to run the pipeline on and the per-document routing
+            decisions (empty when routing is off)
+        """
+        if self.router is None:
+            return self.documents, {}
+        
+        decisions = self.router.route(claim_text, self.documents, self.routing_threshold)
+        
+        if self.routing_mode == "screen":
+            below = [doc for doc, decision in decisions.items() if decision["decision"] == SKIP]
+            screenings = await asyncio.gather(*(
+                self._screen_document(claim_id, claim_text, doc) for doc in below
+            ))
+            for doc, (relevant, explanation, token_usage) in zip(below, screenings):
+                decisions[doc]["decision"] = SCREENED_IN if relevant else SCREENED_OUT
+                decisions[doc]["screening"] = explanation
+                decisions[doc]["token_usage"] = token_usage
+        
+        documents = [
+            doc for doc in self.documents
+            if decisions[doc]["decision"] in (PROCESS, SCREENED_IN)
+        ]
+        logger.info(f"Routing {claim_id}: {len(documents)}/{len(self.documents)} documents selected")
+        return documents, decisions
+    
+    async def _extract_claim_groups(
+        self,
+        documents_by_claim: Dict[str, List[str]]
+    ) -> Tuple[Dict[str, List[str]], List[Dict[str, Any]]]:
+        """
+        Run multi-claim extraction for groups of claims per document.
+        
+        Args:
+            documents_by_claim: Documents each claim is routed to
+        
+        Returns:
+            Documents per claim whose extractor output was written by a
+            group extraction, and a record of every group run
+        """
+        claims_by_id = {c["id"]: c for c in self.claims}
+        groups = []
+        for document in self.documents:
+            # Claims with a memoized extraction on this document are reused
+            # by their claim pipeline instead of being re-extracted
+            claim_ids = [
+                cid for cid, docs in documents_by_claim.items()
+                if document in docs and not self._extraction_memoized(claims_by_id[cid]["claim"], document)
+            ]
+            group_size = self._extraction_group_size(document)
+            if group_size < 2 or len(claim_ids) < 2:
+                continue
+            for start in range(0, len(claim_ids), group_size):
+                group_claims = [claims_by_id[cid] for cid in claim_ids[start:start + group_size]]
+                groups.append((document, f"group_{start // group_size:03d}", group_claims))
+        
+        logger.info(f"Multi-claim extraction: {len(groups)} claim groups")
+        
+        async def extract_group(document, group_id, group_claims):
+            async with self.budget.slot():
+                run = {
+                    "document": document,
+                    "group_id": group_id,
+                    "claim_ids": [c["id"] for c in group_claims],
+                    "extracted": [],
+                    "missing": [],
+                }
+                extractor = None
+                try:
+                    extractor = MultiClaimExtractor(
+                        pdf_name=document,
+                        group_id=group_id,
+                        claims=[{"id": c["id"], "claim": c["claim"]} for c in group_claims],
+                        cache_dir=self.cache_dir,
+                        config=copy.deepcopy(self.config.get("agent_config", {}))
+                    )
+                    result = await extractor.run()
+                    run["extracted"] = result["extracted"]
+                    run["missing"] = result["missing"]
+                except Exception as e:
+                    # The claim pipelines fall back to single-claim extraction
+                    logger.warning(f"Multi-claim extraction of {group_id} on {document} failed: {e}")
+                    run["missing"] = run["claim_ids"]
+                    run["error"] = str(e)
+                run["token_usage"] = extractor.token_usage if extractor else None
+                return run
+        
+        runs = await asyncio.gather(*(extract_group(*group) for group in groups))
+        
+        batch_extracted: Dict[str, List[str]] = {}
+        for run in runs:
+            for claim_id in run["extracted"]:
+                batch_extracted.setdefault(claim_id, []).append(run["document"])
+        return batch_extracted, list(runs)
+    
+    def _extraction_memoized(self, claim_text: str, document: str) -> bool:
+        """Whether the single-claim extractor result for this pair is memoized."""
+        document_hash = self._document_hash(document)
+        if document_hash is None:
+            return False
+        agent_config = copy.deepcopy(self.config.get("agent_config", {}))
+        agent_config["claim"] = claim_text
+        key = self.memo.key("evidence_extractor", EvidenceExtractor.prompt_version, agent_config, document_hash)
+        return self.memo.exists(document, key)
+    
+    def _document_hash(self, document: str) -> Optional[str]:
+        """Content hash of the document, or None if it cannot be loaded."""
+        try:
+            return get_document(self.cache_dir / document / "extracted" / "content.json").content_hash
+        except (OSError, ValueError):
+            return None
+    
+    def _extraction_group_size(self, document: str) -> int:
+        """Claims per extraction call, smaller for longer documents."""
+        try:
+            cached = get_document(self.cache_dir / document / "extracted" / "content.json")
+        except (OSError, ValueError):
+            return 1
+        size = self.batch_extraction["token_budget"] // estimate_tokens(cached.text)
+        return max(1, min(self.batch_extraction["max_group_size"], size))
+    
+    async def _screen_document(
+        self, claim_id: str, claim_text: str, document: str
+    ) -> Tuple[bool, str, Optional[Dict[str, int]]]:
+        """Run the cheap screening agent; screening failures keep the document."""
+        agent_config = copy.deepcopy(self.config.get("agent_config", {}))
+        agent_config["claim"] = claim_text
+        screener = None
+        try:
+            screener = ClaimScreener(
+                pdf_name=document,
+                claim_id=claim_id,
+                cache_dir=self.cache_dir,
+                config=agent_config
+            )
+            document_hash = self._document_hash(document)
+            async with self.budget.slot():
+                if document_hash is None:
+                    result = await screener.run()
+                else:
+                    result, _ = await self.memo.run(screener, document_hash)
+            return result["relevant"], result["explanation"], screener.token_usage
+        except Exception as e:
+            logger.warning(f"Screening {document} for {claim_id} failed, keeping document: {e}")
+            return True, f"Screening failed: {e}", screener.token_usage if screener else None
+    
     def _print_claim_summary(self, claim_id: str, claim_text: str, results: Dict[str, Any]):
         """Print summary of claim processing."""
         print("-" * 60)
@@ -161,12 +411,16 @@ class StudyOrchestrator:
         """Generate summary statistics."""
         total_pairs = 0
         successful_pairs = 0
+        routing_counts = {PROCESS: 0, SKIP: 0, SCREENED_IN: 0, SCREENED_OUT: 0}
         evidence_by_claim = {}  # Track evidence per claim across all documents
         coverage_dist = {"complete": 0, "partial": 0, "none": 0}
         
         for claim_id, claim_result in study_results["claims"].items():
             claim_evidence_count = 0
             
+            for decision in claim_result.get("routing", {}).values():
+                routing_counts[decision["decision"]] = routing_counts.get(decision["decision"], 0) + 1
+            
             for doc_name, doc_result in claim_result.get("documents", {}).items():
                 total_pairs += 1
                 if doc_result.get("success", False):
@@ -196,16 +450,52 @@ class StudyOrchestrator:
             "average_evidence_per_successful_pair": sum(all_evidence_counts) / successful_pairs if successful_pairs > 0 else 0,
             "coverage_distribution": coverage_dist,
             "claims_with_no_evidence": sum(1 for count in all_evidence_counts if count == 0),
-            "claims_with_evidence": sum(1 for count in all_evidence_counts if count > 0)
+            "claims_with_evidence": sum(1 for count in all_evidence_counts if count > 0),
+            "routing_decisions": routing_counts,
+            "token_usage_by_agent": self._aggregate_token_usage(study_results)
         }
     
+    def _aggregate_token_usage(self, study_results: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Sum token usage per agent, splitting input tokens into cached and uncached."""
+        totals: Dict[str, Dict[str, Any]] = {}
+        
+        def add(agent: str, usage: Optional[Dict[str, int]]):
+            if not usage:
+                return
+            total = totals.setdefault(agent, {
+                "calls": 0, "input_tokens": 0, "cached_input_tokens": 0, "output_tokens": 0
+            })
+            for key in total:
+                total[key] += usage.get(key, 0)
+        
+        for batch_run in study_results.get("batch_extraction", []):
+            add("multi_claim_extractor", batch_run.get("token_usage"))
+        
+        for claim_result in study_results["claims"].values():
+            for decision in claim_result.get("routing", {}).values():
+                add("claim_screener", decision.get("token_usage"))
+            for doc_result in claim_result.get("documents", {}).values():
+                for agent_run in doc_result.get("agents_run", []):
+                    agent = agent_run["agent"]
+                    # Image analyzers are recorded once per image
+                    if agent.startswith("image_evidence_analyzer"):
+                        agent = "image_evidence_analyzer"
+                    add(agent, agent_run.get("token_usage"))
+        
+        for total in totals.values():
+            total["uncached_input_tokens"] = total["input_tokens"] - total["cached_input_tokens"]
+            total["cached_input_ratio"] = (
+                total["cached_input_tokens"] / total["input_tokens"] if total["input_tokens"] else 0
+            )
+        return totals
+    
     def save_results(self, results: Dict[str, Any]):
         """Save study results to file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = self.output_dir / f"study_results_{timestamp}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        # Claims stream from the journal rather than being held in memory
+        write_results_json(output_file, results)
         
         logger.info(f"\nResults saved to: {output_file}")
         
@@ -234,3 +524,10 @@ class StudyOrchestrator:
         for coverage, count in summary['coverage_distribution'].items():
             print(f"  {coverage}: {count}")
         print(f"\nAverage evidence per claim: {summary['average_evidence_per_claim']:.1f}")
+        if summary["token_usage_by_agent"]:
+            print("\nInput tokens served from prompt cache:")
+            for agent, usage in summary["token_usage_by_agent"].items():
+                print(f"  {agent}: {usage['cached_input_tokens']}/{usage['input_tokens']} ({usage['cached_input_ratio']:.0%})")
+        if self.routing_mode != "off":
+            skipped = summary["routing_decisions"][SKIP] + summary["routing_decisions"][SCREENED_OUT]
+            print(f"Claim-document pairs skipped by routing: {skipped}")
@@ -0,0 +1,186 @@
+"""Content-addressed memo of agent results.
+
+An agent's output is determined by the claim, the document, the agent's
+prompt and model, the global settings it reads (``AGENT_SETTINGS``), and
+whatever upstream outputs it reads. Results are stored under a hash of
+exactly those inputs, so re-running a study only calls the LLM for
+claim-document pairs whose inputs changed. Downstream agents chain
+the digests of the outputs they consume into their key; recomputing an
+upstream agent therefore invalidates everything after it.
+
+Entries live next to the agent outputs in ``<document>/agents/memo/`` and are
+kept by cache eviction like the rest of ``agents/``. Bump an agent's
+``prompt_version`` when its prompt or output format changes, and list any
+new setting an agent starts reading in ``AGENT_SETTINGS``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from src.core.config import settings
+
+from ..config.agent_models import get_model_for_agent
+
+if TYPE_CHECKING:
+    from ..agents.base import BaseAgent
+
+logger = logging.getLogger(__name__)
+
+# Settings that change the document context agents see
+_CONTEXT_SETTINGS = (
+    "evidence_context_mode",
+    "retrieval_top_k",
+    "retrieval_neighbors",
+    "retrieval_min_document_chars",
+)
+
+# Global settings each agent's output depends on (agent config overrides are
+# already part of the key)
+AGENT_SETTINGS: Dict[str, Tuple[str, ...]] = {
+    "evidence_extractor": _CONTEXT_SETTINGS,
+    "multi_claim_extractor": _CONTEXT_SETTINGS,
+    "completeness_checker": _CONTEXT_SETTINGS,
+    "evidence_verifier_v2": ("quote_match_threshold", "verification_batch_size"),
+}
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _canonical(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class AgentMemo:
+    """Lookup and storage of memoized agent results."""
+
+    def __init__(self, cache_dir: Path, recompute: bool = False):
+        """
+        Args:
+            cache_dir: Base cache directory holding one directory per document
+            recompute: Ignore existing entries (results are still stored,
+                refreshing the memo)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.recompute = recompute
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def settings_signature(agent_name: str) -> Dict[str, Any]:
+        """Current values of the settings listed for the agent in AGENT_SETTINGS."""
+        return {name: getattr(settings, name) for name in AGENT_SETTINGS.get(agent_name, ())}
+
+    @staticmethod
+    def key(
+        agent_name: str,
+        prompt_version: str,
+        config: Dict[str, Any],
+        document_hash: str,
+        inputs: str = ""
+    ) -> str:
+        """
+        Memo key for one agent run.
+
+        Args:
+            agent_name: Agent name (selects the model via AGENT_MODELS)
+            prompt_version: The agent class's ``prompt_version``
+            config: Agent configuration; must contain the claim under "claim"
+            document_hash: ``CachedDocument.content_hash`` of the document
+            inputs: Digest of upstream outputs and other per-run inputs
+
+        Returns:
+            Hex digest identifying the run
+        """
+        agent_config = {k: v for k, v in config.items() if k != "claim"}
+        return _sha256(_canonical({
+            "claim": _sha256(config.get("claim", "")),
+            "document": document_hash,
+            "agent": agent_name,
+            "model": get_model_for_agent(agent_name),
+            "prompt_version": prompt_version,
+            "settings": AgentMemo.settings_signature(agent_name),
+            "config": agent_config,
+            "inputs": inputs,
+        }))
+
+    @staticmethod
+    def chain(inputs: str, output: Any) -> str:
+        """Fold an upstream output into a downstream agent's inputs digest."""
+        return _sha256(inputs + _canonical(output))
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _path(self, document: str, key: str) -> Path:
+        return self.cache_dir / document / "agents" / "memo" / f"{key}.json"
+
+    def exists(self, document: str, key: str) -> bool:
+        return not self.recompute and self._path(document, key).exists()
+
+    def load(self, document: str, key: str) -> Optional[Dict[str, Any]]:
+        """Memoized result for ``key``, or None on a miss."""
+        if self.recompute:
+            self.misses += 1
+            return None
+        try:
+            with open(self._path(document, key), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["result"]
+
+    def store(self, document: str, key: str, agent_name: str, result: Dict[str, Any]) -> None:
+        """Save a result; written atomically so a crash never leaves a partial entry."""
+        path = self._path(document, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"agent": agent_name, "result": result}, f)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    # Agent runs
+    # ------------------------------------------------------------------
+
+    async def run(self, agent: "BaseAgent", document_hash: str, inputs: str = "") -> Tuple[Dict[str, Any], bool]:
+        """
+        Run an agent unless an identical run is memoized.
+
+        On a hit the memoized result is written to the agent's directory as if
+        it had run, so downstream agents find it where they expect it. Failed
+        results (``"error"`` set) are never memoized.
+
+        Returns:
+            The agent's result and whether it came from the memo
+        """
+        key = self.key(agent.agent_name, agent.prompt_version, agent.config, document_hash, inputs)
+        cached = self.load(agent.pdf_name, key)
+        if cached is not None:
+            logger.info(f"    Reusing memoized {agent.agent_name} result")
+            agent.restore(cached)
+            return cached, True
+
+        result = await agent.run()
+        if not result.get("error"):
+            self.store(agent.pdf_name, key, agent.agent_name, result)
+        return result, False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "recompute": self.recompute,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,141 @@
+"""Corpus-level claim-to-document routing.
+
+Scores every (claim, document) pair with a cheap lexical and numeric
+relevance measure so that plainly irrelevant pairs can be skipped (or sent to
+a cheap screening step) before any LLM call is made.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+from src.core.block_index import tokenize
+from .document_cache import get_document
+from .document_utils import get_text
+
+logger = logging.getLogger(__name__)
+
+# Routing decisions recorded in study results
+PROCESS = "process"
+SKIP = "skip"
+SCREENED_IN = "screened_in"
+SCREENED_OUT = "screened_out"
+
+# Numbers with optional decimals, percentages and multipliers ("3x", "45 mcg")
+_NUMBER_RE = re.compile(r"(?<![\w.])(\d+(?:\.\d+)?)\s*(%|x\b|×)?", re.IGNORECASE)
+
+
+def extract_numbers(text: str) -> Set[str]:
+    """Normalized numeric tokens ("30%", "3x", "0.5") found in text."""
+    numbers = set()
+    for value, unit in _NUMBER_RE.findall(text):
+        value = value.rstrip("0").rstrip(".") if "." in value else value
+        unit = (unit or "").lower().replace("×", "x")
+        numbers.add(value + unit)
+    return numbers
+
+
+class CorpusRouter:
+    """Lexical/numeric relevance index over a corpus of extracted documents.
+
+    The lexical score is the share of the claim's IDF mass (IDF computed over
+    the corpus) found in the document, so terms every document contains
+    ("vaccine", the product name) count for little and distinctive terms
+    dominate. The numeric score is the share of the claim's numbers that
+    appear in the document. Claims without numbers use the lexical score
+    alone. Documents with too little text to judge (e.g. mostly figures)
+    are never skipped.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        documents: List[str],
+        numeric_weight: float = 0.3,
+        min_document_terms: int = 500,
+    ):
+        """
+        Args:
+            cache_dir: Base cache directory
+            documents: Document names to index
+            numeric_weight: Weight of the numeric score for claims with numbers
+            min_document_terms: Documents with fewer index terms always pass
+        """
+        self.numeric_weight = numeric_weight
+        self.min_document_terms = min_document_terms
+        self.term_counts: Dict[str, Counter] = {}
+        self.numbers: Dict[str, Set[str]] = {}
+
+        for document in documents:
+            content_path = Path(cache_dir) / document / "extracted" / "content.json"
+            try:
+                text = get_text(get_document(content_path).content, include_figures=False)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Cannot index {document} for routing: {e}")
+                continue
+            self.term_counts[document] = Counter(tokenize(text))
+            self.numbers[document] = extract_numbers(text)
+
+        doc_freq: Counter = Counter()
+        for counts in self.term_counts.values():
+            doc_freq.update(counts.keys())
+        n_docs = len(self.term_counts)
+        self.idf = {
+            term: math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+        # Terms absent from the corpus get the maximum IDF
+        self._unseen_idf = math.log(1 + (n_docs + 0.5) / 0.5)
+
+    def score(self, claim: str, document: str) -> Dict[str, Any]:
+        """Relevance of a document to a claim.
+
+        Returns:
+            Dict with the combined "score" (0-1), its "lexical" and "numeric"
+            parts and the claim terms/numbers found in the document
+        """
+        counts = self.term_counts.get(document)
+        if counts is None:
+            # Unindexed documents are never skipped
+            return {"score": 1.0, "lexical": None, "numeric": None, "reason": "document not indexed"}
+        if sum(counts.values()) < self.min_document_terms:
+            return {"score": 1.0, "lexical": None, "numeric": None, "reason": "too little text to route"}
+
+        terms = set(tokenize(claim))
+        total_idf = sum(self.idf.get(t, self._unseen_idf) for t in terms)
+        matched_terms = sorted(t for t in terms if counts.get(t))
+        lexical = sum(self.idf[t] for t in matched_terms) / total_idf if total_idf else 0.0
+
+        claim_numbers = extract_numbers(claim)
+        matched_numbers = sorted(claim_numbers & self.numbers[document])
+        if claim_numbers:
+            numeric = len(matched_numbers) / len(claim_numbers)
+            score = (1 - self.numeric_weight) * lexical + self.numeric_weight * numeric
+        else:
+            numeric = None
+            score = lexical
+
+        return {
+            "score": round(score, 4),
+            "lexical": round(lexical, 4),
+            "numeric": round(numeric, 4) if numeric is not None else None,
+            "matched_terms": matched_terms,
+            "matched_numbers": matched_numbers,
+        }
+
+    def route(self, claim: str, documents: List[str], threshold: float) -> Dict[str, Dict[str, Any]]:
+        """Score a claim against documents and mark those below threshold.
+
+        Returns:
+            Per-document dict with "decision" (process or skip) and the score
+            breakdown
+        """
+        decisions = {}
+        for document in documents:
+            result = self.score(claim, document)
+            result["decision"] = PROCESS if result["score"] >= threshold else SKIP
+            decisions[document] = result
+        return decisions
@@ -0,0 +1,59 @@
+"""Study-wide concurrency budget for agent runs."""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyBudget:
+    """Limit on LLM calls in flight, shared by everything in a study.
+
+    Only leaf work that talks to the gateway holds a slot: one agent run
+    (extractor, multi-claim extractor, completeness checker, screener, one
+    image analysis) or one verifier batch, since the verifier fans out its
+    batches and takes a slot per batch instead of one for the run. Claims and
+    documents are plain coroutines that schedule agent runs, so they never
+    hold a slot while waiting on their children and nesting cannot deadlock
+    or multiply the limit.
+
+    The evidence presenter runs outside the budget: it only formats verified
+    evidence and makes no LLM calls.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Args:
+            limit: Maximum number of LLM-calling runs in flight
+        """
+        self.limit = max(1, limit)
+        self._semaphore = asyncio.Semaphore(self.limit)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.acquired = 0
+        self.total_wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one slot of the budget for the duration of the block."""
+        started = time.perf_counter()
+        async with self._semaphore:
+            self.total_wait_seconds += time.perf_counter() - started
+            self.acquired += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "agent_runs": self.acquired,
+            "peak_in_flight": self.peak_in_flight,
+            "average_wait_seconds": self.total_wait_seconds / self.acquired if self.acquired else 0.0,
+        }
@@ -0,0 +1,159 @@
+"""Process-wide cache of parsed documents shared by all agents.
+
+Every agent of every claim reads the same ``extracted/content.json`` and
+derives the same text, image list and indexes from it. The cache parses each
+document once per process and keeps the derived views alongside it. Entries
+are keyed by path and validated against the file's mtime and size, so a
+re-ingested document is reloaded automatically. Memory is bounded by an LRU
+budget on the size of the cached files.
+
+Cached documents are shared between concurrently running agents and must be
+treated as read-only.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.block_index import BlockIndex
+from src.core.config import settings
+from src.core.quote_locator import QuoteLocator
+from .document_utils import get_images, get_text
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedDocument:
+    """A parsed ``content.json`` with its derived views."""
+
+    path: Path
+    signature: Tuple[int, int]  # (mtime_ns, size) of the file when loaded
+    content: Dict[str, Any]
+    text: str  # Full text in reading order, with figure placeholders
+    images: List[Dict[str, Any]]
+    _block_index: Optional[BlockIndex] = field(default=None, repr=False)
+    _quote_locator: Optional[QuoteLocator] = field(default=None, repr=False)
+    _content_hash: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def extracted_dir(self) -> Path:
+        return self.path.parent
+
+    @property
+    def size(self) -> int:
+        return self.signature[1]
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the ``content.json`` file, computed on first use."""
+        if self._content_hash is None:
+            self._content_hash = hashlib.sha256(self.path.read_bytes()).hexdigest()
+        return self._content_hash
+
+    @property
+    def block_index(self) -> BlockIndex:
+        """BM25 block index, loaded (or rebuilt) on first use."""
+        if self._block_index is None:
+            self._block_index = BlockIndex.for_document(self.content, self.extracted_dir)
+        return self._block_index
+
+    @property
+    def quote_locator(self) -> QuoteLocator:
+        """Character n-gram quote locator, built on first use."""
+        if self._quote_locator is None:
+            self._quote_locator = QuoteLocator(self.content)
+        return self._quote_locator
+
+
+class DocumentCache:
+    """Bounded LRU cache of parsed documents keyed by path."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Budget for the summed size of cached ``content.json``
+                files. The most recently used document is always kept.
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Path, CachedDocument]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path) -> CachedDocument:
+        """Return the parsed document at ``path``, loading it if needed.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not valid JSON
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Parse outside the lock; a concurrent miss on the same file just
+        # loads it twice and the later result wins
+        with open(path, "r") as f:
+            content = json.load(f)
+        entry = CachedDocument(
+            path=path,
+            signature=signature,
+            content=content,
+            text=get_text(content, include_figures=True),
+            images=get_images(content),
+        )
+        logger.debug(f"Loaded document {path} into cache")
+
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[path] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                logger.debug(f"Evicted document {evicted.path} from cache")
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_cache = DocumentCache(max_bytes=int(settings.document_cache_mb * 1024 * 1024))
+
+
+def get_document(path: Path) -> CachedDocument:
+    """Get a parsed ``content.json`` from the process-wide cache."""
+    return _cache.get(path)
+
+
+def get_document_cache() -> DocumentCache:
+    """The process-wide document cache."""
+    return _cache
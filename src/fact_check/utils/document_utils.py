@@ -1,6 +1,11 @@
 """Simple text extraction utilities for fact-checking agents."""
 
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from .document_cache import CachedDocument
 
 
 def get_text(content_json: Dict[str, Any], include_figures: bool = True) -> str:
@@ -42,7 +47,138 @@ def get_text(content_json: Dict[str, Any], include_figures: bool = True) -> str:
     return "\n\n".join(texts)
 
 
+def get_claim_context(
+    document: "CachedDocument",
+    claim: str,
+    mode: Optional[str] = None,
+    top_k: Optional[int] = None,
+    neighbors: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get the document context to send to an agent for a claim.
+    
+    In retrieval mode the claim is looked up in the document's BM25 block
+    index and only the top-k blocks plus their reading-order neighbours are
+    returned. Short documents, claims with no matching blocks and
+    ``mode="full"`` fall back to the full document text.
+    
+    Args:
+        document: Document from the shared document cache
+        claim: Claim text used as the retrieval query
+        mode: "retrieval" or "full" (default: EVIDENCE_CONTEXT_MODE setting)
+        top_k: Blocks to retrieve (default: RETRIEVAL_TOP_K setting)
+        neighbors: Neighbours per retrieved block (default: RETRIEVAL_NEIGHBORS setting)
+        
+    Returns:
+        Dict with the context "text", the "mode" actually used, the
+        "block_ids" included (retrieval only) and "full_text_characters"
+    """
+    mode = mode or settings.evidence_context_mode
+    top_k = top_k if top_k is not None else settings.retrieval_top_k
+    neighbors = neighbors if neighbors is not None else settings.retrieval_neighbors
+    
+    full_text = document.text
+    context = {
+        "text": full_text,
+        "mode": "full",
+        "block_ids": [],
+        "full_text_characters": len(full_text),
+    }
+    
+    if mode != "retrieval" or len(full_text) < settings.retrieval_min_document_chars:
+        return context
+    
+    index = document.block_index
+    hits = index.search(claim, top_k=top_k)
+    if not hits:
+        context["fallback_reason"] = "no matching blocks"
+        return context
+    
+    block_ids = index.expand_neighbors([block_id for block_id, _ in hits], neighbors=neighbors)
+    context.update({
+        "text": index.render(block_ids),
+        "mode": "retrieval",
+        "block_ids": block_ids,
+    })
+    return context
+
 
+def get_claims_context(
+    document: "CachedDocument",
+    claims: List[str],
+    mode: Optional[str] = None,
+    top_k: Optional[int] = None,
+    neighbors: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get one document context covering several claims.
+    
+    In retrieval mode the context is the union of every claim's retrieved
+    blocks. If any claim falls back to the full text, the full text is used
+    for all of them.
+    
+    Args:
+        document: Document from the shared document cache
+        claims: Claim texts used as retrieval queries
+        mode, top_k, neighbors: As for get_claim_context
+        
+    Returns:
+        Context dict in the format of get_claim_context
+    """
+    contexts = [get_claim_context(document, claim, mode, top_k, neighbors) for claim in claims]
+    full = [c for c in contexts if c["mode"] != "retrieval"]
+    if full or not contexts:
+        return full[0] if full else get_claim_context(document, "", mode="full")
+    
+    # Union of the retrieved blocks, back in reading order
+    index = document.block_index
+    block_ids = index.expand_neighbors(
+        {block_id for c in contexts for block_id in c["block_ids"]}, neighbors=0
+    )
+    return {
+        "text": index.render(block_ids),
+        "mode": "retrieval",
+        "block_ids": block_ids,
+        "full_text_characters": len(document.text),
+    }
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+def context_heading(context: Dict[str, Any]) -> str:
+    """Prompt heading for a context returned by get_claim_context."""
+    if context["mode"] == "retrieval":
+        return "DOCUMENT EXCERPTS (passages most relevant to the claim, in reading order; [...] marks omitted text)"
+    return "DOCUMENT"
+
+
+def document_first_prompt(document_text: str, task: str, heading: str = "DOCUMENT") -> str:
+    """
+    Build a prompt that leads with the document and ends with the task.
+    
+    Providers cache prompt prefixes, so the long document text goes first
+    where it is byte-identical across every claim checked against the
+    document. Instructions, the claim and other claim-specific parts follow
+    it.
+    
+    Args:
+        document_text: Document text or excerpts
+        task: Instructions and claim-specific content
+        heading: Heading introducing the document text
+        
+    Returns:
+        Prompt text
+    """
+    return (
+        f"{heading}:\n{document_text}\n\n"
+        f"{'=' * 60}\n"
+        f"END OF DOCUMENT. Use only the document above for the task below.\n"
+        f"{'=' * 60}\n\n"
+        f"{task}"
+    )
 
 
 def get_images(content_json: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -0,0 +1,191 @@
+"""Append-only JSONL journal of study progress.
+
+The study orchestrator appends one line per completed claim as soon as it
+finishes, so a crash or Ctrl-C loses at most the claims still in flight. The
+final results are built by streaming over the journal, and an interrupted
+study resumes from it without redoing finished claims.
+
+Record types (one JSON object per line, discriminated by "type"):
+
+- ``header``: study metadata, written once when the journal is created
+- ``batch_extraction``: the multi-claim extraction runs of one process
+- ``claim``: a claim's full result under "claim_id" and "result"
+
+A claim may appear more than once (e.g. a failed claim retried on resume);
+the last record wins.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StudyJournal:
+    """Reader and writer for one study's JSONL journal."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Journal file; created on the first append if missing
+        """
+        self.path = Path(path)
+        self._warned: Set[int] = set()
+        self._terminate_last_line()
+
+    def _terminate_last_line(self) -> None:
+        """End a line cut short by a crash so new records start on a fresh line."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        with open(self.path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a record and flush it to disk before returning."""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write_header(self, metadata: Dict[str, Any]) -> None:
+        self.append({"type": "header", "metadata": metadata})
+
+    def write_claim(self, claim_id: str, result: Dict[str, Any]) -> None:
+        self.append({"type": "claim", "claim_id": claim_id, "result": result})
+
+    def write_batch_extraction(self, runs: List[Dict[str, Any]]) -> None:
+        self.append({"type": "batch_extraction", "runs": runs})
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def records(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (line number, record) for every complete record.
+
+        A line cut short by a crash is skipped with a warning.
+        """
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError:
+                    if line_number in self._warned:
+                        continue
+                    self._warned.add(line_number)
+                    logger.warning(f"Skipping truncated journal line {line_number + 1} in {self.path}")
+
+    def header(self) -> Optional[Dict[str, Any]]:
+        """Study metadata from the header record, if present."""
+        for _, record in self.records():
+            if record.get("type") == "header":
+                return record["metadata"]
+        return None
+
+    def batch_extraction_runs(self) -> List[Dict[str, Any]]:
+        runs = []
+        for _, record in self.records():
+            if record.get("type") == "batch_extraction":
+                runs.extend(record["runs"])
+        return runs
+
+    def _latest_claim_lines(self) -> Dict[str, int]:
+        """Line number of the last record for each claim, in first-seen order."""
+        latest: Dict[str, int] = {}
+        for line_number, record in self.records():
+            if record.get("type") == "claim":
+                latest[record["claim_id"]] = line_number
+        return latest
+
+    def completed_claims(self) -> Set[str]:
+        """Claims whose latest record finished without a claim-level error."""
+        latest = self._latest_claim_lines()
+        completed = set()
+        for line_number, record in self.records():
+            if record.get("type") == "claim" and latest[record["claim_id"]] == line_number:
+                if "error" not in record["result"]:
+                    completed.add(record["claim_id"])
+        return completed
+
+    def claims(self) -> "JournalClaims":
+        """Read-only mapping of claim id to result that streams from disk."""
+        return JournalClaims(self)
+
+
+class JournalClaims(Mapping):
+    """Claim results in a journal, exposed as a mapping without loading them all.
+
+    ``items()`` and ``values()`` read the journal one record at a time, so
+    summaries and formatters can walk every claim in constant memory. Key
+    lookups scan the file and are meant for occasional use only.
+    """
+
+    def __init__(self, journal: StudyJournal):
+        self.journal = journal
+        self._latest = journal._latest_claim_lines()
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._latest)
+
+    def __getitem__(self, claim_id: str) -> Dict[str, Any]:
+        line = self._latest[claim_id]
+        for line_number, record in self.journal.records():
+            if line_number == line:
+                return record["result"]
+        raise KeyError(claim_id)
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for line_number, record in self.journal.records():
+            if record.get("type") == "claim" and self._latest.get(record["claim_id"]) == line_number:
+                yield record["claim_id"], record["result"]
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        for _, result in self.items():
+            yield result
+
+
+def write_results_json(path: Path, results: Dict[str, Any]) -> None:
+    """Write study results as indented JSON, streaming the "claims" mapping.
+
+    Produces the same layout as ``json.dump(results, f, indent=2)`` while
+    holding only one claim result in memory at a time.
+    """
+    def dump(value: Any, depth: int) -> str:
+        text = json.dumps(value, indent=2)
+        return text.replace("\n", "\n" + "  " * depth)
+
+    with open(path, "w") as f:
+        f.write("{")
+        for i, (key, value) in enumerate(results.items()):
+            f.write("," if i else "")
+            f.write(f"\n  {json.dumps(key)}: ")
+            if key != "claims":
+                f.write(dump(value, 1))
+                continue
+            f.write("{")
+            count = 0
+            for claim_id, claim_result in value.items():
+                f.write("," if count else "")
+                f.write(f"\n    {json.dumps(claim_id)}: {dump(claim_result, 2)}")
+                count += 1
+            f.write("\n  }" if count else "}")
+        f.write("\n}")
@@ -1,66 +1,168 @@
+import asyncio
 import hashlib
 import json
 import logging
-import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 # Local
+from .cache_store import BACKENDS, READ_ERRORS, FilesystemStore, SnapshotStore
 from .config import settings
+from .providers.base import ResponseRequest
 
 logger = logging.getLogger("gateway.cache")
 
+# Request header a caller sets to opt into reuse of a request that carries a
+# ``metadata.nonce`` (the nonce is then left out of the cache key).
+REUSE_HEADER = "X-Solstice-Cache-Reuse"
+# Response header reporting the read-through outcome: hit, miss or bypass.
+STATUS_HEADER = "X-Solstice-Cache"
+
+# Request fields that control transport rather than the response content
+_TRANSPORT_FIELDS = {"stream", "store", "background", "timeout"}
+
+
+def cache_key_data(request: ResponseRequest, reuse: bool = False) -> dict:
+    """Request fields that determine the response, used as the cache key.
+
+    The client's ``metadata.nonce`` (see ``fresh_response``) is part of the
+    key, which makes every such request unique, unless the caller opted into
+    reuse.
+    """
+    data = request.model_dump(exclude_none=True)
+    for field in _TRANSPORT_FIELDS:
+        data.pop(field, None)
+    if reuse and data.get("metadata"):
+        metadata = {k: v for k, v in data["metadata"].items() if k != "nonce"}
+        if metadata:
+            data["metadata"] = metadata
+        else:
+            del data["metadata"]
+    return data
+
+
+def is_deterministic(request: ResponseRequest, reuse: bool = False) -> bool:
+    """Whether a request may be answered from the cache.
+
+    Only temperature-0, non-streaming, stateless requests qualify, and a
+    request carrying a nonce only when the caller opted into reuse.
+    """
+    has_nonce = bool((request.metadata or {}).get("nonce"))
+    return (
+        request.temperature == 0
+        and not request.stream
+        and not request.previous_response_id
+        and (reuse or not has_nonce)
+    )
+
+
+def canonical_hash(cache_data: dict) -> str:
+    """SHA-256 of an order-independent representation of the key data."""
+    # Create a canonical representation that's order-independent
+    def canonicalize(obj):
+        if isinstance(obj, dict):
+            # Sort dict items and recurse
+            items = []
+            for k, v in sorted(obj.items()):
+                items.append(f"{json.dumps(k)}:{canonicalize(v)}")
+            return "{" + ",".join(items) + "}"
+        elif isinstance(obj, list):
+            # For lists, we need to preserve order as it may be semantically important
+            # (e.g., message history order matters), but we still canonicalize contents
+            items = [canonicalize(item) for item in obj]
+            return "[" + ",".join(items) + "]"
+        else:
+            # For primitives, use JSON representation
+            return json.dumps(obj, sort_keys=True)
+
+    canonical_str = canonicalize(cache_data)
+    return hashlib.sha256(canonical_str.encode()).hexdigest()
+
 
 class Cache:
-    """Filesystem-based cache for LLM responses (single-node friendly)."""
+    """Response snapshot cache over a filesystem or SQLite store."""
 
     def __init__(self):
-        # The cache is write-only; files are persisted for audit/debugging
-        # but never read by the application during execution.
+        # By default the cache is write-only; snapshots are persisted for
+        # audit/debugging but never read back. In read-through mode they
+        # also answer deterministic requests, bounded by TTL, entry count
+        # and size.
         self.root: Path = Path(settings.filesystem_cache_dir).expanduser()
         self.cache_enabled = True  # Track if cache is operational
+        self.read_through = settings.cache_read_through
+        self.backend = settings.cache_backend
+        max_bytes = int(settings.cache_max_mb * 1024 * 1024) if settings.cache_max_mb else None
+        limits = (self.root, settings.cache_ttl_seconds, settings.cache_max_entries, max_bytes)
+        if self.backend == "filesystem":
+            self.store: SnapshotStore = FilesystemStore(*limits, indexed=self.read_through)
+        elif self.backend in BACKENDS:
+            self.store = BACKENDS[self.backend](*limits)
+        else:
+            raise ValueError(f"Unknown cache backend {self.backend!r}; expected one of {sorted(BACKENDS)}")
+        self.hits = 0
+        self.misses = 0
+
+        # Snapshots are written by a background writer: a bounded queue
+        # drained in batches on a dedicated store thread, so the event loop
+        # never touches the disk and a slow disk applies backpressure. Every
+        # store call runs on that thread.
+        self.queue_size = settings.cache_writer_queue_size
+        self.batch_size = settings.cache_writer_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.snapshots_written = 0
+        self.backpressure_waits = 0
 
     async def connect(self):
-        """Create cache directory if caching is enabled."""
+        """Create the cache directory and open the store."""
         try:
             self.root.mkdir(parents=True, exist_ok=True)
-            logger.info("Gateway snapshots will be written to %s", self.root)
-        except OSError as exc:
+            self._start_writer()
+            await self._run(self.store.open)
+            logger.info("Gateway snapshots will be written to %s (%s)", self.root, self.backend)
+        except (OSError, sqlite3.Error) as exc:
             self.cache_enabled = False
-            logger.error("Failed to create gateway snapshot dir %s (%s) – snapshots disabled", self.root, exc)
+            logger.error("Failed to open gateway snapshot store in %s (%s) – snapshots disabled", self.root, exc)
+            return
+
+        if self.read_through:
+            await self._run(self.store.evict)
+            logger.info(
+                "Read-through cache enabled: %d entries (ttl=%ss, max_entries=%s, max_bytes=%s)",
+                self.store.entries, self.store.ttl_seconds, self.store.max_entries, self.store.max_bytes,
+            )
+
+    async def flush(self) -> None:
+        """Wait until every queued snapshot has been written."""
+        if self._queue is not None:
+            await self._queue.join()
 
     async def disconnect(self):
-        # Nothing to do for filesystem cache
-        return
+        """Flush pending snapshots, stop the background writer and close the store."""
+        await self.flush()
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+        if self._executor is not None:
+            await self._run(self.store.close)
+            self._executor.shutdown(wait=True)
+        self._queue = None
+        self._writer = None
+        self._executor = None
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _generate_key(self, cache_data: dict) -> str:
-        """Generate deterministic filename from request parameters."""
-        # Create a canonical representation that's order-independent
-        def canonicalize(obj):
-            if isinstance(obj, dict):
-                # Sort dict items and recurse
-                items = []
-                for k, v in sorted(obj.items()):
-                    items.append(f"{json.dumps(k)}:{canonicalize(v)}")
-                return "{" + ",".join(items) + "}"
-            elif isinstance(obj, list):
-                # For lists, we need to preserve order as it may be semantically important
-                # (e.g., message history order matters), but we still canonicalize contents
-                items = [canonicalize(item) for item in obj]
-                return "[" + ",".join(items) + "]"
-            else:
-                # For primitives, use JSON representation
-                return json.dumps(obj, sort_keys=True)
-        
-        canonical_str = canonicalize(cache_data)
-        return hashlib.sha256(canonical_str.encode()).hexdigest()
-
-    def _path_for_key(self, key_hash: str) -> Path:
-        return self.root / f"{key_hash}.json"
+    async def _run(self, fn, *args):
+        """Run a store call on the store thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
 
     # ------------------------------------------------------------------
     # Public API
@@ -70,28 +172,112 @@ class Cache:
         """Check if cache is operational."""
         return self.cache_enabled
 
-    async def set_response(self, cache_data: dict, response: dict):
-        if not self.cache_enabled:
-            return  # Skip caching if disabled due to initialization failure
-            
-        key_hash = self._generate_key(cache_data)
-        path = self._path_for_key(key_hash)
+    async def key_for(self, cache_data: dict) -> str:
+        """Hash request key data off the event loop.
+
+        Key data can hold whole documents and base64 images, so
+        canonicalizing it inline would stall concurrent requests.
+        """
+        return await asyncio.to_thread(canonical_hash, cache_data)
+
+    async def get_response(self, key_hash: str) -> Optional[dict]:
+        """Return the stored response for a request in read-through mode.
+
+        Callers must check ``is_deterministic`` first; this method only
+        looks the key up.
+        """
+        if not (self.cache_enabled and self.read_through):
+            return None
 
         try:
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(response, f)
-            os.utime(path, None)  # update mtime
+            response = await self._run(self.store.read, key_hash)
+        except READ_ERRORS as exc:
+            logger.warning("Cache read error for %s: %s", key_hash[:16], exc)
+            response = None
+
+        if response is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        logger.info("Cache hit for key %s", key_hash[:16])
+        return response
+
+    async def query(
+        self,
+        model: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Metadata of stored snapshots by model and creation time (SQLite backend)."""
+        return await self._run(self.store.query, model, since, until, limit)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "read_through": self.read_through,
+            "entries": self.store.entries,
+            "bytes": self.store.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "write_queue": self._queue.qsize() if self._queue is not None else 0,
+            "snapshots_written": self.snapshots_written,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
+    async def set_response(self, key_hash: str, response: dict):
+        """Queue a response snapshot for the background writer.
+
+        Returns as soon as the snapshot is queued. When the queue is full the
+        caller waits for the writer to catch up instead of growing memory.
+        """
+        if not self.cache_enabled or self._queue is None:
+            return  # Skip caching if disabled or not connected
+
+        if self._queue.full():
+            self.backpressure_waits += 1
+            logger.warning("Snapshot queue full (%d pending); waiting for the writer", self._queue.qsize())
+        await self._queue.put((key_hash, response))
+
+    # ------------------------------------------------------------------
+    # Background writer
+    # ------------------------------------------------------------------
+
+    def _start_writer(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-store")
+        self._writer = asyncio.create_task(self._run_writer())
+
+    async def _run_writer(self) -> None:
+        """Drain the queue in batches, writing each batch on the store thread."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                written = await self._run(self._write_batch, batch)
+                self.snapshots_written += len(written)
+            except Exception as exc:  # noqa: BLE001 – keep the writer alive
+                logger.error("Snapshot batch of %d failed: %s", len(batch), exc)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: list[tuple[str, dict]]) -> list[tuple[str, int]]:
+        """Write a batch and apply the read-through limits (runs on the store thread)."""
+        written = self.store.write(batch)
+        for key_hash, _ in written:
             logger.info("Cached response under key %s", key_hash[:16])
-        except OSError as exc:
-            logger.error("Cache write error for %s: %s", path, exc)
-            # Don't disable cache for individual write failures, as they might be transient
+        if self.read_through:
+            self.store.evict()
+        return written
 
     # ------------------------------------------------------------------
     # Maintenance helpers
     # ------------------------------------------------------------------
 
     async def clear(self) -> None:
-        """Remove all cache entries on the local filesystem.
+        """Remove all cache entries.
 
         This is primarily intended for test suites and administrative tools
         that need to ensure a clean slate between runs.  The method is a no-op
@@ -99,23 +285,15 @@ class Cache:
         on the `enabled` flag.
         """
 
-        # Ensure the root directory exists.  We purposefully *do not* create
-        # it when missing – if the cache has never been initialised there's
-        # nothing to clear.
-        if not self.root.exists():
+        # We purposefully *do not* create the root directory when missing –
+        # if the cache has never been initialised there's nothing to clear.
+        if not self.root.exists() or not self.cache_enabled:
             return
+        if self._executor is None:
+            await self.connect()
 
-        # Iterate over all files with the expected `.json` suffix and attempt
-        # to delete them.  We isolate each deletion so that a single failure
-        # (e.g. a permissions error on one file) does not abort the entire
-        # cleanup.  Any exception is logged on DEBUG level only – callers that
-        # require stronger guarantees should remove the directory tree
-        # themselves.
-        for entry in list(self.root.glob("*.json")):
-            try:
-                entry.unlink(missing_ok=True)
-            except OSError as exc:
-                logger.debug("Failed to delete cache file %s: %s", entry, exc)
+        await self.flush()
+        await self._run(self.store.clear)
 
         # Optionally remove empty cache directory to keep workspace tidy.
         try:
@@ -127,6 +305,5 @@ class Cache:
             pass
 
 
-
 # Global cache instance
 cache = Cache()
@@ -0,0 +1,379 @@
+"""Storage backends for gateway response snapshots.
+
+``Cache`` runs every store method on its single store thread, so stores need
+no locking of their own. Two backends are available (``SOLSTICE_CACHE_BACKEND``):
+
+- ``filesystem``: one JSON file per response in a flat directory; easy to
+  inspect, but slow to list and index once it holds many thousands of files.
+- ``sqlite``: one table in ``snapshots.sqlite3`` with zlib-compressed bodies
+  and indexed key, model, created time, size and hit count columns.
+
+The TTL and size limits only apply in read-through mode: ``Cache`` calls
+``evict()`` only then. Write-only snapshots are an audit trail and are kept
+until the cache directory is cleaned up by hand.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger("gateway.cache")
+
+# Errors a store may raise when a single snapshot cannot be read
+READ_ERRORS = (OSError, ValueError, zlib.error, sqlite3.Error)
+
+
+class SnapshotStore(ABC):
+    """Persistent key -> response storage with TTL and size-budget eviction."""
+
+    def __init__(
+        self,
+        root: Path,
+        ttl_seconds: Optional[int],
+        max_entries: Optional[int],
+        max_bytes: Optional[int],
+    ):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Kept current by the store so stats can be read from any thread
+        self.entries = 0
+        self.bytes = 0
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created > self.ttl_seconds
+
+    @abstractmethod
+    def open(self) -> None:
+        """Prepare the store; the root directory already exists."""
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+
+    @abstractmethod
+    def write(self, snapshots: list[tuple[str, dict]]) -> list[tuple[str, int]]:
+        """Store (key hash, response) pairs.
+
+        Returns:
+            (key hash, stored size) of every snapshot written
+        """
+
+    @abstractmethod
+    def read(self, key_hash: str) -> Optional[dict]:
+        """Return a live snapshot and count the hit, or None on a miss."""
+
+    @abstractmethod
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones over the limits.
+
+        Returns:
+            Number of entries removed
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every snapshot."""
+
+    def query(
+        self,
+        model: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Entry metadata filtered by model and creation time, newest first."""
+        raise NotImplementedError(f"{type(self).__name__} does not support queries; use SOLSTICE_CACHE_BACKEND=sqlite")
+
+
+class FilesystemStore(SnapshotStore):
+    """One ``<key>.json`` file per snapshot.
+
+    The in-memory index (needed for lookups and eviction) is only built when
+    ``indexed`` is set; in write-only mode the files are just written.
+    """
+
+    def __init__(self, *args, indexed: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.indexed = indexed
+        # key hash -> (size in bytes, created timestamp), least recently used first
+        self._index: "OrderedDict[str, tuple[int, float]]" = OrderedDict()
+
+    def _path_for_key(self, key_hash: str) -> Path:
+        return self.root / f"{key_hash}.json"
+
+    def _sync_totals(self) -> None:
+        self.entries = len(self._index)
+
+    def open(self) -> None:
+        """Index existing snapshots, oldest first, from their mtimes and sizes."""
+        if not self.indexed:
+            return
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path.stem, st.st_size))
+        self._index.clear()
+        self.bytes = 0
+        for mtime, key_hash, size in sorted(entries):
+            self._index[key_hash] = (size, mtime)
+            self.bytes += size
+        self._sync_totals()
+
+    def _remove(self, key_hash: str) -> None:
+        size, _ = self._index.pop(key_hash, (0, 0.0))
+        self.bytes -= size
+        try:
+            self._path_for_key(key_hash).unlink(missing_ok=True)
+        except OSError as exc:
+            logger.debug("Failed to delete cache file for %s: %s", key_hash[:16], exc)
+
+    def write(self, snapshots: list[tuple[str, dict]]) -> list[tuple[str, int]]:
+        written = []
+        for key_hash, response in snapshots:
+            path = self._path_for_key(key_hash)
+            try:
+                with path.open("w", encoding="utf-8") as f:
+                    json.dump(response, f)
+                os.utime(path, None)  # update mtime
+                size = path.stat().st_size
+            except OSError as exc:
+                logger.error("Cache write error for %s: %s", path, exc)
+                # Don't disable cache for individual write failures, as they might be transient
+                continue
+            written.append((key_hash, size))
+            if self.indexed:
+                previous = self._index.pop(key_hash, None)
+                if previous is not None:
+                    self.bytes -= previous[0]
+                self._index[key_hash] = (size, time.time())
+                self.bytes += size
+        self._sync_totals()
+        return written
+
+    def read(self, key_hash: str) -> Optional[dict]:
+        entry = self._index.get(key_hash)
+        if entry is None or self._expired(entry[1]):
+            if entry is not None:
+                self._remove(key_hash)
+                self._sync_totals()
+            return None
+        try:
+            with self._path_for_key(key_hash).open("r", encoding="utf-8") as f:
+                response = json.load(f)
+        except READ_ERRORS:
+            self._remove(key_hash)
+            self._sync_totals()
+            raise
+        self._index.move_to_end(key_hash)
+        return response
+
+    def evict(self) -> int:
+        removed = 0
+        for key_hash, (_, created) in list(self._index.items()):
+            if self._expired(created):
+                self._remove(key_hash)
+                removed += 1
+        while self._index and (
+            (self.max_entries is not None and len(self._index) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._index)))
+            removed += 1
+        self._sync_totals()
+        return removed
+
+    def clear(self) -> None:
+        self._index.clear()
+        self.bytes = 0
+        self._sync_totals()
+        # Isolate each deletion so a single failure (e.g. a permissions
+        # error on one file) does not abort the entire cleanup
+        for entry in list(self.root.glob("*.json")):
+            try:
+                entry.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.debug("Failed to delete cache file %s: %s", entry, exc)
+
+
+class SQLiteStore(SnapshotStore):
+    """Snapshots in a single SQLite table with compressed bodies.
+
+    ``size`` is the compressed body size, so the byte budget tracks disk
+    usage. ``last_used`` orders LRU eviction; ``hits`` counts read-through
+    hits per entry. Entry and byte totals are counted once on open and then
+    updated from the sizes of the rows each write or delete touches.
+    """
+
+    FILENAME = "snapshots.sqlite3"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS snapshots (
+            key TEXT PRIMARY KEY,
+            model TEXT,
+            created REAL NOT NULL,
+            last_used REAL NOT NULL,
+            size INTEGER NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0,
+            body BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS snapshots_model_created ON snapshots (model, created);
+        CREATE INDEX IF NOT EXISTS snapshots_created ON snapshots (created);
+        CREATE INDEX IF NOT EXISTS snapshots_last_used ON snapshots (last_used);
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.path = self.root / self.FILENAME
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def open(self) -> None:
+        self._conn = sqlite3.connect(self.path)
+        # WAL lets admin tools read the database while the gateway writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._sync_totals()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _sync_totals(self) -> None:
+        self.entries, self.bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM snapshots"
+        ).fetchone()
+
+    def write(self, snapshots: list[tuple[str, dict]]) -> list[tuple[str, int]]:
+        now = time.time()
+        rows = []
+        for key_hash, response in snapshots:
+            body = zlib.compress(json.dumps(response).encode("utf-8"))
+            rows.append((key_hash, response.get("model"), now, now, len(body), body))
+        # Final size per key; a key may repeat within a batch
+        sizes = {row[0]: row[4] for row in rows}
+        # One transaction per batch
+        with self._conn:
+            replaced = dict(self._conn.execute(
+                f"SELECT key, size FROM snapshots WHERE key IN ({', '.join('?' * len(sizes))})", list(sizes)
+            ))
+            self._conn.executemany(
+                """
+                INSERT INTO snapshots (key, model, created, last_used, size, body)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    model = excluded.model,
+                    created = excluded.created,
+                    last_used = excluded.last_used,
+                    size = excluded.size,
+                    body = excluded.body
+                """,
+                rows,
+            )
+        self.entries += len(sizes) - len(replaced)
+        self.bytes += sum(sizes.values()) - sum(replaced.values())
+        return [(row[0], row[4]) for row in rows]
+
+    def _delete(self, rows: list[tuple[str, int]]) -> None:
+        """Delete (key, size) rows and take them off the totals."""
+        with self._conn:
+            self._conn.executemany("DELETE FROM snapshots WHERE key = ?", [(key,) for key, _ in rows])
+        self.entries -= len(rows)
+        self.bytes -= sum(size for _, size in rows)
+
+    def read(self, key_hash: str) -> Optional[dict]:
+        row = self._conn.execute("SELECT created, size, body FROM snapshots WHERE key = ?", (key_hash,)).fetchone()
+        if row is None:
+            return None
+        created, size, body = row
+        if self._expired(created):
+            self._delete([(key_hash, size)])
+            return None
+        try:
+            response = json.loads(zlib.decompress(body))
+        except READ_ERRORS:
+            self._delete([(key_hash, size)])
+            raise
+        with self._conn:
+            self._conn.execute(
+                "UPDATE snapshots SET hits = hits + 1, last_used = ? WHERE key = ?", (time.time(), key_hash)
+            )
+        return response
+
+    def evict(self) -> int:
+        removed = 0
+        if self.ttl_seconds is not None:
+            cutoff = time.time() - self.ttl_seconds
+            with self._conn:
+                count, size = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM snapshots WHERE created < ?", (cutoff,)
+                ).fetchone()
+                if count:
+                    self._conn.execute("DELETE FROM snapshots WHERE created < ?", (cutoff,))
+            self.entries -= count
+            self.bytes -= size
+            removed += count
+
+        excess_entries = self.entries - self.max_entries if self.max_entries is not None else 0
+        excess_bytes = self.bytes - self.max_bytes if self.max_bytes is not None else 0
+        if excess_entries > 0 or excess_bytes > 0:
+            victims = []
+            freed = 0
+            for key_hash, size in self._conn.execute("SELECT key, size FROM snapshots ORDER BY last_used"):
+                if len(victims) >= excess_entries and freed >= excess_bytes:
+                    break
+                victims.append((key_hash, size))
+                freed += size
+            self._delete(victims)
+            removed += len(victims)
+        return removed
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM snapshots")
+        self.entries = self.bytes = 0
+
+    def query(
+        self,
+        model: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        clauses, params = [], []
+        if model is not None:
+            clauses.append("model = ?")
+            params.append(model)
+        if since is not None:
+            clauses.append("created >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT key, model, created, last_used, size, hits FROM snapshots {where} "
+            "ORDER BY created DESC LIMIT ?",
+            (*params, limit),
+        )
+        columns = ("key", "model", "created", "last_used", "size", "hits")
+        return [dict(zip(columns, row)) for row in rows]
+
+
+BACKENDS: dict[str, type[SnapshotStore]] = {
+    "filesystem": FilesystemStore,
+    "sqlite": SQLiteStore,
+}
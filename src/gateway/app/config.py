@@ -26,9 +26,45 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = Field("INFO", alias="SOLSTICE_LOG_LEVEL")
 
-    # Gateway cache directory – write-only snapshots, never read by runtime
+    # Gateway cache directory – response snapshots (read only in read-through mode)
     filesystem_cache_dir: str = Field("data/gateway_cache", alias="FILESYSTEM_CACHE_DIR")
 
+    # Snapshot store: "filesystem" (one JSON file per response) or "sqlite"
+    # (indexed, compressed bodies in <cache dir>/snapshots.sqlite3)
+    cache_backend: str = Field("filesystem", alias="SOLSTICE_CACHE_BACKEND")
+
+    # Opt-in read-through mode: deterministic requests (temperature 0, no
+    # nonce, no previous_response_id) are answered from stored snapshots.
+    # The limits below only apply in this mode; unset means unbounded.
+    cache_read_through: bool = Field(False, alias="SOLSTICE_CACHE_READ_THROUGH")
+    cache_ttl_seconds: int | None = Field(3600, alias="SOLSTICE_CACHE_TTL")
+    cache_max_entries: int | None = Field(10_000, alias="SOLSTICE_CACHE_MAX_ENTRIES")
+    cache_max_mb: float | None = Field(1024, alias="SOLSTICE_CACHE_MAX_MB")
+
+    # Background snapshot writer: pending snapshots before request handlers
+    # wait (backpressure), and snapshots written per batch
+    cache_writer_queue_size: int = Field(256, alias="SOLSTICE_CACHE_WRITER_QUEUE")
+    cache_writer_batch_size: int = Field(32, alias="SOLSTICE_CACHE_WRITER_BATCH")
+
+    # Provider retry policy: attempts per call, decorrelated-jitter back-off
+    # bounds, and the deadline (seconds, retries included) for calls whose
+    # request sets no timeout of its own
+    retry_attempts: int = Field(3, alias="SOLSTICE_RETRY_ATTEMPTS")
+    retry_backoff_seconds: float = Field(0.5, alias="SOLSTICE_RETRY_BACKOFF")
+    retry_max_backoff_seconds: float = Field(30.0, alias="SOLSTICE_RETRY_MAX_BACKOFF")
+    retry_deadline_seconds: float = Field(600.0, alias="SOLSTICE_RETRY_DEADLINE")
+
+    # Circuit breaker: consecutive upstream failures that open the circuit
+    # (unset disables it) and seconds before a probe is let through
+    circuit_failure_threshold: int | None = Field(5, alias="SOLSTICE_CIRCUIT_FAILURES")
+    circuit_reset_seconds: float = Field(30.0, alias="SOLSTICE_CIRCUIT_RESET")
+
+    # Adaptive concurrency limit on upstream calls (AIMD): starting value
+    # and bounds
+    concurrency_initial_limit: int = Field(16, alias="SOLSTICE_CONCURRENCY_INITIAL")
+    concurrency_min_limit: int = Field(1, alias="SOLSTICE_CONCURRENCY_MIN")
+    concurrency_max_limit: int = Field(256, alias="SOLSTICE_CONCURRENCY_MAX")
+
     model_config = {
         "env_file": ".env",
         "case_sensitive": False,
@@ -4,18 +4,101 @@ import sys
 import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
-from .cache import cache
+from . import metrics
+from .cache import REUSE_HEADER, STATUS_HEADER, cache, cache_key_data, is_deterministic
 from .config import settings
+from .middleware.concurrency import AdaptiveLimiter, ConcurrencyLimitedProvider
 from .middleware.logging import LoggingMiddleware, log_llm_request, log_llm_response
-from .middleware.retry import RetryableProvider
+from .middleware.retry import CircuitOpenError, RetryableProvider
 from .openai_client import validate_api_key, OpenAIClientError
 from .providers import OpenAIProvider, ResponseRequest
+from .singleflight import singleflight
 
 # Provider instances
 providers = {}
 
+# Adaptive limit on concurrent upstream calls, shared by all providers
+limiter = AdaptiveLimiter(
+    initial_limit=settings.concurrency_initial_limit,
+    min_limit=settings.concurrency_min_limit,
+    max_limit=settings.concurrency_max_limit,
+)
+
+
+# ---------------------------------------------------------------------------
+# Scrape-time metrics read from the components that already keep the counts
+# ---------------------------------------------------------------------------
+
+_CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def _retry_stats() -> dict:
+    return {
+        name: provider.stats()
+        for name, provider in providers.items()
+        if isinstance(provider, RetryableProvider)
+    }
+
+
+metrics.registry.collect(
+    "solstice_gateway_retries_total", "Provider call retries by provider and reason", "counter",
+    lambda: {
+        (name, reason): count
+        for name, stats in _retry_stats().items()
+        for reason, count in stats["retries_by_reason"].items()
+    },
+    ("provider", "reason"),
+)
+metrics.registry.collect(
+    "solstice_gateway_retry_delay_seconds_total", "Seconds spent waiting between retries", "counter",
+    lambda: {(name,): stats["retry_delay_seconds"] for name, stats in _retry_stats().items()},
+    ("provider",),
+)
+metrics.registry.collect(
+    "solstice_gateway_circuit_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)", "gauge",
+    lambda: {(name,): _CIRCUIT_STATES[stats["circuit"]["state"]] for name, stats in _retry_stats().items()},
+    ("provider",),
+)
+metrics.registry.collect(
+    "solstice_gateway_cache_hits_total", "Read-through cache hits", "counter", lambda: cache.hits
+)
+metrics.registry.collect(
+    "solstice_gateway_cache_misses_total", "Read-through cache misses", "counter", lambda: cache.misses
+)
+metrics.registry.collect(
+    "solstice_gateway_cache_writes_total", "Response snapshots written", "counter",
+    lambda: cache.snapshots_written,
+)
+metrics.registry.collect(
+    "solstice_gateway_cache_entries", "Snapshots in the cache index", "gauge", lambda: cache.stats()["entries"]
+)
+metrics.registry.collect(
+    "solstice_gateway_cache_write_queue", "Snapshots waiting for the writer", "gauge",
+    lambda: cache.stats()["write_queue"],
+)
+metrics.registry.collect(
+    "solstice_gateway_coalesced_total", "Requests that joined an identical in-flight call", "counter",
+    lambda: singleflight.coalesced,
+)
+metrics.registry.collect(
+    "solstice_gateway_concurrency_limit", "Current adaptive concurrency limit", "gauge",
+    lambda: limiter.stats()["limit"],
+)
+metrics.registry.collect(
+    "solstice_gateway_concurrency_in_flight", "Upstream calls in flight", "gauge", lambda: limiter.in_flight
+)
+metrics.registry.collect(
+    "solstice_gateway_concurrency_queue_depth", "Upstream calls waiting for a slot", "gauge",
+    limiter.queue_depth,
+)
+metrics.registry.collect(
+    "solstice_gateway_concurrency_wait_seconds_total", "Seconds upstream calls spent queued", "counter",
+    lambda: limiter.total_wait_seconds,
+)
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -26,11 +109,20 @@ async def lifespan(app: FastAPI):
     # Startup
     await cache.connect()
 
-    # Initialize providers with retry wrapper
+    # Initialize providers with retry wrapper; every attempt takes a
+    # concurrency slot, back-off waits between attempts do not
     try:
         if validate_api_key():
             logger.debug("Creating OpenAI provider")
-            providers["openai"] = RetryableProvider(OpenAIProvider())
+            providers["openai"] = RetryableProvider(
+                ConcurrencyLimitedProvider(OpenAIProvider(), limiter),
+                attempts=settings.retry_attempts,
+                backoff=settings.retry_backoff_seconds,
+                max_backoff=settings.retry_max_backoff_seconds,
+                deadline=settings.retry_deadline_seconds,
+                failure_threshold=settings.circuit_failure_threshold,
+                reset_timeout=settings.circuit_reset_seconds,
+            )
             logger.debug(f"Provider created: {providers}")
     except OpenAIClientError as e:
         logger.warning(f"OpenAI client error: {e}")
@@ -48,7 +140,8 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # Shutdown
+    # Shutdown: write out queued snapshots before stopping the writer
+    await cache.flush()
     await cache.disconnect()
 
 
@@ -72,6 +165,14 @@ async def health():
         "status": "healthy" if healthy else "unhealthy",
         "providers": list(providers.keys()),
         "cache_enabled": cache.cache_enabled,
+        "cache": cache.stats(),
+        "coalescing": singleflight.stats(),
+        "concurrency": limiter.stats(),
+        "retries": {
+            name: provider.stats()
+            for name, provider in providers.items()
+            if isinstance(provider, RetryableProvider)
+        },
         "api_version": "responses",
     }
 
@@ -82,8 +183,29 @@ async def health():
     return payload
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text exposition of gateway metrics."""
+    return Response(content=metrics.registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/v1/cache/entries")
+async def list_cache_entries(
+    model: str | None = None,
+    since: float | None = None,
+    until: float | None = None,
+    limit: int = 100,
+):
+    """List stored snapshots by model and creation time (Unix seconds)."""
+    try:
+        entries = await cache.query(model=model, since=since, until=until, limit=limit)
+    except NotImplementedError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    return {"backend": cache.backend, "entries": entries}
+
+
 @app.post("/v1/responses")
-async def create_response(request: Request, body: dict):
+async def create_response(request: Request, body: dict, http_response: Response):
     """Main response creation endpoint using the Responses API."""
     request_id = request.state.request_id
 
@@ -106,33 +228,40 @@ async def create_response(request: Request, body: dict):
         request_id, provider_name, response_request.model, response_request.model_dump()
     )
 
-    # Prepare cache key for write-only snapshot (non-streaming, non-stateful requests)
-    cache_key = None
-    if not response_request.stream and not response_request.previous_response_id:
-        # Create cache key from request
-        cache_data = {
-            "model": response_request.model,
-            "input": response_request.input,
-            "instructions": response_request.instructions,
-            "tools": response_request.tools,
-            "temperature": response_request.temperature,
-        }
-        # Note: Cache is write-only for audit/debugging purposes
-        cache_key = cache_data
-
-    # Check if streaming was requested and reject it
+    # Prepare cache key for the snapshot (non-stateful requests). Streamed
+    # and non-streamed requests share a key; only the latter are read back.
+    # The caller's nonce is only left out of the key when it opts into reuse.
+    reuse = request.headers.get(REUSE_HEADER, "").lower() in ("1", "true", "yes")
+    key_hash = None
+    cache_status = "bypass"
+    if not response_request.previous_response_id:
+        key_hash = await cache.key_for(cache_key_data(response_request, reuse))
+
+        # Read-through mode answers deterministic requests from the cache
+        if cache.read_through and is_deterministic(response_request, reuse):
+            cached = await cache.get_response(key_hash)
+            if cached is not None:
+                metrics.requests_total.inc(response_request.model, "cache_hit")
+                http_response.headers[STATUS_HEADER] = "hit"
+                return cached
+            cache_status = "miss"
+
     if response_request.stream:
-        raise HTTPException(
-            status_code=400, 
-            detail="Streaming is not supported by this gateway"
-        )
+        return await _stream_response(request_id, provider_name, provider, response_request, key_hash)
 
     # Non-streaming response
     start_time = time.time()
 
     try:
         logger.debug("Calling provider.create_response")
-        response = await provider.create_response(response_request)
+        if key_hash is not None:
+            # Identical requests already in flight share one upstream call
+            response, coalesced = await singleflight.do(
+                key_hash,
+                lambda: provider.create_response(response_request),
+            )
+        else:
+            response, coalesced = await provider.create_response(response_request), False
         logger.debug("Got response back from provider")
         duration = time.time() - start_time
 
@@ -150,16 +279,107 @@ async def create_response(request: Request, body: dict):
             duration,
         )
 
-        # Cache response if applicable
-        if cache_key and not response_request.previous_response_id:
-            await cache.set_response(cache_key, response_dict)
+        # Tokens and latency are counted once per upstream call
+        if coalesced:
+            metrics.requests_total.inc(response_request.model, "coalesced")
+        else:
+            metrics.requests_total.inc(response_request.model, "upstream")
+            metrics.request_duration.observe(duration, response_request.model, "false")
+            metrics.record_usage(response_request.model, response_dict.get("usage"))
+
+        # Cache response if applicable; the first of a coalesced group writes it
+        if key_hash and not coalesced and not response_request.previous_response_id:
+            await cache.set_response(key_hash, response_dict)
 
+        http_response.headers[STATUS_HEADER] = cache_status
         return response_dict
 
+    except CircuitOpenError as e:
+        metrics.record_failure(response_request.model, e)
+        raise _service_unavailable(e)
     except Exception as e:
+        metrics.record_failure(response_request.model, e)
         raise HTTPException(status_code=500, detail=f"Provider error: {e!s}")
 
 
+def _service_unavailable(error: CircuitOpenError) -> HTTPException:
+    """503 telling the client when the open circuit will let calls through."""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(max(1, round(error.retry_after)))},
+    )
+
+
+def _format_sse(event: dict) -> str:
+    """Encode a Responses API event as a server-sent event."""
+    return f"event: {event.get('type', 'message')}\ndata: {json.dumps(event)}\n\n"
+
+
+async def _stream_response(
+    request_id: str,
+    provider_name: str,
+    provider,
+    response_request: ResponseRequest,
+    key_hash: str | None,
+) -> StreamingResponse:
+    """Relay provider events as SSE and snapshot the completed response."""
+    start_time = time.time()
+    events = provider.stream_response(response_request)
+
+    # Wait for the first event so that failures to start the stream still
+    # surface as a proper HTTP error instead of a truncated 200
+    try:
+        first = await anext(events, None)
+    except CircuitOpenError as e:
+        metrics.record_failure(response_request.model, e)
+        raise _service_unavailable(e)
+    except Exception as e:
+        metrics.record_failure(response_request.model, e)
+        raise HTTPException(status_code=500, detail=f"Provider error: {e!s}")
+
+    async def relay():
+        completed = None
+        event = first
+        try:
+            while event is not None:
+                if event.get("type") == "response.completed":
+                    completed = event.get("response")
+                yield _format_sse(event)
+                event = await anext(events, None)
+        except Exception as e:
+            logger.error(f"[request {request_id}] Stream failed: {e!s}")
+            metrics.record_failure(response_request.model, e)
+            yield _format_sse({"type": "error", "message": f"Provider error: {e!s}"})
+            return
+        finally:
+            # Close the provider stream now, releasing its concurrency slot,
+            # even when the client disconnected mid-stream
+            await events.aclose()
+
+        if completed is None:
+            return
+        duration = time.time() - start_time
+        log_llm_response(
+            request_id,
+            provider_name,
+            response_request.model,
+            completed,
+            duration,
+        )
+        metrics.requests_total.inc(response_request.model, "upstream")
+        metrics.request_duration.observe(duration, response_request.model, "true")
+        metrics.record_usage(response_request.model, completed.get("usage"))
+        if key_hash:
+            await cache.set_response(key_hash, completed)
+
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={STATUS_HEADER: "bypass", "Cache-Control": "no-cache"},
+    )
+
+
 @app.get("/v1/responses/{response_id}")
 async def retrieve_response(response_id: str):
     """Retrieve a stored response."""
@@ -217,9 +437,9 @@ async def get_api_info():
             "streaming": {
                 "supported": True,
                 "event_types": [
-                    "response.text.delta",
-                    "response.text.done",
-                    "response.done",
+                    "response.output_text.delta",
+                    "response.output_text.done",
+                    "response.completed",
                     "error",
                 ],
             },
@@ -0,0 +1,214 @@
+"""Prometheus-style metrics for the gateway.
+
+Counters and histograms are plain dicts of numbers keyed by label values.
+They are only updated from the event loop thread, so no locks are needed and
+recording a sample costs a dict lookup and an addition. State that other
+components already track (cache, retries, concurrency limit) is read when
+``/metrics`` is scraped instead of being duplicated on the hot path.
+
+``render()`` produces the Prometheus text exposition format (0.0.4).
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# Upstream LLM latency spans sub-second cache-warm calls to multi-minute
+# reasoning runs
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0, math.inf)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[Any, ...]) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels: Any, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets if buckets[-1] == math.inf else (*buckets, math.inf)
+        # labels -> [per-bucket counts (non-cumulative), sum]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labels: Any) -> None:
+        entry = self._values.get(labels)
+        if entry is None:
+            entry = self._values[labels] = [[0] * len(self.buckets), 0.0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def samples(self) -> Iterable[str]:
+        for labels, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                bucket_labels = _format_labels((*self.labels, "le"), (*labels, _format_value(bound)))
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            label_text = _format_labels(self.labels, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(total)}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class Collected:
+    """Metric whose values are read from a callback at scrape time.
+
+    The callback returns a mapping of label-value tuples to numbers, or a
+    single number for an unlabelled metric.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        collect: Callable[[], Any],
+        labels: tuple[str, ...] = (),
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labels = labels
+        self._collect = collect
+
+    def samples(self) -> Iterable[str]:
+        values = self._collect()
+        if not isinstance(values, dict):
+            values = {(): values}
+        for labels, value in values.items():
+            if value is None:
+                continue
+            yield f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+
+
+class Registry:
+    """Named metrics rendered together for ``/metrics``."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram | Collected] = {}
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: tuple[str, ...] = (), **kwargs) -> Histogram:
+        return self.register(Histogram(name, help, labels, **kwargs))
+
+    def collect(
+        self, name: str, help: str, kind: str, fn: Callable[[], Any], labels: tuple[str, ...] = ()
+    ) -> Collected:
+        return self.register(Collected(name, help, kind, fn, labels))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Gateway metrics recorded on the request path
+# ---------------------------------------------------------------------------
+
+registry = Registry()
+
+requests_total = registry.counter(
+    "solstice_gateway_requests_total",
+    "Responses requests by model and outcome (upstream, coalesced, cache_hit, error)",
+    ("model", "outcome"),
+)
+request_duration = registry.histogram(
+    "solstice_gateway_request_duration_seconds",
+    "Time to a complete response for requests served upstream",
+    ("model", "stream"),
+)
+tokens_total = registry.counter(
+    "solstice_gateway_tokens_total",
+    "Tokens reported by the provider, by model and type (input, cached_input, output, reasoning)",
+    ("model", "type"),
+)
+errors_total = registry.counter(
+    "solstice_gateway_errors_total",
+    "Failed responses requests by model and reason (HTTP status or error type)",
+    ("model", "reason"),
+)
+
+
+def error_reason(exc: BaseException) -> str:
+    """Label for a failure: the upstream HTTP status or the exception type."""
+    status = getattr(exc, "status_code", None)
+    return str(status) if status is not None else type(exc).__name__
+
+
+def record_failure(model: str, exc: BaseException) -> None:
+    requests_total.inc(model, "error")
+    errors_total.inc(model, error_reason(exc))
+
+
+def record_usage(model: str, usage: dict | None) -> None:
+    """Count the tokens in a Responses API ``usage`` object."""
+    if not usage:
+        return
+    input_details = usage.get("input_tokens_details") or {}
+    output_details = usage.get("output_tokens_details") or {}
+    for token_type, value in (
+        ("input", usage.get("input_tokens")),
+        ("cached_input", input_details.get("cached_tokens")),
+        ("output", usage.get("output_tokens")),
+        ("reasoning", output_details.get("reasoning_tokens")),
+    ):
+        if value:
+            tokens_total.inc(model, token_type, amount=value)
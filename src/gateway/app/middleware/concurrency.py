@@ -0,0 +1,252 @@
+"""Adaptive limit on concurrent upstream calls.
+
+Fanning every incoming request straight out to OpenAI makes bursts hit the
+provider's rate limits, and each 429 then costs a retry. The limiter keeps
+the number of in-flight upstream calls under a limit it learns with AIMD:
+
+- every successful call while the limit is in use raises it by ``1/limit``
+  (about +1 per limit's worth of calls);
+- an overload signal (429, 503/504, a time-out) or a latency spike (short-term
+  latency above ``latency_tolerance`` times the long-term average) multiplies
+  it by ``backoff_ratio``, at most once per ``decrease_interval``.
+
+Calls over the limit wait in per-flow FIFO queues (one flow per model) that
+are served round-robin, so a burst for one model cannot starve the others.
+A caller that sets ``queue_state`` can tell whether a call it timed out was
+still waiting here, i.e. never reached the provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
+from typing import Any
+
+import openai
+
+from ..providers.base import Provider, ResponseObject, ResponseRequest
+
+logger = logging.getLogger("gateway.concurrency")
+
+# Upstream responses that mean "slow down"
+OVERLOAD_STATUS = frozenset({429, 503, 504})
+
+
+def is_overload(exc: BaseException) -> bool:
+    """Whether a failed call signals that the upstream is saturated."""
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status in OVERLOAD_STATUS
+    return isinstance(exc, (openai.APITimeoutError, TimeoutError))
+
+
+class QueueState:
+    """Whether the current call is waiting for a limiter slot."""
+
+    __slots__ = ("waiting",)
+
+    def __init__(self) -> None:
+        self.waiting = False
+
+
+# Set by callers around a provider call. The task ``asyncio.wait_for`` runs
+# the call in copies the context, so it updates the caller's object.
+queue_state: ContextVar[QueueState | None] = ContextVar("queue_state", default=None)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit with round-robin fair queueing across flows."""
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        *,
+        backoff_ratio: float = 0.7,
+        latency_tolerance: float = 2.0,
+        decrease_interval: float = 1.0,
+    ) -> None:
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.decrease_interval = decrease_interval
+
+        self.in_flight = 0
+        # flow -> waiters, in round-robin order
+        self._flows: "OrderedDict[str, deque[asyncio.Future]]" = OrderedDict()
+        self._last_decrease = 0.0
+        # Short- and long-term moving averages of call latency (seconds)
+        self._latency_short: float | None = None
+        self._latency_long: float | None = None
+
+        # Metrics
+        self.admitted = 0
+        self.queued = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.peak_queue_depth = 0
+        self.decreases = 0
+        self.overloads = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def acquire(self, flow: str) -> float:
+        """Wait for a slot; returns the seconds spent queued."""
+        if self.in_flight < self._capacity() and not self.queue_depth():
+            self.in_flight += 1
+            self.admitted += 1
+            return 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        self._flows.setdefault(flow, deque()).append(future)
+        self.queued += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth())
+        started = time.perf_counter()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled after being granted a slot: hand it to the next waiter
+            if future.done() and not future.cancelled():
+                self.in_flight -= 1
+                self._dispatch()
+            raise
+
+        waited = time.perf_counter() - started
+        self.admitted += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return waited
+
+    def release(self, latency: float | None = None, overloaded: bool = False) -> None:
+        """Return a slot and adapt the limit to the call's outcome.
+
+        Args:
+            latency: Seconds the call took, or None when not comparable
+                (e.g. streams, whose duration depends on the output length)
+            overloaded: The call failed with an overload signal
+        """
+        busy = self.in_flight >= self.limit / 2
+        self.in_flight -= 1
+        if overloaded:
+            self.overloads += 1
+            self._decrease("upstream overloaded")
+        elif latency is not None and self._latency_spike(latency):
+            self._decrease(f"latency {self._latency_short:.1f}s vs {self._latency_long:.1f}s baseline")
+        elif busy:
+            # Only grow a limit that is actually being used
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._dispatch()
+
+    def queue_depth(self) -> int:
+        return sum(1 for waiters in self._flows.values() for future in waiters if not future.done())
+
+    def stats(self) -> dict[str, Any]:
+        waited = self.queued - self.queue_depth()
+        return {
+            "limit": self._capacity(),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth(),
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "average_wait_seconds": round(self.total_wait_seconds / waited, 3) if waited else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "decreases": self.decreases,
+            "overloads": self.overloads,
+            "latency_seconds": round(self._latency_short, 3) if self._latency_short is not None else None,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _capacity(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    def _latency_spike(self, latency: float) -> bool:
+        if self._latency_short is None:
+            self._latency_short = self._latency_long = latency
+            return False
+        self._latency_short += 0.3 * (latency - self._latency_short)
+        self._latency_long += 0.02 * (latency - self._latency_long)
+        return self._latency_short > self._latency_long * self.latency_tolerance
+
+    def _decrease(self, reason: str) -> None:
+        # A burst of failures from one overload episode counts once
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_interval:
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        previous = self._capacity()
+        self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+        logger.info("Concurrency limit %d -> %d (%s)", previous, self._capacity(), reason)
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters, one flow at a time in round-robin order."""
+        while self._flows and self.in_flight < self._capacity():
+            flow, waiters = next(iter(self._flows.items()))
+            future = waiters.popleft()
+            if waiters:
+                self._flows.move_to_end(flow)
+            else:
+                del self._flows[flow]
+            if future.done():  # Cancelled while queued
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+
+class ConcurrencyLimitedProvider(Provider):
+    """Decorator that runs provider calls under an ``AdaptiveLimiter``."""
+
+    def __init__(self, provider: Provider, limiter: AdaptiveLimiter) -> None:
+        self._provider = provider
+        self.limiter = limiter
+
+    async def _acquire(self, flow: str) -> None:
+        state = queue_state.get()
+        if state is not None:
+            state.waiting = True
+        await self.limiter.acquire(flow)
+        if state is not None:
+            state.waiting = False
+
+    async def create_response(self, request: ResponseRequest) -> ResponseObject:  # noqa: D401
+        await self._acquire(request.model)
+        started = time.perf_counter()
+        try:
+            response = await self._provider.create_response(request)
+        except BaseException as exc:
+            self.limiter.release(overloaded=is_overload(exc))
+            raise
+        self.limiter.release(latency=time.perf_counter() - started)
+        return response
+
+    async def stream_response(self, request: ResponseRequest) -> AsyncIterator[dict]:  # noqa: D401
+        # The slot is held until the stream ends
+        await self._acquire(request.model)
+        overloaded = False
+        try:
+            async for event in self._provider.stream_response(request):
+                yield event
+        except BaseException as exc:
+            overloaded = is_overload(exc)
+            raise
+        finally:
+            self.limiter.release(overloaded=overloaded)
+
+    async def retrieve_response(self, response_id: str) -> ResponseObject:  # noqa: D401
+        return await self._provider.retrieve_response(response_id)
+
+    async def delete_response(self, response_id: str) -> dict[str, Any]:  # noqa: D401
+        return await self._provider.delete_response(response_id)
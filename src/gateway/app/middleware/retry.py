@@ -1,30 +1,166 @@
-"""Simple retry wrapper for provider calls.
+"""Retry policy and circuit breaker for provider calls.
 
-The goal is not to implement a fully-featured resilience layer but to ensure
-that transient network failures (e.g. 5xx, time-outs) don't immediately bubble
-up to the API consumer during tests.  The logic is deliberately kept minimal
-and synchronous ‑ we rely on ``asyncio.sleep`` for the back-off.
+Only failures that can succeed on a second try are retried: rate limits
+(429), upstream 5xx, request time-outs and connection errors. Client errors
+such as a 400 are raised immediately. Back-off uses decorrelated jitter so
+concurrent requests that failed together do not retry in lockstep, and a
+``Retry-After`` hint from the provider takes precedence over the computed
+delay. Every call has a deadline; a retry that cannot start before it is not
+attempted.
+
+A circuit breaker in front of the provider opens after a run of consecutive
+retryable failures and rejects calls with ``CircuitOpenError`` until a cool
+down has passed, then lets a single probe through to decide whether to close
+again. A deadline that runs out while the call is still queued for a
+concurrency slot says nothing about the upstream and is not counted.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+import random
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from email.utils import parsedate_to_datetime
 from typing import TypeVar, Any
 
+import openai
+
 from ..providers.base import Provider, ResponseObject, ResponseRequest
+from .concurrency import QueueState, queue_state
 
 logger = logging.getLogger("gateway.retry")
 
 _T = TypeVar("_T")
 
+# HTTP statuses worth retrying: time-outs, conflicts, rate limits, upstream errors
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether a failed provider call may succeed when repeated."""
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    return isinstance(exc, (openai.APIConnectionError, ConnectionError, TimeoutError))
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Seconds the provider asked us to wait, from the error's response headers."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    # OpenAI sends a millisecond-precision variant alongside the standard header
+    if (value := headers.get("retry-after-ms")) is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+    if (value := headers.get("retry-after")) is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:  # HTTP-date form
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _reason(exc: BaseException) -> str:
+    """Metrics label for a failure: the HTTP status or the exception type."""
+    status = getattr(exc, "status_code", None)
+    return str(status) if status is not None else type(exc).__name__
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the provider while the circuit is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Upstream provider unavailable; circuit open for another {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open probe -> closed."""
+
+    def __init__(self, failure_threshold: int | None, reset_timeout: float) -> None:
+        """
+        Args:
+            failure_threshold: Consecutive retryable failures that open the
+                circuit; None disables the breaker
+            reset_timeout: Seconds the circuit stays open before a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.opens = 0
+        self.rejected = 0
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` if the call must not reach the provider."""
+        if self.state == "open":
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(remaining)
+            self.state = "half_open"
+        if self.state == "half_open":
+            # Exactly one probe decides whether the upstream has recovered
+            if self._probing:
+                self.rejected += 1
+                raise CircuitOpenError(self.reset_timeout)
+            self._probing = True
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            logger.info("Circuit closed; upstream provider recovered")
+        self.state = "closed"
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probing = False
+        if self.failure_threshold is None:
+            return
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                self.opens += 1
+                logger.warning(
+                    "Circuit opened after %d consecutive failures; rejecting calls for %.1fs",
+                    self._failures,
+                    self.reset_timeout,
+                )
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Give up a probe slot without an outcome (e.g. the caller went away)."""
+        self._probing = False
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opens": self.opens,
+            "rejected": self.rejected,
+        }
+
 
 class RetryableProvider(Provider):
     """Decorator that retries calls to an underlying *Provider* instance."""
 
     DEFAULT_ATTEMPTS = 3
-    DEFAULT_BACKOFF = 0.5  # seconds (base for exponential back-off)
+    DEFAULT_BACKOFF = 0.5  # seconds (base for decorrelated jitter)
+    DEFAULT_MAX_BACKOFF = 30.0
+    DEFAULT_DEADLINE = 600.0  # seconds per call, retries included
 
     def __init__(
         self,
@@ -32,45 +168,142 @@ class RetryableProvider(Provider):
         *,
         attempts: int | None = None,
         backoff: float | None = None,
+        max_backoff: float | None = None,
+        deadline: float | None = None,
+        failure_threshold: int | None = 5,
+        reset_timeout: float = 30.0,
     ) -> None:
         self._provider = provider
         self._attempts = attempts or self.DEFAULT_ATTEMPTS
         self._backoff = backoff or self.DEFAULT_BACKOFF
+        self._max_backoff = max_backoff or self.DEFAULT_MAX_BACKOFF
+        self._deadline = deadline or self.DEFAULT_DEADLINE
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        # Metrics
+        self.calls = 0
+        self.retries = 0
+        self.retry_delay_seconds = 0.0
+        self.retries_by_reason: Counter[str] = Counter()
+        self.non_retryable = 0
+        self.exhausted = 0
+        self.deadline_exceeded = 0
+        self.queue_timeouts = 0
 
     # ------------------------------------------------------------------
     # Helper – retry wrapper for arbitrary async callables
     # ------------------------------------------------------------------
 
-    async def _with_retry(self, fn: Callable[[], Awaitable[_T]]) -> _T:
-        last_err: Exception | None = None
-        for attempt in range(1, self._attempts + 1):
-            try:
-                return await fn()
-            except Exception as exc:  # noqa: BLE001 – broad except on purpose
-                last_err = exc
-                logger.warning(
-                    "Provider call failed (attempt %s/%s): %s",
-                    attempt,
-                    self._attempts,
-                    exc,
-                )
-                if attempt < self._attempts:
-                    # Exponential back-off: base * 2^(n-1)
-                    await asyncio.sleep(self._backoff * (2 ** (attempt - 1)))
-        assert last_err is not None  # for mypy – will always be set if we exit
-        raise last_err
+    def _deadline_for(self, request: ResponseRequest) -> float:
+        """A request's own ``timeout`` (milliseconds) overrides the default deadline."""
+        return request.timeout / 1000 if request.timeout else self._deadline
+
+    async def _with_retry(self, fn: Callable[[], Awaitable[_T]], deadline: float | None = None) -> _T:
+        self.calls += 1
+        deadline_at = time.monotonic() + (deadline or self._deadline)
+        delay = self._backoff
+        # Lets the concurrency limiter below report that an attempt is queued
+        state = QueueState()
+        token = queue_state.set(state)
+        try:
+            for attempt in range(1, self._attempts + 1):
+                self.breaker.before_call()
+                try:
+                    result = await asyncio.wait_for(fn(), timeout=max(0.0, deadline_at - time.monotonic()))
+                except asyncio.CancelledError:
+                    self.breaker.release()
+                    raise
+                except Exception as exc:  # noqa: BLE001 – classified below
+                    if state.waiting:
+                        # Timed out in the local concurrency queue; the upstream
+                        # was never called, so the breaker learns nothing
+                        state.waiting = False
+                        self.breaker.release()
+                        self.queue_timeouts += 1
+                        logger.warning("Provider call timed out waiting for a concurrency slot")
+                        raise
+                    if not is_retryable(exc):
+                        # The upstream answered; the request itself is at fault
+                        self.breaker.record_success()
+                        self.non_retryable += 1
+                        raise
+                    self.breaker.record_failure()
+                    if attempt == self._attempts:
+                        self.exhausted += 1
+                        logger.warning("Provider call failed after %s attempts: %s", attempt, exc)
+                        raise
+
+                    # Decorrelated jitter; a Retry-After hint wins, spread by a
+                    # little jitter so callers released together don't collide
+                    delay = min(self._max_backoff, random.uniform(self._backoff, delay * 3))
+                    hinted = retry_after(exc)
+                    wait = hinted + random.uniform(0, self._backoff) if hinted is not None else delay
+                    if time.monotonic() + wait >= deadline_at:
+                        self.deadline_exceeded += 1
+                        logger.warning("Provider call failed and the deadline leaves no time to retry: %s", exc)
+                        raise
+
+                    self.retries += 1
+                    self.retry_delay_seconds += wait
+                    self.retries_by_reason[_reason(exc)] += 1
+                    logger.warning(
+                        "Provider call failed (attempt %s/%s), retrying in %.2fs%s: %s",
+                        attempt,
+                        self._attempts,
+                        wait,
+                        " (Retry-After)" if hinted is not None else "",
+                        exc,
+                    )
+                    await asyncio.sleep(wait)
+                else:
+                    self.breaker.record_success()
+                    return result
+            raise AssertionError("unreachable")  # the last attempt returns or raises
+        finally:
+            queue_state.reset(token)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "retry_delay_seconds": round(self.retry_delay_seconds, 3),
+            "retries_by_reason": dict(self.retries_by_reason),
+            "non_retryable": self.non_retryable,
+            "exhausted": self.exhausted,
+            "deadline_exceeded": self.deadline_exceeded,
+            "queue_timeouts": self.queue_timeouts,
+            "circuit": self.breaker.stats(),
+        }
 
     # ------------------------------------------------------------------
     # Provider interface implementation delegating to wrapped instance
     # ------------------------------------------------------------------
 
     async def create_response(self, request: ResponseRequest) -> ResponseObject:  # noqa: D401
-        return await self._with_retry(lambda: self._provider.create_response(request))
+        return await self._with_retry(
+            lambda: self._provider.create_response(request), self._deadline_for(request)
+        )
+
+    async def stream_response(self, request: ResponseRequest) -> AsyncIterator[dict]:  # noqa: D401
+        # Only opening the stream is retried; events already relayed to the
+        # client cannot be replayed, so later failures are passed on
+        events, first = await self._with_retry(lambda: self._open_stream(request), self._deadline_for(request))
+        if first is None:
+            return
+        try:
+            yield first
+            async for event in events:
+                yield event
+        finally:
+            await events.aclose()
 
+    async def _open_stream(self, request: ResponseRequest) -> tuple[AsyncIterator[dict], dict | None]:
+        """Start a stream and wait for its first event."""
+        events = self._provider.stream_response(request)
+        return events, await anext(events, None)
 
     async def retrieve_response(self, response_id: str) -> ResponseObject:  # noqa: D401
         return await self._with_retry(lambda: self._provider.retrieve_response(response_id))
 
     async def delete_response(self, response_id: str) -> dict[str, Any]:  # noqa: D401
         return await self._with_retry(lambda: self._provider.delete_response(response_id))
-
@@ -80,7 +80,10 @@ def get_async_openai_client() -> AsyncOpenAI:
     client = AsyncOpenAI(
         api_key=api_key,
         # Explicitly set to None to ignore any OPENAI_API_KEY env var
-        default_headers={"OpenAI-Beta": "assistants=v2"}
+        default_headers={"OpenAI-Beta": "assistants=v2"},
+        # RetryableProvider owns retries, back-off and the circuit breaker;
+        # SDK retries underneath it would multiply attempts and hide failures
+        max_retries=0,
     )
     logger.info("Initialized AsyncOpenAI client")
     return client
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from pydantic import BaseModel
 
@@ -71,6 +72,14 @@ class Provider(ABC):
         pass
 
 
+    def stream_response(self, request: ResponseRequest) -> AsyncIterator[dict]:
+        """Stream Responses API events (dicts with a "type") for a request.
+
+        The final ``response.completed`` event carries the full response,
+        shaped like ``create_response(...).model_dump()``.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
     @abstractmethod
     async def retrieve_response(self, response_id: str) -> ResponseObject:
         """Retrieve a stored response"""
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any, Union
 
 import openai
@@ -56,6 +57,21 @@ class OpenAIProvider(Provider):
         return result
 
 
+    async def stream_response(self, request: ResponseRequest) -> AsyncIterator[dict]:
+        logger.debug("stream_response called")
+        payload = self._build_api_request(request)
+        try:
+            stream = await self.client.responses.create(**payload, stream=True)
+        except Exception as exc:  # – re‑raised after mapping
+            self._handle_openai_error(exc, request.model)
+
+        async for event in stream:
+            event_data = event.model_dump()
+            if event_data.get("type") == "response.completed" and event_data.get("response"):
+                # Same shape as a non-streamed response (and its snapshot)
+                event_data["response"] = self._to_response_object(event_data["response"]).model_dump()
+            yield event_data
+
     async def retrieve_response(self, response_id: str) -> ResponseObject:
         rsp = await self.client.responses.retrieve(response_id)
         return self._to_response_object(rsp.model_dump())
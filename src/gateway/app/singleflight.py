@@ -0,0 +1,77 @@
+"""Single-flight coalescing of identical in-flight provider calls.
+
+Concurrent claims over the same document, or a retried extractor, can send
+the gateway byte-identical requests while the first is still pending. The
+first request with a given key starts the upstream call; later ones with the
+same key await that call instead of starting their own and share its result
+(or its exception).
+
+The upstream call runs as its own task, so a caller that disconnects does
+not cancel it for the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger("gateway.singleflight")
+
+_T = TypeVar("_T")
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._waiters: dict[str, int] = {}
+        self.leaders = 0  # Upstream calls started
+        self.coalesced = 0  # Callers that joined an in-flight call
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[_T]]) -> tuple[_T, bool]:
+        """Run ``fn`` unless a call with the same key is already in flight.
+
+        Returns:
+            The call's result and whether it was shared with an earlier caller
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if shared:
+            self.coalesced += 1
+            self._waiters[key] += 1
+            logger.info("Coalesced request onto in-flight call %s (%d waiting)", key[:16], self._waiters[key])
+        else:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self._waiters[key] = 1
+            task.add_done_callback(lambda t: self._finish(key, t))
+
+        try:
+            return await asyncio.shield(task), shared
+        finally:
+            if key in self._waiters and self._inflight.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            del self._waiters[key]
+        # Mark the exception retrieved when every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "in_flight": len(self._inflight),
+            "waiting": sum(self._waiters.values()),
+            "upstream_calls": self.leaders,
+            "coalesced_waiters": self.coalesced,
+        }
+
+
+# Global instance shared by the request handlers
+singleflight = SingleFlight()
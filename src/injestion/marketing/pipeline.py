@@ -19,6 +19,7 @@ from ..shared.visualization.layout_visualizer import visualize_document
 from . import defaults
 from ..shared.pdf_utils import convert_pdf_to_images, save_merged_layouts
 from src.interfaces import Block, Document
+from src.core.block_index import BlockIndex, index_path
 import layoutparser as lp
 import uuid
 import matplotlib.pyplot as plt
@@ -205,6 +206,9 @@ class MarketingPipeline:
         doc_path = output_dir / "content.json"
         document.save(doc_path)
         
+        # Build the block retrieval index used by the fact-checking agents
+        BlockIndex.build(document.model_dump(mode="json")).save(index_path(output_dir))
+        
         # Generate readable formats
         from ..shared.processing.document_formatter import (
             generate_readable_document,
@@ -8,7 +8,8 @@ Uses PubLayNet model with functional consolidation approach.
 CACHE_DIR = "data/scientific_cache"
 
 # PDF Processing
-DETECTION_DPI = 400  # Balance between quality and speed
+DETECTION_DPI = 400   # Raster resolution for layout detection; compare lower values with `eval-dpi` first
+EXTRACTION_DPI = 400  # Pixel space of block bboxes; figure/table crops are rendered at this DPI
 
 # Layout Detection (PubLayNet specific)
 SCORE_THRESHOLD = 0.2  # Conservative threshold for academic documents
@@ -25,6 +26,15 @@ CONFIDENCE_WEIGHT = 0.7           # Weight for confidence in conflict resolution
 AREA_WEIGHT = 0.3                 # Weight for box area in conflict resolution
 MINOR_OVERLAP_THRESHOLD = 0.10    # Overlaps below this are kept
 
+# Born-digital Fast Path
+NATIVE_LAYOUT_FAST_PATH = True   # Use PyMuPDF text blocks instead of detection for text-only pages
+NATIVE_MAX_IMAGES = 0            # Pages with more embedded images go to the detector
+NATIVE_MAX_DRAWINGS = 15         # Pages with more vector paths (tables, charts) go to the detector
+NATIVE_MIN_TEXT_COVERAGE = 0.3   # Minimum fraction of the page covered by text blocks
+
+# Incremental Re-ingest
+REUSE_UNCHANGED_PAGES = True  # Reuse cached results for pages whose content fingerprint is unchanged
+
 # Text Processing
 APPLY_TEXT_PROCESSING = True  # Apply medical-aware text cleaning
 
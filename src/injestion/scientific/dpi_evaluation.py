@@ -0,0 +1,235 @@
+"""Accuracy-vs-speed evaluation of layout detection at different DPIs.
+
+Detection runs on a raster whose resolution is independent of the block
+coordinate space (``EXTRACTION_DPI``). This module measures what lowering
+the detection DPI costs: each page is rasterized and detected at several
+DPIs, the consolidated blocks are rescaled into a common coordinate space
+and matched against the blocks produced at a reference DPI.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from pdf2image import convert_from_path
+
+from ..shared.processing.box import Box
+from . import defaults
+from .processing.layout_detector import LayoutDetectionPipeline
+from .processing.overlap_resolver import expand_boxes, no_overlap_pipeline
+
+logger = logging.getLogger(__name__)
+
+
+def box_iou(a: Sequence[float], b: Sequence[float]) -> float:
+    """Intersection over union of two (x1, y1, x2, y2) boxes."""
+    ix1, iy1 = max(a[0], b[0]), max(a[1], b[1])
+    ix2, iy2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(0.0, ix2 - ix1) * max(0.0, iy2 - iy1)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def match_blocks(
+    reference: List[Box],
+    candidate: List[Box],
+    iou_threshold: float = 0.5,
+) -> Dict[str, Any]:
+    """Greedily match candidate blocks to reference blocks of the same label.
+
+    Args:
+        reference: Blocks produced at the reference DPI
+        candidate: Blocks produced at the DPI under evaluation
+        iou_threshold: Minimum IoU for a match
+
+    Returns:
+        Dict with match count, reference/candidate counts and matched IoUs
+    """
+    pairs = sorted(
+        (
+            (box_iou(r.bbox, c.bbox), ri, ci)
+            for ri, r in enumerate(reference)
+            for ci, c in enumerate(candidate)
+            if r.label == c.label
+        ),
+        reverse=True,
+    )
+
+    used_ref, used_cand, ious = set(), set(), []
+    for iou, ri, ci in pairs:
+        if iou < iou_threshold:
+            break
+        if ri in used_ref or ci in used_cand:
+            continue
+        used_ref.add(ri)
+        used_cand.add(ci)
+        ious.append(iou)
+
+    return {
+        "matched": len(ious),
+        "reference": len(reference),
+        "candidate": len(candidate),
+        "ious": ious,
+    }
+
+
+def _consolidate(boxes: List[Box]) -> List[Box]:
+    """Apply the standard pipeline's box consolidation settings."""
+    if defaults.EXPAND_BOXES and boxes:
+        boxes = expand_boxes(boxes, padding=defaults.BOX_PADDING)
+    if defaults.MERGE_OVERLAPPING and boxes:
+        boxes = no_overlap_pipeline(
+            boxes=boxes,
+            merge_same_type_first=True,
+            merge_threshold=defaults.MERGE_THRESHOLD,
+            confidence_weight=defaults.CONFIDENCE_WEIGHT,
+            area_weight=defaults.AREA_WEIGHT,
+            minor_overlap_threshold=defaults.MINOR_OVERLAP_THRESHOLD,
+            same_type_merge_threshold=0.85,
+        )
+    return boxes
+
+
+def _detect_page(
+    detector: LayoutDetectionPipeline,
+    pdf_path: Path,
+    page_idx: int,
+    dpi: int,
+    coordinate_dpi: int,
+) -> Dict[str, Any]:
+    """Rasterize and detect one page, returning timings and scaled blocks."""
+    start = time.perf_counter()
+    image = convert_from_path(str(pdf_path), dpi=dpi, first_page=page_idx + 1, last_page=page_idx + 1)[0]
+    rasterize_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    layout = detector.detect_images([image])[0]
+    detect_s = time.perf_counter() - start
+
+    scale = coordinate_dpi / dpi
+    boxes = [
+        Box(
+            id=f"det_{page_idx}_{det_idx:03d}",
+            bbox=(
+                layout_box.block.x_1 * scale,
+                layout_box.block.y_1 * scale,
+                layout_box.block.x_2 * scale,
+                layout_box.block.y_2 * scale,
+            ),
+            label=str(layout_box.type) if layout_box.type else "Unknown",
+            score=float(layout_box.score or 0.0),
+            page_index=page_idx,
+        )
+        for det_idx, layout_box in enumerate(layout)
+    ]
+
+    return {
+        "rasterize_s": rasterize_s,
+        "detect_s": detect_s,
+        "blocks": _consolidate(boxes),
+    }
+
+
+def evaluate_detection_dpi(
+    pdf_paths: Sequence[Path],
+    dpis: Sequence[int] = (150, 200, 300, 400),
+    reference_dpi: Optional[int] = None,
+    iou_threshold: float = 0.5,
+    max_pages: Optional[int] = None,
+    detector: Optional[LayoutDetectionPipeline] = None,
+) -> Dict[str, Any]:
+    """Compare consolidated block sets detected at several DPIs.
+
+    Args:
+        pdf_paths: PDFs to evaluate
+        dpis: Detection DPIs to compare
+        reference_dpi: DPI whose blocks are treated as ground truth
+            (default: the highest DPI in ``dpis``)
+        iou_threshold: Minimum IoU for two blocks to count as the same
+        max_pages: Optional limit on pages evaluated per PDF
+        detector: Optional preloaded detector
+
+    Returns:
+        Dict with per-DPI summary (timings, precision, recall, F1, mean IoU)
+        and per-document details
+    """
+    import fitz  # PyMuPDF
+
+    dpis = sorted(set(dpis) | ({reference_dpi} if reference_dpi else set()))
+    reference_dpi = reference_dpi or max(dpis)
+    detector = detector or LayoutDetectionPipeline(
+        score_threshold=defaults.SCORE_THRESHOLD,
+        nms_threshold=defaults.NMS_THRESHOLD,
+    )
+    coordinate_dpi = defaults.EXTRACTION_DPI
+
+    totals = {dpi: _empty_stats() for dpi in dpis}
+    documents = []
+
+    for pdf_path in pdf_paths:
+        pdf_path = Path(pdf_path)
+        with fitz.open(pdf_path) as doc:
+            n_pages = len(doc)
+        if max_pages is not None:
+            n_pages = min(n_pages, max_pages)
+        logger.info(f"Evaluating {pdf_path.name} ({n_pages} pages) at DPIs {dpis}")
+
+        doc_totals = {dpi: _empty_stats() for dpi in dpis}
+        for page_idx in range(n_pages):
+            results = {dpi: _detect_page(detector, pdf_path, page_idx, dpi, coordinate_dpi) for dpi in dpis}
+            reference = results[reference_dpi]["blocks"]
+
+            for dpi, result in results.items():
+                match = match_blocks(reference, result["blocks"], iou_threshold)
+                _accumulate(totals[dpi], result, match)
+                _accumulate(doc_totals[dpi], result, match)
+
+        documents.append({
+            "document": pdf_path.name,
+            "pages": n_pages,
+            "by_dpi": {dpi: _summarize(stats) for dpi, stats in doc_totals.items()},
+        })
+
+    return {
+        "reference_dpi": reference_dpi,
+        "coordinate_dpi": coordinate_dpi,
+        "iou_threshold": iou_threshold,
+        "summary": {dpi: _summarize(stats) for dpi, stats in totals.items()},
+        "documents": documents,
+    }
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {"pages": 0, "rasterize_s": 0.0, "detect_s": 0.0, "matched": 0,
+            "reference": 0, "candidate": 0, "iou_sum": 0.0}
+
+
+def _accumulate(stats: Dict[str, Any], result: Dict[str, Any], match: Dict[str, Any]) -> None:
+    stats["pages"] += 1
+    stats["rasterize_s"] += result["rasterize_s"]
+    stats["detect_s"] += result["detect_s"]
+    stats["matched"] += match["matched"]
+    stats["reference"] += match["reference"]
+    stats["candidate"] += match["candidate"]
+    stats["iou_sum"] += sum(match["ious"])
+
+
+def _summarize(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn accumulated counts into rates and per-page timings."""
+    pages = stats["pages"] or 1
+    precision = stats["matched"] / stats["candidate"] if stats["candidate"] else 1.0
+    recall = stats["matched"] / stats["reference"] if stats["reference"] else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "pages": stats["pages"],
+        "rasterize_s_per_page": stats["rasterize_s"] / pages,
+        "detect_s_per_page": stats["detect_s"] / pages,
+        "blocks": stats["candidate"],
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "mean_iou": stats["iou_sum"] / stats["matched"] if stats["matched"] else 0.0,
+    }
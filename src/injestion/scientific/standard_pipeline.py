@@ -4,31 +4,60 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import List, Optional
+import re
+import shutil
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 
 from .processing.layout_detector import LayoutDetectionPipeline
 from .processing.overlap_resolver import no_overlap_pipeline, expand_boxes
 from ..shared.processing.box import Box
+from ..shared.processing.native_layout import ROUTE_NATIVE, PageRoute, route_pages
 from src.interfaces import Block, Document
-from ..shared.processing.text_extractor import extract_document_content
+from ..shared.processing.text_extractor import extract_document_content, figure_placeholder
 from .processing.reading_order import determine_reading_order_simple
-from ..shared.storage.paths import stage_dir, save_json
+from ..shared.storage.paths import doc_id, stage_dir, save_json, load_json
 from . import defaults
-from ..shared.pdf_utils import convert_pdf_to_images, save_merged_layouts
+from ..shared.pdf_utils import (
+    compute_page_fingerprints,
+    convert_pdf_to_images,
+    save_merged_layouts,
+)
+from src.core.cache_manager import load_manifest, touch_document
+from src.core.block_index import BlockIndex, index_path
 
 logger = logging.getLogger(__name__)
 
 
+def _remap_block_id(block_id: str, old_page: int, new_page: int) -> str:
+    """Rewrite the page component of a deterministic block id.
+
+    Detection ids are ``det_<page>_<index>`` (``nat_<page>_<index>`` for
+    native-layout pages) and merges wrap them (``mrg_det_<page>_<index>``),
+    so moving a page only requires replacing the page number inside every
+    embedded id.
+    """
+    if old_page == new_page:
+        return block_id
+    return re.sub(rf"(?<![A-Za-z0-9])(det|nat)_{old_page}_(?=\d)", rf"\g<1>_{new_page}_", block_id)
+
+
 class StandardPipeline:
     """Standard pipeline optimized for academic and clinical documents.
-    
+
     Uses PubLayNet-based detection and functional box consolidation.
+    Born-digital text-only pages skip detection and take their layout from
+    PyMuPDF's native text blocks instead.
+
+    When a document is re-ingested, per-page content fingerprints stored in
+    the document manifest are compared against the new PDF. Unchanged pages
+    reuse their cached blocks, reading order and figures; only changed pages
+    are rasterized, detected and extracted.
     """
-    
+
     def __init__(self, cache_dir: str = defaults.CACHE_DIR):
         """Initialize pipeline with scientific defaults.
-        
+
         Parameters
         ----------
         cache_dir : str, optional
@@ -39,70 +68,315 @@ class StandardPipeline:
             score_threshold=defaults.SCORE_THRESHOLD,
             nms_threshold=defaults.NMS_THRESHOLD
         )
-    
+
     def process_pdf(self, pdf_path: str | os.PathLike[str]) -> Document:
         """Process a PDF file through the pipeline, always saving raw layouts."""
         pdf_path = Path(pdf_path)
-        
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        # Fingerprint pages and match them against the previous run
+        fingerprints = compute_page_fingerprints(pdf_path)
+        total_pages = len(fingerprints)
+        previous, reuse_map = self._match_previous_run(pdf_path, fingerprints)
+
+        if previous is not None and len(reuse_map) == total_pages and \
+                len(previous.reading_order) == total_pages and \
+                all(new == old for new, old in reuse_map.items()):
+            logger.info(f"No page changes detected in {pdf_path.name}; reusing cached document")
+            self._record_manifest(pdf_path, fingerprints)
+            return previous
+
+        incremental = bool(reuse_map)
+        page_indices = [i for i in range(total_pages) if i not in reuse_map]
+        if incremental:
+            logger.info(
+                f"Reusing {len(reuse_map)} unchanged pages; "
+                f"processing {len(page_indices)} changed pages: {[i + 1 for i in page_indices]}"
+            )
+            # Move cached per-page files of reused pages to their new indices
+            # before changed pages are rasterized over the old slots
+            self._remap_page_files(pdf_path, reuse_map, total_pages)
+
         # Convert PDF to images
         logger.info(f"Converting {pdf_path.name} to images...")
-        images = convert_pdf_to_images(pdf_path, self.cache_dir, defaults.DETECTION_DPI)
-        
-        # Run layout detection
-        logger.info("Running layout detection...")
-        layouts = self.detector.detect_images(images)
-        
+        images = convert_pdf_to_images(
+            pdf_path, self.cache_dir, defaults.DETECTION_DPI,
+            pages=page_indices if incremental else None
+        )
+        if not incremental:
+            page_indices = list(range(len(images)))
+
+        # Route simple born-digital pages around the detector
+        routes, native_boxes = self._route_pages(pdf_path, page_indices)
+        detect_positions = [pos for pos, idx in enumerate(page_indices) if idx not in native_boxes]
+
+        # Run layout detection on the remaining pages
+        logger.info(f"Running layout detection on {len(detect_positions)} of {len(page_indices)} pages...")
+        detected = self.detector.detect_images([images[pos] for pos in detect_positions]) if detect_positions else []
+
+        raw_boxes = [native_boxes.get(idx, []) for idx in page_indices]
+        for pos, page_layout in zip(detect_positions, detected):
+            raw_boxes[pos] = self._layout_to_boxes(page_layout, page_indices[pos])
+
         # Always save raw layouts for the standard pipeline
-        self._save_raw_layouts(layouts, pdf_path, images)
-        
+        raw_data = self._save_raw_layouts(raw_boxes, pdf_path, images, page_indices, reuse_map, total_pages)
+
         # Apply functional consolidation (no objects needed)
         logger.info("Applying functional box consolidation...")
-        consolidated_layouts = self._apply_consolidation(layouts, images)
-        
-        # Save merged layouts if configured
-        if defaults.SAVE_INTERMEDIATE_STATES:
-            save_merged_layouts(consolidated_layouts, pdf_path, self.cache_dir)
-        
+        consolidated_layouts = self._apply_consolidation(raw_boxes)
+
         # Create document and extract content
         logger.info("Creating document structure...")
-        document = self._create_document(consolidated_layouts, pdf_path, images)
-        
+        document = self._create_document(
+            consolidated_layouts, pdf_path, images, page_indices,
+            total_pages=total_pages,
+            raw_detection_count=sum(len(page) for page in raw_data),
+            previous=previous,
+            reuse_map=reuse_map,
+            routes=routes,
+        )
+
+        # Save merged layouts if configured
+        if defaults.SAVE_INTERMEDIATE_STATES:
+            save_merged_layouts(self._boxes_by_page(document), pdf_path, self.cache_dir)
+
         # Save outputs and visualize
-        self._save_outputs(document, pdf_path)
-        
+        self._save_outputs(document, pdf_path, pages_to_show=page_indices if incremental else None)
+        self._record_manifest(pdf_path, fingerprints)
+
         return document
-    
-    def _apply_consolidation(self, layouts: List, images: List) -> List:
+
+    # ------------------------------------------------------------------
+    # Incremental re-ingest helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _settings_signature() -> Dict[str, Any]:
+        """Settings that must match for cached page results to be reusable."""
+        return {
+            "pipeline": "standard",
+            "detection_dpi": defaults.DETECTION_DPI,
+            "extraction_dpi": defaults.EXTRACTION_DPI,
+            "score_threshold": defaults.SCORE_THRESHOLD,
+            "nms_threshold": defaults.NMS_THRESHOLD,
+            "expand_boxes": defaults.EXPAND_BOXES,
+            "box_padding": defaults.BOX_PADDING,
+            "merge_overlapping": defaults.MERGE_OVERLAPPING,
+            "merge_threshold": defaults.MERGE_THRESHOLD,
+            "confidence_weight": defaults.CONFIDENCE_WEIGHT,
+            "area_weight": defaults.AREA_WEIGHT,
+            "minor_overlap_threshold": defaults.MINOR_OVERLAP_THRESHOLD,
+            "native_layout_fast_path": defaults.NATIVE_LAYOUT_FAST_PATH,
+            "native_max_images": defaults.NATIVE_MAX_IMAGES,
+            "native_max_drawings": defaults.NATIVE_MAX_DRAWINGS,
+            "native_min_text_coverage": defaults.NATIVE_MIN_TEXT_COVERAGE,
+        }
+
+    def _doc_dir(self, pdf_path: Path) -> Path:
+        return Path(self.cache_dir) / doc_id(pdf_path)
+
+    def _record_manifest(self, pdf_path: Path, fingerprints: List[str]) -> None:
+        """Store page fingerprints and settings for the next re-ingest."""
+        touch_document(
+            self._doc_dir(pdf_path),
+            source_pdf=str(pdf_path),
+            page_fingerprints=fingerprints,
+            ingest_settings=self._settings_signature(),
+        )
+
+    def _match_previous_run(
+        self, pdf_path: Path, fingerprints: List[str]
+    ) -> Tuple[Optional[Document], Dict[int, int]]:
+        """Find cached pages whose fingerprint matches a page of the new PDF.
+
+        Returns:
+            The previously extracted document (or None) and a mapping from
+            new page index to the old page index whose results can be reused
+        """
+        if not defaults.REUSE_UNCHANGED_PAGES:
+            return None, {}
+
+        doc_dir = self._doc_dir(pdf_path)
+        manifest = load_manifest(doc_dir)
+        old_fingerprints = manifest.get("page_fingerprints")
+        content_path = doc_dir / "extracted" / "content.json"
+        if not old_fingerprints or not content_path.exists():
+            return None, {}
+        if manifest.get("ingest_settings") != self._settings_signature():
+            logger.info("Ingest settings changed since last run; reprocessing all pages")
+            return None, {}
+
+        try:
+            previous = Document.load(content_path)
+        except Exception as e:
+            logger.warning(f"Could not load previous document {content_path}: {e}")
+            return None, {}
+        if len(previous.reading_order) != len(old_fingerprints):
+            return None, {}
+
+        # Pages whose figure crops were evicted cannot be reused as-is
+        extracted_dir = content_path.parent
+        missing_figures = {
+            b.page_index for b in previous.blocks
+            if b.image_path and not (extracted_dir / b.image_path).exists()
+        }
+
+        old_pages_by_fingerprint: Dict[str, List[int]] = {}
+        for idx, fp in enumerate(old_fingerprints):
+            if idx not in missing_figures:
+                old_pages_by_fingerprint.setdefault(fp, []).append(idx)
+
+        reuse_map = {}
+        for new_idx, fp in enumerate(fingerprints):
+            candidates = old_pages_by_fingerprint.get(fp)
+            if candidates:
+                # Prefer the page at the same position (the common case)
+                reuse_map[new_idx] = new_idx if new_idx in candidates else candidates[0]
+
+        return previous, reuse_map
+
+    def _remap_page_files(self, pdf_path: Path, reuse_map: Dict[int, int], total_pages: int) -> None:
+        """Renumber cached per-page images for pages that moved.
+
+        Sources are copied aside first so that permutations (and several new
+        pages reusing one old page) never read an already overwritten file.
+        """
+        doc_dir = self._doc_dir(pdf_path)
+        per_page_files = [
+            (doc_dir / "pages", lambda i: f"page-{i:03}.png"),
+            (doc_dir / "raw_layouts" / "visualizations", lambda i: f"page_{i + 1:03d}_raw_layout.png"),
+            (doc_dir / "visualizations", lambda i: f"page_{i + 1:03d}_layout.png"),
+        ]
+        moves = {new: old for new, old in reuse_map.items() if new != old}
+
+        for directory, name_for in per_page_files:
+            if not directory.exists():
+                continue
+
+            staged = {}
+            for new_idx, old_idx in moves.items():
+                src = directory / name_for(old_idx)
+                if src.exists():
+                    tmp = directory / f"{name_for(new_idx)}.reuse"
+                    shutil.copy2(src, tmp)
+                    staged[new_idx] = tmp
+            for new_idx, tmp in staged.items():
+                os.replace(tmp, directory / name_for(new_idx))
+
+            # Drop files of pages that no longer exist
+            idx = total_pages
+            while (directory / name_for(idx)).exists():
+                (directory / name_for(idx)).unlink()
+                idx += 1
+
+    def _reuse_page(
+        self,
+        previous: Document,
+        previous_blocks: List[Block],
+        old_idx: int,
+        new_idx: int,
+        extracted_dir: Path,
+    ) -> Tuple[List[Block], List[str], Dict[str, bytes]]:
+        """Copy a cached page's blocks and reading order to a new page index.
+
+        Returns:
+            Blocks, reading order and figure image bytes keyed by the new
+            relative image path
+        """
+        order = [_remap_block_id(bid, old_idx, new_idx) for bid in previous.reading_order[old_idx]]
+        blocks = []
+        figures = {}
+
+        for block in previous_blocks:
+            new_block = block.model_copy(deep=True)
+            new_block.id = _remap_block_id(block.id, old_idx, new_idx)
+            new_block.page_index = new_idx
+
+            if block.image_path:
+                img_filename = f"{block.role.lower()}_p{new_idx + 1}_{new_block.id}.png"
+                new_block.image_path = f"figures/{img_filename}"
+                # Read now: extraction of changed pages may overwrite the source
+                figures[new_block.image_path] = (extracted_dir / block.image_path).read_bytes()
+                position = order.index(new_block.id) + 1 if new_block.id in order else None
+                new_block.text = figure_placeholder(block.role, img_filename, position)
+
+            blocks.append(new_block)
+
+        return blocks, order, figures
+
+    @staticmethod
+    def _boxes_by_page(document: Document) -> List[List[Box]]:
+        """Convert document blocks back to per-page boxes."""
+        pages: List[List[Box]] = [[] for _ in range(document.metadata.get("total_pages", 0))]
+        for block in document.blocks:
+            pages[block.page_index].append(Box(
+                id=block.id,
+                bbox=block.bbox,
+                label=block.role,
+                score=block.metadata.get("score", 1.0),
+                page_index=block.page_index,
+            ))
+        return pages
+
+    # ------------------------------------------------------------------
+    # Processing stages
+    # ------------------------------------------------------------------
+
+    def _route_pages(
+        self, pdf_path: Path, page_indices: Sequence[int]
+    ) -> Tuple[Dict[int, PageRoute], Dict[int, List[Box]]]:
+        """Classify pages and build native layouts for simple ones."""
+        if not defaults.NATIVE_LAYOUT_FAST_PATH or not page_indices:
+            return {}, {}
+        return route_pages(
+            pdf_path,
+            page_indices,
+            defaults.EXTRACTION_DPI,
+            max_images=defaults.NATIVE_MAX_IMAGES,
+            max_drawings=defaults.NATIVE_MAX_DRAWINGS,
+            min_text_coverage=defaults.NATIVE_MIN_TEXT_COVERAGE,
+        )
+
+    @staticmethod
+    def _coordinate_scale() -> float:
+        """Factor from detection raster pixels to block coordinates."""
+        return defaults.EXTRACTION_DPI / defaults.DETECTION_DPI
+
+    @classmethod
+    def _layout_to_boxes(cls, page_layout, page_idx: int) -> List[Box]:
+        """Convert detector output to Box objects with deterministic IDs.
+
+        Detection runs on a low-DPI raster; bboxes are rescaled into the
+        EXTRACTION_DPI pixel space used by blocks and content extraction.
+        """
+        scale = cls._coordinate_scale()
+        return [
+            Box(
+                # Create deterministic ID based on page and detection index
+                id=f"det_{page_idx}_{det_idx:03d}",
+                bbox=(
+                    layout.block.x_1 * scale,
+                    layout.block.y_1 * scale,
+                    layout.block.x_2 * scale,
+                    layout.block.y_2 * scale,
+                ),
+                label=str(layout.type) if layout.type else "Unknown",
+                score=float(layout.score or 0.0),
+                page_index=page_idx,
+            )
+            for det_idx, layout in enumerate(page_layout)
+        ]
+
+    def _apply_consolidation(self, raw_boxes: List[List[Box]]) -> List:
         """Apply functional box consolidation."""
-        # Store raw layouts for tracking
-        self._last_raw_layouts = layouts
-        
         consolidated_layouts = []
-        
-        for page_idx, page_layout in enumerate(layouts):
-            # Convert to Box objects with deterministic IDs
-            page_boxes = []
-            for det_idx, layout in enumerate(page_layout):
-                # Create deterministic ID based on page and detection index
-                det_id = f"det_{page_idx}_{det_idx:03d}"
-                box = Box(
-                    id=det_id,
-                    bbox=(
-                        layout.block.x_1,
-                        layout.block.y_1,
-                        layout.block.x_2,
-                        layout.block.y_2,
-                    ),
-                    label=str(layout.type) if layout.type else "Unknown",
-                    score=float(layout.score or 0.0),
-                    page_index=page_idx,
-                )
-                page_boxes.append(box)
-            
+
+        for page_boxes in raw_boxes:
             # Expand boxes if configured
             if defaults.EXPAND_BOXES and page_boxes:
                 page_boxes = expand_boxes(page_boxes, padding=defaults.BOX_PADDING)
-            
+
             # Apply overlap resolution if configured
             if defaults.MERGE_OVERLAPPING and page_boxes:
                 page_boxes = no_overlap_pipeline(
@@ -114,26 +388,42 @@ class StandardPipeline:
                     minor_overlap_threshold=defaults.MINOR_OVERLAP_THRESHOLD,
                     same_type_merge_threshold=0.85  # Balanced threshold for text merging
                 )
-            
+
             consolidated_layouts.append(page_boxes)
-        
+
         return consolidated_layouts
-    
-    def _create_document(self, layouts: List, pdf_path: Path, images: List) -> Document:
-        """Convert processed layouts to Document."""
-        all_blocks = []
-        reading_order_by_page = []
-        
-        for page_idx, (page_boxes, image) in enumerate(zip(layouts, images)):
-            # Determine reading order
-            page_width = image.width
-            page_height = image.height
-            reading_order = determine_reading_order_simple(page_boxes, page_width, page_height)
-            reading_order_by_page.append(reading_order)
-            
+
+    def _create_document(
+        self,
+        layouts: List,
+        pdf_path: Path,
+        images: List,
+        page_indices: Sequence[int],
+        *,
+        total_pages: int,
+        raw_detection_count: int,
+        previous: Optional[Document] = None,
+        reuse_map: Optional[Dict[int, int]] = None,
+        routes: Optional[Dict[int, PageRoute]] = None,
+    ) -> Document:
+        """Convert processed layouts (plus reused pages) to Document."""
+        reuse_map = reuse_map or {}
+        routes = routes or {}
+        routing = {str(idx): route.to_dict() for idx, route in routes.items()}
+        blocks_by_page: Dict[int, List[Block]] = {}
+        reading_order_by_page: List[List[str]] = [[] for _ in range(total_pages)]
+
+        for page_idx, page_boxes, image in zip(page_indices, layouts, images):
+            # Determine reading order (in block coordinate space)
+            page_width = image.width * self._coordinate_scale()
+            page_height = image.height * self._coordinate_scale()
+            reading_order_by_page[page_idx] = determine_reading_order_simple(page_boxes, page_width, page_height)
+
+            native = page_idx in routes and routes[page_idx].route == ROUTE_NATIVE
+
             # Convert to Block objects
-            for box in page_boxes:
-                block = Block(
+            blocks_by_page[page_idx] = [
+                Block(
                     id=box.id,
                     page_index=page_idx,
                     role=box.label,
@@ -141,11 +431,52 @@ class StandardPipeline:
                     metadata={
                         "score": box.score,
                         "detection_dpi": defaults.DETECTION_DPI,
-                        "detector": "PubLayNet"
+                        "extraction_dpi": defaults.EXTRACTION_DPI,
+                        "detector": "PyMuPDF-native" if native else "PubLayNet"
                     }
                 )
-                all_blocks.append(block)
-        
+                for box in page_boxes
+            ]
+
+        # Carry over unchanged pages from the previous run
+        reused_figures: Dict[str, bytes] = {}
+        if previous is not None and reuse_map:
+            extracted_dir = self._doc_dir(pdf_path) / "extracted"
+            previous_by_page: Dict[int, List[Block]] = {}
+            for block in previous.blocks:
+                previous_by_page.setdefault(block.page_index, []).append(block)
+            previous_routing = previous.pipeline_metadata.get("page_routing", {})
+
+            for new_idx, old_idx in sorted(reuse_map.items()):
+                blocks, order, figures = self._reuse_page(
+                    previous, previous_by_page.get(old_idx, []), old_idx, new_idx, extracted_dir
+                )
+                blocks_by_page[new_idx] = blocks
+                reading_order_by_page[new_idx] = order
+                reused_figures.update(figures)
+                if str(old_idx) in previous_routing:
+                    routing[str(new_idx)] = previous_routing[str(old_idx)]
+
+        all_blocks = [block for page_idx in sorted(blocks_by_page) for block in blocks_by_page[page_idx]]
+
+        pipeline_metadata = {
+            "raw_detection_count": raw_detection_count,
+            "after_consolidation_count": len(all_blocks),
+            "final_block_count": len(all_blocks),
+            "box_tracking_enabled": True,
+            "id_format": "det_<page>_<index> for detections, nat_<page>_<index> for native layout, "
+                         "mrg_<source_id> for merges"
+        }
+        if routing:
+            pipeline_metadata["page_routing"] = {
+                str(idx): routing[str(idx)] for idx in range(total_pages) if str(idx) in routing
+            }
+        if reuse_map:
+            pipeline_metadata["incremental"] = {
+                "reused_pages": {str(new): old for new, old in sorted(reuse_map.items())},
+                "processed_pages": list(page_indices),
+            }
+
         # Create document with pipeline metadata
         document = Document(
             source_pdf=str(pdf_path),
@@ -153,42 +484,62 @@ class StandardPipeline:
             metadata={
                 "pipeline": "standard",
                 "detection_dpi": defaults.DETECTION_DPI,
-                "total_pages": len(layouts)
+                "extraction_dpi": defaults.EXTRACTION_DPI,
+                "total_pages": total_pages
             },
             reading_order=reading_order_by_page,
-            pipeline_metadata={
-                "raw_detection_count": sum(len(page) for page in self._last_raw_layouts),
-                "after_consolidation_count": sum(len(page) for page in layouts),
-                "final_block_count": len(all_blocks),
-                "box_tracking_enabled": True,
-                "id_format": "det_<page>_<index> for detections, mrg_<source_id> for merges"
-            }
+            pipeline_metadata=pipeline_metadata
+        )
+
+        # Extract text content (only for pages that were detected this run)
+        document = extract_document_content(
+            document, pdf_path, defaults.EXTRACTION_DPI, self.cache_dir,
+            pages=page_indices if reuse_map else None
         )
-        
-        # Extract text content
-        document = extract_document_content(document, pdf_path, defaults.DETECTION_DPI, self.cache_dir)
-        
+
+        if reuse_map:
+            self._finalize_reused_figures(document, pdf_path, reused_figures)
+
         return document
-    
-    def _save_outputs(self, document: Document, pdf_path: Path):
+
+    def _finalize_reused_figures(self, document: Document, pdf_path: Path, reused_figures: Dict[str, bytes]) -> None:
+        """Write reused figure crops, drop stale ones and fix extraction totals."""
+        extracted_dir = stage_dir("extracted", pdf_path, self.cache_dir)
+        for rel_path, data in reused_figures.items():
+            (extracted_dir / rel_path).write_bytes(data)
+
+        referenced = {block.image_path for block in document.blocks if block.image_path}
+        figures_dir = extracted_dir / "figures"
+        for path in figures_dir.glob("*.png"):
+            if f"figures/{path.name}" not in referenced:
+                path.unlink()
+
+        extraction = document.metadata.setdefault("extraction", {})
+        extraction["text_blocks"] = sum(1 for b in document.blocks if b.is_text and b.text)
+        extraction["figure_blocks"] = len(referenced)
+
+    def _save_outputs(self, document: Document, pdf_path: Path, pages_to_show: Optional[List[int]] = None):
         """Save processing outputs."""
         output_dir = stage_dir("extracted", pdf_path, self.cache_dir)
-        
+
         # Save document
         doc_path = output_dir / "content.json"
         document.save(doc_path)
-        
+
+        # Build the block retrieval index used by the fact-checking agents
+        BlockIndex.build(document.model_dump(mode="json")).save(index_path(output_dir))
+
         # Generate readable formats
         from ..shared.processing.document_formatter import (
             generate_readable_document,
             generate_text_only_document,
             generate_html_document
         )
-        
+
         generate_readable_document(document, output_dir / "document.md", include_images=True)
         generate_text_only_document(document, output_dir / "document.txt", include_placeholders=True)
         generate_html_document(document, output_dir / "document.html", include_images=True)
-        
+
         # Create visualizations if configured
         if defaults.CREATE_VISUALIZATIONS:
             from ..shared.visualization.layout_visualizer import visualize_document
@@ -196,68 +547,77 @@ class StandardPipeline:
                 document,
                 pdf_path,
                 self.cache_dir,
+                pages_to_show=pages_to_show,
                 show_labels=True,
                 show_reading_order=True
             )
-        
+
         logger.info(f"Outputs saved to: {output_dir}")
-    
-    def _save_raw_layouts(self, layouts: List, pdf_path: Path, images: List):
-        """Save raw layout detection results before any processing."""
+
+    def _save_raw_layouts(
+        self,
+        raw_boxes: List[List[Box]],
+        pdf_path: Path,
+        images: List,
+        page_indices: Sequence[int],
+        reuse_map: Optional[Dict[int, int]] = None,
+        total_pages: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Save raw layout detection results before any processing.
+
+        Returns:
+            Raw boxes for every page, including pages reused from a
+            previous run
+        """
         raw_dir = stage_dir("raw_layouts", pdf_path, self.cache_dir)
         raw_dir.mkdir(parents=True, exist_ok=True)
-        
+        raw_path = raw_dir / "raw_layout_boxes.json"
+
+        raw_data: List[List[Dict[str, Any]]] = [[] for _ in range(total_pages or len(raw_boxes))]
+
+        # Reused pages keep their previous raw detections (with remapped ids)
+        if reuse_map and raw_path.exists():
+            previous_raw = load_json(raw_path)
+            for new_idx, old_idx in reuse_map.items():
+                if old_idx < len(previous_raw):
+                    raw_data[new_idx] = [
+                        {**entry, "id": _remap_block_id(entry["id"], old_idx, new_idx)}
+                        for entry in previous_raw[old_idx]
+                    ]
+
         # Save raw layout data with deterministic IDs
-        raw_data = []
-        for page_idx, page_layout in enumerate(layouts):
-            page_data = []
-            for det_idx, layout in enumerate(page_layout):
-                det_id = f"det_{page_idx}_{det_idx:03d}"
-                page_data.append({
-                    "id": det_id,
-                    "bbox": [
-                        layout.block.x_1,
-                        layout.block.y_1,
-                        layout.block.x_2,
-                        layout.block.y_2,
-                    ],
-                    "label": str(layout.type) if layout.type else "Unknown",
-                    "score": float(layout.score or 0.0),
-                })
-            raw_data.append(page_data)
-        
-        save_json(raw_data, raw_dir / "raw_layout_boxes.json")
-        
+        for page_idx, page_boxes in zip(page_indices, raw_boxes):
+            raw_data[page_idx] = [
+                {
+                    "id": box.id,
+                    "bbox": list(box.bbox),
+                    "label": box.label,
+                    "score": box.score,
+                }
+                for box in page_boxes
+            ]
+
+        save_json(raw_data, raw_path)
+
         # Create visualization of raw layouts if configured
         if defaults.CREATE_VISUALIZATIONS:
             from ..shared.visualization.layout_visualizer import visualize_page_layout
             viz_dir = raw_dir / "visualizations"
             viz_dir.mkdir(exist_ok=True)
-            
-            for page_idx, (page_layout, image) in enumerate(zip(layouts, images)):
-                # Convert layouts to Box objects for visualization
-                boxes = []
-                for det_idx, layout in enumerate(page_layout):
-                    det_id = f"det_{page_idx}_{det_idx:03d}"
-                    box = Box(
-                        id=det_id,
-                        bbox=(
-                            layout.block.x_1,
-                            layout.block.y_1,
-                            layout.block.x_2,
-                            layout.block.y_2,
-                        ),
-                        label=str(layout.type) if layout.type else "Unknown",
-                        score=float(layout.score or 0.0),
-                    )
-                    boxes.append(box)
-                
+
+            for page_idx, boxes, image in zip(page_indices, raw_boxes, images):
                 output_path = viz_dir / f"page_{page_idx + 1:03d}_raw_layout.png"
                 visualize_page_layout(
                     image,
                     boxes,
                     title=f"Page {page_idx + 1} - Raw Detection ({len(boxes)} boxes)",
+                    coordinate_size=(
+                        image.width * self._coordinate_scale(),
+                        image.height * self._coordinate_scale(),
+                    ),
                     save_path=output_path,
                     show_labels=True,
                     show_reading_order=False,
-                )
\ No newline at end of file
+                )
+
+        return raw_data
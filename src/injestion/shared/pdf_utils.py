@@ -1,23 +1,30 @@
 """Common PDF processing utilities."""
 
+import hashlib
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Sequence
 from pdf2image import convert_from_path
 
 logger = logging.getLogger(__name__)
 
 
-def convert_pdf_to_images(pdf_path: Path, cache_dir: str, detection_dpi: int = 400) -> List:
+def convert_pdf_to_images(
+    pdf_path: Path,
+    cache_dir: str,
+    detection_dpi: int = 400,
+    pages: Optional[Sequence[int]] = None
+) -> List:
     """Convert PDF to images and save them.
     
     Args:
         pdf_path: Path to PDF file
         cache_dir: Cache directory for storing images
         detection_dpi: DPI for image conversion
+        pages: Optional 0-based page indices to rasterize (default: all pages)
         
     Returns:
-        List of PIL Images
+        List of PIL Images, one per requested page in the order given
         
     Raises:
         FileNotFoundError: If PDF doesn't exist
@@ -37,11 +44,21 @@ def convert_pdf_to_images(pdf_path: Path, cache_dir: str, detection_dpi: int = 4
     page_dir.mkdir(parents=True, exist_ok=True)
     
     try:
-        images = convert_from_path(str(pdf_path), dpi=detection_dpi)
-        if not images:
+        if pages is None:
+            images = convert_from_path(str(pdf_path), dpi=detection_dpi)
+            page_indices = list(range(len(images)))
+        else:
+            page_indices = list(pages)
+            images = []
+            for idx in page_indices:
+                # pdf2image page numbers are 1-based and inclusive
+                images.extend(convert_from_path(
+                    str(pdf_path), dpi=detection_dpi, first_page=idx + 1, last_page=idx + 1
+                ))
+        if not images and pages is None:
             raise ValueError(f"No images extracted from PDF: {pdf_path}")
             
-        for idx, img in enumerate(images):
+        for idx, img in zip(page_indices, images):
             img.save(page_dir / f"page-{idx:03}.png")
             
         logger.info(f"Converted {len(images)} pages from {pdf_path.name}")
@@ -52,6 +69,41 @@ def convert_pdf_to_images(pdf_path: Path, cache_dir: str, detection_dpi: int = 4
         raise
 
 
+def compute_page_fingerprints(pdf_path: Path) -> List[str]:
+    """Compute a content fingerprint for every page of a PDF.
+    
+    The fingerprint covers everything that influences layout detection and
+    extraction for a page: its geometry, its decompressed content streams,
+    the form XObjects it invokes and the raw data of every image it draws. Pages with equal fingerprints can
+    reuse each other's processing results.
+    
+    Args:
+        pdf_path: Path to PDF file
+        
+    Returns:
+        List of hex digests, one per page
+    """
+    import fitz  # PyMuPDF
+    
+    fingerprints = []
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            h = hashlib.sha256()
+            h.update(f"{tuple(page.rect)}|{page.rotation}".encode())
+            h.update(page.read_contents())
+            for xobject in page.get_xobjects():
+                h.update(doc.xref_stream(xobject[0]) or b"")
+            for image in page.get_images(full=True):
+                xref = image[0]
+                try:
+                    h.update(doc.xref_stream_raw(xref) or b"")
+                except Exception:
+                    # Fall back to the image's declared properties
+                    h.update(repr(image[1:]).encode())
+            fingerprints.append(h.hexdigest())
+    return fingerprints
+
+
 def save_merged_layouts(consolidated_layouts: List, pdf_path: Path, cache_dir: str):
     """Save merged/consolidated layouts to JSON.
     
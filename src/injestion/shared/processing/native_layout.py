@@ -0,0 +1,244 @@
+"""Native layout extraction for born-digital PDF pages.
+
+Pages with a clean text layer and no images or vector graphics do not need
+a Mask R-CNN pass: PyMuPDF's own text blocks already describe the layout.
+This module classifies pages and converts PyMuPDF blocks into ``Box``
+objects in the same pixel coordinate space as layout detection, so they can
+flow through ``no_overlap_pipeline`` and reading-order detection unchanged.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import fitz  # PyMuPDF
+
+from .box import Box
+
+logger = logging.getLogger(__name__)
+
+# Route names recorded in pipeline metadata
+ROUTE_NATIVE = "native"
+ROUTE_DETECTOR = "detector"
+
+# First characters that mark a text block as a list
+_LIST_MARKER = re.compile(r"^\s*(?:[•◦▪‣●·–-]|\(?\d{1,2}[.)]|\(?[a-z][.)])\s+")
+
+
+@dataclass
+class PageProfile:
+    """Cheap structural statistics of a PDF page."""
+
+    page_index: int
+    image_count: int
+    drawing_count: int
+    text_blocks: int
+    text_chars: int
+    text_coverage: float  # Fraction of the page area covered by text blocks
+
+
+@dataclass
+class PageRoute:
+    """Routing decision for a single page."""
+
+    route: str
+    reason: str
+    profile: PageProfile
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self.profile)
+        data.pop("page_index")
+        data["text_coverage"] = round(data["text_coverage"], 3)
+        return {"route": self.route, "reason": self.reason, **data}
+
+
+def profile_page(page: fitz.Page, page_index: int, text_dict: Dict[str, Any] | None = None) -> PageProfile:
+    """Collect image, drawing and text statistics for a page.
+
+    Args:
+        page: PyMuPDF page
+        page_index: 0-based page index
+        text_dict: Optional pre-computed ``page.get_text("dict")`` output
+
+    Returns:
+        PageProfile for the page
+    """
+    text_dict = text_dict or page.get_text("dict")
+    blocks = text_dict.get("blocks", [])
+
+    image_count = sum(1 for b in blocks if b.get("type") == 1)
+    text_blocks = [b for b in blocks if b.get("type") == 0]
+    text_chars = sum(
+        len(span.get("text", "").strip())
+        for b in text_blocks for line in b.get("lines", []) for span in line.get("spans", [])
+    )
+
+    page_area = page.rect.width * page.rect.height
+    covered = sum(fitz.Rect(b["bbox"]).get_area() for b in text_blocks)
+
+    return PageProfile(
+        page_index=page_index,
+        image_count=image_count,
+        drawing_count=len(page.get_drawings()),
+        text_blocks=len(text_blocks),
+        text_chars=text_chars,
+        text_coverage=covered / page_area if page_area > 0 else 0.0,
+    )
+
+
+def classify_page(
+    profile: PageProfile,
+    max_images: int = 0,
+    max_drawings: int = 15,
+    min_text_coverage: float = 0.3,
+) -> PageRoute:
+    """Decide whether a page can use the native layout path.
+
+    Args:
+        profile: Page statistics from ``profile_page``
+        max_images: Maximum number of embedded images allowed
+        max_drawings: Maximum number of vector drawing paths allowed
+            (tables and charts typically contain many more)
+        min_text_coverage: Minimum fraction of the page covered by text
+
+    Returns:
+        PageRoute with the decision and a short reason
+    """
+    if profile.text_chars == 0:
+        return PageRoute(ROUTE_DETECTOR, "no text layer", profile)
+    if profile.image_count > max_images:
+        return PageRoute(ROUTE_DETECTOR, f"{profile.image_count} images", profile)
+    if profile.drawing_count > max_drawings:
+        return PageRoute(ROUTE_DETECTOR, f"{profile.drawing_count} vector drawings", profile)
+    if profile.text_coverage < min_text_coverage:
+        return PageRoute(ROUTE_DETECTOR, f"text coverage {profile.text_coverage:.2f}", profile)
+    return PageRoute(ROUTE_NATIVE, "text-only page", profile)
+
+
+def _block_text(block: Dict[str, Any]) -> str:
+    return "\n".join(
+        "".join(span.get("text", "") for span in line.get("spans", []))
+        for line in block.get("lines", [])
+    ).strip()
+
+
+def _block_font_size(block: Dict[str, Any]) -> float:
+    sizes = [span.get("size", 0.0) for line in block.get("lines", []) for span in line.get("spans", [])]
+    return max(sizes) if sizes else 0.0
+
+
+def native_page_boxes(
+    page: fitz.Page,
+    page_index: int,
+    dpi: int,
+    text_dict: Dict[str, Any] | None = None,
+    title_size_ratio: float = 1.2,
+) -> List[Box]:
+    """Convert PyMuPDF text blocks into layout boxes.
+
+    Args:
+        page: PyMuPDF page
+        page_index: 0-based page index
+        dpi: DPI of the detection coordinate space (bboxes are scaled from
+            PDF points so they match detector output)
+        text_dict: Optional pre-computed ``page.get_text("dict")`` output
+        title_size_ratio: Blocks whose largest font is this much bigger than
+            the page's body font are labelled ``Title``
+
+    Returns:
+        List of boxes with ids ``nat_<page>_<index>``
+    """
+    text_dict = text_dict or page.get_text("dict")
+    blocks = [
+        b for b in text_dict.get("blocks", [])
+        if b.get("type") == 0 and _block_text(b)
+    ]
+    if not blocks:
+        return []
+
+    # Body font size: the size carrying the most characters on the page
+    chars_by_size: Dict[float, int] = {}
+    for b in blocks:
+        for line in b.get("lines", []):
+            for span in line.get("spans", []):
+                size = round(span.get("size", 0.0), 1)
+                chars_by_size[size] = chars_by_size.get(size, 0) + len(span.get("text", "").strip())
+    body_size = max(chars_by_size, key=chars_by_size.get) if chars_by_size else 0.0
+
+    scale = dpi / 72.0
+    boxes = []
+    for idx, block in enumerate(blocks):
+        text = _block_text(block)
+        line_count = len(block.get("lines", []))
+
+        if body_size and line_count <= 3 and _block_font_size(block) >= body_size * title_size_ratio:
+            label = "Title"
+        elif _LIST_MARKER.match(text):
+            label = "List"
+        else:
+            label = "Text"
+
+        x1, y1, x2, y2 = block["bbox"]
+        boxes.append(Box(
+            id=f"nat_{page_index}_{idx:03d}",
+            bbox=(x1 * scale, y1 * scale, x2 * scale, y2 * scale),
+            label=label,
+            score=1.0,
+            page_index=page_index,
+        ))
+
+    return boxes
+
+
+def route_pages(
+    pdf_path: Path,
+    page_indices: Sequence[int],
+    dpi: int,
+    max_images: int = 0,
+    max_drawings: int = 15,
+    min_text_coverage: float = 0.3,
+) -> tuple[Dict[int, PageRoute], Dict[int, List[Box]]]:
+    """Classify pages and build native boxes for the simple ones.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_indices: 0-based page indices to classify
+        dpi: DPI of the detection coordinate space
+        max_images: See ``classify_page``
+        max_drawings: See ``classify_page``
+        min_text_coverage: See ``classify_page``
+
+    Returns:
+        Routing decision per page and native boxes for pages routed to the
+        native path
+    """
+    routes: Dict[int, PageRoute] = {}
+    native_boxes: Dict[int, List[Box]] = {}
+
+    with fitz.open(pdf_path) as doc:
+        for page_index in page_indices:
+            page = doc[page_index]
+            text_dict = page.get_text("dict")
+            route = classify_page(
+                profile_page(page, page_index, text_dict),
+                max_images=max_images,
+                max_drawings=max_drawings,
+                min_text_coverage=min_text_coverage,
+            )
+            if route.route == ROUTE_NATIVE:
+                boxes = native_page_boxes(page, page_index, dpi, text_dict)
+                if boxes:
+                    native_boxes[page_index] = boxes
+                else:
+                    route = PageRoute(ROUTE_DETECTOR, "no usable text blocks", route.profile)
+            routes[page_index] = route
+
+    logger.info(
+        f"Page routing for {Path(pdf_path).name}: {len(native_boxes)} native, "
+        f"{len(routes) - len(native_boxes)} detector"
+    )
+    return routes, native_boxes
@@ -3,7 +3,7 @@
 import logging
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import fitz  # PyMuPDF
 from PIL import Image
 import numpy as np
@@ -69,11 +69,21 @@ def extract_figure_image(
     return extractor.extract_figure_image(pdf_path, page_num, bbox, dpi)
 
 
+def figure_placeholder(role: str, img_filename: str, position: Optional[int] = None) -> str:
+    """Build the placeholder text stored on figure/table blocks."""
+    placeholder = f"[{role.upper()}"
+    if position:
+        placeholder += f" {position}"
+    placeholder += f" - See {img_filename}]"
+    return placeholder
+
+
 def extract_document_content(
     document: Document,
     pdf_path: Path,
     dpi: int,
-    cache_dir: str
+    cache_dir: str,
+    pages: Optional[Iterable[int]] = None
 ) -> Document:
     """Extract text and figure content for all blocks in document.
     
@@ -81,6 +91,8 @@ def extract_document_content(
         document: Document with layout detection results
         pdf_path: Path to source PDF
         dpi: DPI used during layout detection
+        pages: Optional 0-based page indices to extract; blocks on other
+            pages are left untouched (default: all pages)
         
     Returns:
         Document with content populated
@@ -117,9 +129,13 @@ def extract_document_content(
     text_blocks = 0
     figure_blocks = 0
     
+    page_filter = set(pages) if pages is not None else None
+    
     # Process each block
     for block in document.blocks:
         page_idx = block.page_index
+        if page_filter is not None and page_idx not in page_filter:
+            continue
         
         if block.role in ['Text', 'Title', 'List']:
             # Extract text content
@@ -169,12 +185,7 @@ def extract_document_content(
                 if block.id in order:
                     position = order.index(block.id) + 1
             
-            placeholder = f"[{block.role.upper()}"
-            if position:
-                placeholder += f" {position}"
-            placeholder += f" - See {img_filename}]"
-            
-            block.text = placeholder
+            block.text = figure_placeholder(block.role, img_filename, position)
             figure_blocks += 1
             logger.debug(f"Extracted {block.role} block {block.id} as image: {img_path}")
     
@@ -202,11 +213,16 @@ def get_document_text(document: Document, include_placeholders: bool = True) ->
     """
     pages_text = {}
     
+    # Index blocks once instead of rescanning every block for each page
+    blocks_by_page: Dict[int, List[Block]] = {}
+    for block in document.blocks:
+        blocks_by_page.setdefault(block.page_index, []).append(block)
+    
     for page_idx in range(document.metadata.get('total_pages', 0)):
         page_elements = []
         
         # Get blocks for this page
-        page_blocks = [b for b in document.blocks if b.page_index == page_idx]
+        page_blocks = blocks_by_page.get(page_idx, [])
         
         # Get reading order
         if hasattr(document, 'reading_order') and page_idx < len(document.reading_order):
@@ -98,8 +98,31 @@ class PyMuPDFExtractor(TextExtractor):
         doc = fitz.open(pdf_path)
         page = doc[page_num]
         
+        # ------------------------------------------------------------------
+        # Bounding-box coordinates live in the pixel space of a page
+        # rasterised at *dpi* (the pipeline's extraction DPI; detection
+        # boxes are rescaled into it).  Rendering the page at that DPI puts
+        # the bitmap in the *same* coordinate space as the bbox, so no
+        # additional scaling of the crop box is needed – scaling here is
+        # exactly what shifted crops away from the debug overlays before.
+        #
+        # Only the figure region is rendered: the bbox is mapped back to PDF
+        # points and used as the clip rectangle, which avoids rasterising the
+        # whole page at high DPI for every figure.  Rotated pages fall back to
+        # rendering the full page and cropping, since clip rectangles are
+        # expressed in unrotated page space.
+        # ------------------------------------------------------------------
+        zoom = dpi / 72.0
+        mat = fitz.Matrix(zoom, zoom)
+        
+        if page.rotation == 0:
+            clip = fitz.Rect(bbox[0] / zoom, bbox[1] / zoom, bbox[2] / zoom, bbox[3] / zoom) & page.rect
+            pix = page.get_pixmap(matrix=mat, clip=clip)
+            img_data = pix.tobytes("png")
+            doc.close()
+            return Image.open(BytesIO(img_data))
+        
         # Render page at specified DPI
-        mat = fitz.Matrix(dpi/72.0, dpi/72.0)
         pix = page.get_pixmap(matrix=mat)
         
         # Convert to PIL Image
@@ -108,22 +131,6 @@ class PyMuPDFExtractor(TextExtractor):
         
         # Open as PIL Image and crop
         full_page = Image.open(BytesIO(img_data))
-        
-        # ------------------------------------------------------------------
-        # Bounding-box coordinates are generated by the layout-detection
-        # stage on images that were rasterised at *detection_dpi*.
-        # Down-stream we pass the very same `dpi` value that has been used
-        # for detection when we call this helper, therefore the bbox lives
-        # in the *same* pixel coordinate space as the rendered bitmap that
-        # we have just obtained from PyMuPDF.  Any additional scaling would
-        # therefore introduce a systematic offset and size error – exactly
-        # what we observed when the detection ran at 400 DPI or 600 DPI: the
-        # cropped region was shifted and did not match the overlay drawn in
-        # the debug visualisations.
-        #
-        # In short: **do not scale**; use the bbox as-is.
-        # ------------------------------------------------------------------
-
         cropped = full_page.crop(
             (
                 int(bbox[0]),
@@ -33,7 +33,8 @@ def visualize_page_layout(
     save_path: Optional[Path] = None,
     show_labels: bool = True,
     show_reading_order: bool = True,
-    dpi: int = 150
+    dpi: int = 150,
+    coordinate_size: Optional[Tuple[float, float]] = None
 ) -> None:
     """Visualize bounding boxes on a single page.
     
@@ -46,11 +47,17 @@ def visualize_page_layout(
         show_labels: Whether to show element type labels
         show_reading_order: Whether to show reading order numbers
         dpi: DPI for saving the figure
+        coordinate_size: Optional (width, height) of the box coordinate
+            space when it differs from the image resolution
     """
     fig, ax = plt.subplots(1, 1, figsize=(12, 16))
     
     # Display the page image
-    ax.imshow(page_image)
+    if coordinate_size:
+        # Stretch the raster over the box coordinate space
+        ax.imshow(page_image, extent=(0, coordinate_size[0], coordinate_size[1], 0))
+    else:
+        ax.imshow(page_image)
     ax.set_title(title, fontsize=16)
     ax.axis('off')
     
@@ -146,20 +153,30 @@ def visualize_document(
     
     # Load page images
     page_images_dir = pages_dir(pdf_path, cache_dir)
-    page_images = sorted(page_images_dir.glob("page-*.png"))
+    # Index by page number parsed from the filename (page-NNN.png, 0-based)
+    page_images = {
+        int(path.stem.split("-")[-1]): path
+        for path in page_images_dir.glob("page-*.png")
+    }
     
     if not page_images:
         raise FileNotFoundError(f"No page images found in {page_images_dir}")
     
     # Determine which pages to visualize
-    total_pages = len(page_images)
-    if pages_to_show is None:
-        pages_to_show = list(range(total_pages))
+    full_run = pages_to_show is None
+    if full_run:
+        pages_to_show = sorted(page_images)
+    
+    # Page images are rasterized at detection DPI; blocks may live in a
+    # higher-resolution extraction coordinate space
+    raster_dpi = document.metadata.get("detection_dpi")
+    coordinate_dpi = document.metadata.get("extraction_dpi", raster_dpi)
+    scale = coordinate_dpi / raster_dpi if raster_dpi and coordinate_dpi else 1.0
     
     saved_paths = []
     
     for page_idx in pages_to_show:
-        if page_idx >= total_pages:
+        if page_idx not in page_images:
             continue
             
         # Load page image
@@ -194,14 +211,17 @@ def visualize_document(
             title=f"Page {page_idx + 1} - Layout Detection",
             save_path=save_path,
             show_labels=show_labels,
-            show_reading_order=show_reading_order
+            show_reading_order=show_reading_order,
+            coordinate_size=(page_image.width * scale, page_image.height * scale) if scale != 1.0 else None
         )
         
         saved_paths.append(save_path)
     
     # Create summary visualization showing all pages in a grid
-    if len(saved_paths) > 1:
-        create_summary_grid(saved_paths, output_dir / "all_pages_summary.png")
+    # (partial runs rebuild it from every page visualization on disk)
+    summary_sources = saved_paths if full_run else sorted(output_dir.glob("page_*_layout.png"))
+    if len(summary_sources) > 1:
+        create_summary_grid(summary_sources, output_dir / "all_pages_summary.png")
         saved_paths.append(output_dir / "all_pages_summary.png")
     
     return saved_paths
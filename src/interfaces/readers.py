@@ -137,6 +137,30 @@ class StandardDocumentReader(DocumentReader):
             # Derive from document
             cache_path = document.get_cache_path()
             self.base_path = cache_path / "extracted"
+        
+        self._build_indexes()
+    
+    def _build_indexes(self) -> None:
+        """Precompute block lookups and reset memoized renderings."""
+        self._blocks_by_id: Dict[str, Block] = {}
+        self._blocks_by_page: Dict[int, List[Block]] = {}
+        for block in self.document.blocks:
+            # First occurrence wins, matching the previous linear scan
+            self._blocks_by_id.setdefault(block.id, block)
+            self._blocks_by_page.setdefault(block.page_index, []).append(block)
+        
+        # Renderings keyed by (content types, output format, page range)
+        self._render_cache: Dict[Tuple, Any] = {}
+        self._items_cache: Dict[Tuple, List[ContentItem]] = {}
+        self._locations_cache: Dict[bool, List[Tuple[str, Dict[str, Any]]]] = {}
+    
+    def refresh(self) -> None:
+        """Rebuild indexes after the underlying document has been modified."""
+        self._build_indexes()
+    
+    def get_page_blocks(self, page_index: int) -> List[Block]:
+        """Get all blocks on a page in storage order."""
+        return list(self._blocks_by_page.get(page_index, []))
     
     def get_content(
         self,
@@ -148,20 +172,27 @@ class StandardDocumentReader(DocumentReader):
         if content_types is None:
             content_types = [ContentType.ALL]
         
+        cache_key = (self._types_key(content_types), output_format, page_range)
+        if cache_key in self._render_cache:
+            return self._copy_rendering(self._render_cache[cache_key])
+        
         # Get content items
         items = self._get_content_items(content_types, page_range)
         
         # Format output
         if output_format == OutputFormat.TEXT_ONLY:
-            return self._format_text_only(items)
+            rendering = self._format_text_only(items)
         elif output_format == OutputFormat.TEXT_WITH_PLACEHOLDERS:
-            return self._format_with_placeholders(items)
+            rendering = self._format_with_placeholders(items)
         elif output_format == OutputFormat.STRUCTURED:
-            return [item.to_dict() for item in items]
+            rendering = [item.to_dict() for item in items]
         elif output_format == OutputFormat.VISION_READY:
-            return items  # Return ContentItem objects
+            rendering = items  # Return ContentItem objects
         else:
             raise ValueError(f"Unknown output format: {output_format}")
+        
+        self._render_cache[cache_key] = rendering
+        return self._copy_rendering(rendering)
     
     def get_text_only(self) -> str:
         """Get pure text without placeholders."""
@@ -200,6 +231,9 @@ class StandardDocumentReader(DocumentReader):
         Returns:
             List of (text, metadata) tuples
         """
+        if normalize in self._locations_cache:
+            return [(text, dict(meta)) for text, meta in self._locations_cache[normalize]]
+        
         items = self._get_content_items([ContentType.TEXT])
         results = []
         
@@ -214,7 +248,8 @@ class StandardDocumentReader(DocumentReader):
                 }
                 results.append((text, metadata))
         
-        return results
+        self._locations_cache[normalize] = results
+        return [(text, dict(meta)) for text, meta in results]
     
     def _get_content_items(
         self,
@@ -222,6 +257,10 @@ class StandardDocumentReader(DocumentReader):
         page_range: Optional[Tuple[int, int]] = None
     ) -> List[ContentItem]:
         """Get content items in reading order."""
+        cache_key = (self._types_key(content_types), page_range)
+        if cache_key in self._items_cache:
+            return list(self._items_cache[cache_key])
+        
         items = []
         
         # Determine pages to process
@@ -249,14 +288,24 @@ class StandardDocumentReader(DocumentReader):
                 
                 items.append(ContentItem(block, self.base_path, page_idx))
         
-        return items
+        self._items_cache[cache_key] = items
+        return list(items)
     
     def _get_block_by_id(self, block_id: str) -> Optional[Block]:
         """Find block by ID."""
-        for block in self.document.blocks:
-            if block.id == block_id:
-                return block
-        return None
+        return self._blocks_by_id.get(block_id)
+    
+    @staticmethod
+    def _types_key(content_types: List[ContentType]) -> Tuple[str, ...]:
+        """Order-independent hashable key for a content type filter."""
+        return tuple(sorted({ct.value for ct in content_types}))
+    
+    @staticmethod
+    def _copy_rendering(rendering: Any) -> Any:
+        """Return a copy of a memoized rendering that callers may mutate."""
+        if isinstance(rendering, list):
+            return [dict(r) if isinstance(r, dict) else r for r in rendering]
+        return rendering
     
     def _matches_content_type(self, block: Block, content_types: List[ContentType]) -> bool:
         """Check if block matches content type filter."""
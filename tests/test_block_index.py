@@ -0,0 +1,102 @@
+"""BM25 ranking, neighbour expansion and persistence of BlockIndex."""
+
+from src.core.block_index import BlockIndex, content_hash, tokenize
+
+
+def _content(*pages):
+    """content.json with one page per argument, each a list of block texts."""
+    blocks, reading_order = [], []
+    for page_idx, texts in enumerate(pages):
+        ids = []
+        for i, text in enumerate(texts):
+            block_id = f"p{page_idx}_b{i}"
+            blocks.append({"id": block_id, "text": text})
+            ids.append(block_id)
+        reading_order.append(ids)
+    return {"blocks": blocks, "reading_order": reading_order}
+
+
+CONTENT = _content(
+    [
+        "Recombinant influenza vaccine contains 45 mcg hemagglutinin per strain.",
+        "Study design and enrolment of adult participants.",
+        "Egg-free manufacturing avoids egg-adapted mutations.",
+    ],
+    [
+        "Hemagglutinin antigen content was three times that of standard vaccines.",
+        "Adverse events were mild and similar across groups.",
+    ],
+)
+
+
+def test_tokenize_drops_stopwords_and_keeps_decimals():
+    assert tokenize("The dose was 0.5 mL of the vaccine") == ["dose", "0.5", "ml", "vaccine"]
+
+
+def test_search_ranks_blocks_by_query_terms():
+    index = BlockIndex.build(CONTENT)
+
+    hits = index.search("hemagglutinin antigen content", top_k=3)
+
+    assert [block_id for block_id, _ in hits] == ["p1_b0", "p0_b0"]
+    assert hits[0][1] > hits[1][1] > 0
+
+
+def test_rare_terms_outweigh_common_ones():
+    index = BlockIndex.build(CONTENT)
+
+    # "hemagglutinin" is in two blocks, "egg" only in one
+    top_id, _ = index.search("hemagglutinin egg")[0]
+
+    assert top_id == "p0_b2"
+
+
+def test_search_without_matching_terms_returns_nothing():
+    index = BlockIndex.build(CONTENT)
+
+    assert index.search("the of and") == []
+    assert index.search("zzz") == []
+
+
+def test_top_k_limits_results():
+    index = BlockIndex.build(CONTENT)
+
+    assert len(index.search("vaccine vaccines adverse events study", top_k=2)) == 2
+
+
+def test_expand_neighbors_stays_in_reading_order():
+    index = BlockIndex.build(CONTENT)
+
+    assert index.expand_neighbors(["p1_b0", "p0_b0"], neighbors=1) == [
+        "p0_b0", "p0_b1", "p0_b2", "p1_b0", "p1_b1"
+    ]
+    assert index.expand_neighbors(["p0_b2", "missing"], neighbors=0) == ["p0_b2"]
+
+
+def test_render_marks_pages_and_gaps():
+    index = BlockIndex.build(CONTENT)
+
+    text = index.render(["p0_b0", "p0_b2", "p1_b0"])
+
+    assert text.split("\n\n") == [
+        "[Page 1]",
+        CONTENT["blocks"][0]["text"],
+        "[...]",
+        CONTENT["blocks"][2]["text"],
+        "[Page 2]",
+        CONTENT["blocks"][3]["text"],
+    ]
+
+
+def test_for_document_reuses_saved_index_until_content_changes(tmp_path):
+    built = BlockIndex.for_document(CONTENT, tmp_path)
+    loaded = BlockIndex.for_document(CONTENT, tmp_path)
+
+    assert loaded.source_hash == built.source_hash == content_hash(CONTENT)
+    assert loaded.search("egg") == built.search("egg")
+
+    changed = _content(["Only one block about adjuvants."])
+    rebuilt = BlockIndex.for_document(changed, tmp_path)
+
+    assert rebuilt.source_hash == content_hash(changed)
+    assert [block_id for block_id, _ in rebuilt.search("adjuvants")] == ["p0_b0"]
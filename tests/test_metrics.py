@@ -0,0 +1,72 @@
+"""Prometheus text rendering of gateway metrics."""
+
+import math
+
+import pytest
+
+from src.gateway.app.metrics import Histogram, Registry, error_reason
+
+
+def _samples(registry):
+    return [line for line in registry.render().splitlines() if not line.startswith("#")]
+
+
+def test_histogram_buckets_are_cumulative_with_inclusive_bounds():
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency", ("model",), buckets=(0.5, 1.0, 5.0))
+    for value in (0.1, 0.5, 0.7, 1.0, 3.0, 42.0):
+        histogram.observe(value, "gpt-4.1")
+
+    assert _samples(registry) == [
+        'latency_seconds_bucket{model="gpt-4.1",le="0.5"} 2',
+        'latency_seconds_bucket{model="gpt-4.1",le="1"} 4',
+        'latency_seconds_bucket{model="gpt-4.1",le="5"} 5',
+        'latency_seconds_bucket{model="gpt-4.1",le="+Inf"} 6',
+        'latency_seconds_sum{model="gpt-4.1"} 47.3',
+        'latency_seconds_count{model="gpt-4.1"} 6',
+    ]
+
+
+def test_histogram_adds_an_infinite_bucket_once():
+    assert Histogram("h", "", buckets=(1.0,)).buckets == (1.0, math.inf)
+    assert Histogram("h", "", buckets=(1.0, math.inf)).buckets == (1.0, math.inf)
+
+
+def test_render_includes_help_type_and_escaped_labels():
+    registry = Registry()
+    counter = registry.counter("requests_total", "Requests", ("model", "outcome"))
+    counter.inc('my "model"\\v2', "error")
+    counter.inc('my "model"\\v2', "error", amount=2)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{model="my \\"model\\"\\\\v2",outcome="error"} 3',
+    ]
+
+
+def test_collected_metrics_are_read_at_render_time():
+    registry = Registry()
+    state = {"limit": 4}
+    registry.collect("limit", "Limit", "gauge", lambda: state["limit"])
+    registry.collect("by_name", "By name", "gauge", lambda: {("a",): 1.5, ("b",): None}, ("name",))
+
+    state["limit"] = 8
+
+    assert _samples(registry) == ["limit 8", 'by_name{name="a"} 1.5']
+
+
+def test_duplicate_metric_names_are_rejected():
+    registry = Registry()
+    registry.counter("requests_total", "Requests")
+
+    with pytest.raises(ValueError):
+        registry.counter("requests_total", "Requests again")
+
+
+def test_error_reason_prefers_the_http_status():
+    class StatusError(Exception):
+        status_code = 429
+
+    assert error_reason(StatusError()) == "429"
+    assert error_reason(TimeoutError()) == "TimeoutError"
@@ -0,0 +1,71 @@
+"""Normalization and offset-voting quote location in QuoteLocator."""
+
+from src.core.quote_locator import QuoteLocator, normalize
+
+CONTENT = {
+    "blocks": [
+        {"id": "b0", "text": "Flublok is a recombinant hemagglutinin (HA) vaccine.", "bbox": [0, 0, 10, 10]},
+        {"id": "b1", "text": "Each 0.5 mL dose contains 45 mcg HA per strain,", "bbox": [0, 10, 10, 20]},
+        {"id": "b2", "text": "three times the HA content of standard-dose vaccines.", "bbox": [0, 0, 10, 10]},
+        {"id": "b3", "text": "Immunogen i city was assessed in adults 50 years and older.", "bbox": [0, 10, 10, 20]},
+        {"id": "fig", "image_path": "figures/fig1.png"},
+    ],
+    "reading_order": [["b0", "b1"], ["b2", "fig", "b3"]],
+}
+
+
+def test_normalize_folds_ocr_confusions_spacing_and_case():
+    assert normalize("Immunogen i city") == normalize("immunogenicity")
+    assert normalize("fromFlublok") == normalize("from Flublok")
+    assert normalize("0.5 mL") == normalize("O.5 ml")
+    assert normalize("Il|1") == "llll"
+
+
+def test_exact_quote_is_found_in_its_block():
+    match = QuoteLocator(CONTENT).locate("Flublok is a recombinant hemagglutinin (HA) vaccine.")
+
+    assert match.score == 1.0
+    assert match.block_ids == ["b0"]
+    assert match.pages == [1]
+    assert match.blocks[0]["bbox"] == [0, 0, 10, 10]
+
+
+def test_ocr_corrected_quote_matches_original_text():
+    match = QuoteLocator(CONTENT).locate("Immunogenicity was assessed in adults 5O years and older")
+
+    assert match.score == 1.0
+    assert match.block_ids == ["b3"]
+
+
+def test_quote_spanning_blocks_and_pages():
+    match = QuoteLocator(CONTENT).locate(
+        "contains 45 mcg HA per strain, three times the HA content of standard-dose vaccines"
+    )
+
+    assert match.score == 1.0
+    assert match.block_ids == ["b1", "b2"]
+    assert match.pages == [1, 2]
+
+
+def test_offset_voting_tolerates_small_edits():
+    # Words dropped and changed relative to the document text
+    match = QuoteLocator(CONTENT).locate("Each dose contains 45 micrograms HA per strain, three times the HA content")
+
+    assert 0.5 < match.score < 1.0
+    assert match.block_ids == ["b1", "b2"]
+
+
+def test_paraphrase_scores_low_and_unrelated_text_is_not_found():
+    locator = QuoteLocator(CONTENT)
+
+    paraphrase = locator.locate("The vaccine has triple the antigen of ordinary flu shots")
+    assert paraphrase is None or paraphrase.score < 0.3
+    assert locator.locate("zzzzzzzzzz qqqqqqqq") is None
+
+
+def test_short_quote_falls_back_to_substring_search():
+    locator = QuoteLocator(CONTENT)
+
+    assert locator.locate("mcg").block_ids == ["b1"]
+    assert locator.locate("xyz") is None
+    assert locator.locate("") is None
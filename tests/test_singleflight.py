@@ -0,0 +1,88 @@
+"""Coalescing of concurrent calls in SingleFlight."""
+
+import asyncio
+
+import pytest
+
+from src.gateway.app.singleflight import SingleFlight
+
+
+class Upstream:
+    """Counts calls and finishes them when ``release`` is set."""
+
+    def __init__(self, result="response", error=None):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_concurrent_calls_with_one_key_share_one_upstream_call():
+    async def scenario():
+        flight, upstream = SingleFlight(), Upstream()
+        callers = [asyncio.create_task(flight.do("key", upstream)) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return flight, upstream, await asyncio.gather(*callers)
+
+    flight, upstream, results = asyncio.run(scenario())
+
+    assert upstream.calls == 1
+    assert results == [("response", False), ("response", True), ("response", True)]
+    assert flight.stats() == {"in_flight": 0, "waiting": 0, "upstream_calls": 1, "coalesced_waiters": 2}
+
+
+def test_different_keys_and_later_calls_are_not_coalesced():
+    async def scenario():
+        flight, upstream = SingleFlight(), Upstream()
+        upstream.release.set()
+        first = await asyncio.gather(flight.do("a", upstream), flight.do("b", upstream))
+        second = await flight.do("a", upstream)
+        return upstream, first, second
+
+    upstream, first, second = asyncio.run(scenario())
+
+    assert upstream.calls == 3
+    assert first == [("response", False), ("response", False)]
+    assert second == ("response", False)
+
+
+def test_exception_is_raised_to_every_waiter():
+    async def scenario():
+        flight, upstream = SingleFlight(), Upstream(error=ConnectionError("upstream down"))
+        callers = [asyncio.create_task(flight.do("key", upstream)) for _ in range(2)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return upstream, await asyncio.gather(*callers, return_exceptions=True)
+
+    upstream, results = asyncio.run(scenario())
+
+    assert upstream.calls == 1
+    assert [type(r) for r in results] == [ConnectionError, ConnectionError]
+    assert results[0] is results[1]
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    async def scenario():
+        flight, upstream = SingleFlight(), Upstream()
+        leader = asyncio.create_task(flight.do("key", upstream))
+        follower = asyncio.create_task(flight.do("key", upstream))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        upstream.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return upstream, await follower
+
+    upstream, result = asyncio.run(scenario())
+
+    assert upstream.calls == 1
+    assert result == ("response", True)
@@ -0,0 +1,79 @@
+"""Appending, reading and crash recovery of the study journal."""
+
+import json
+
+from src.fact_check.utils.study_journal import StudyJournal, write_results_json
+
+
+def test_records_round_trip_and_last_claim_record_wins(tmp_path):
+    journal = StudyJournal(tmp_path / "journal.jsonl")
+    journal.write_header({"claims_file": "claims.json"})
+    journal.write_claim("claim_000", {"error": "gateway down"})
+    journal.write_claim("claim_001", {"documents": {"A": {}}})
+    journal.write_claim("claim_000", {"documents": {"B": {}}})
+
+    assert journal.header() == {"claims_file": "claims.json"}
+    assert journal.completed_claims() == {"claim_000", "claim_001"}
+    claims = journal.claims()
+    assert list(claims) == ["claim_000", "claim_001"]
+    assert claims["claim_000"] == {"documents": {"B": {}}}
+    assert dict(claims.items()) == {
+        "claim_000": {"documents": {"B": {}}},
+        "claim_001": {"documents": {"A": {}}},
+    }
+
+
+def test_failed_claims_are_not_completed(tmp_path):
+    journal = StudyJournal(tmp_path / "journal.jsonl")
+    journal.write_claim("claim_000", {"documents": {}})
+    journal.write_claim("claim_000", {"error": "interrupted"})
+
+    assert journal.completed_claims() == set()
+
+
+def test_truncated_last_line_is_skipped_and_appends_start_a_new_line(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = StudyJournal(path)
+    journal.write_header({"study": 1})
+    journal.write_claim("claim_000", {"documents": {}})
+    # A crash mid-write leaves half a record without its newline
+    with open(path, "a") as f:
+        f.write('{"type": "claim", "claim_id": "claim_001", "res')
+
+    resumed = StudyJournal(path)
+    assert resumed.completed_claims() == {"claim_000"}
+
+    resumed.write_claim("claim_001", {"documents": {}})
+    assert resumed.completed_claims() == {"claim_000", "claim_001"}
+    lines = path.read_text().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[-1])["claim_id"] == "claim_001"
+
+
+def test_missing_journal_reads_as_empty(tmp_path):
+    journal = StudyJournal(tmp_path / "missing.jsonl")
+
+    assert journal.header() is None
+    assert journal.completed_claims() == set()
+    assert len(journal.claims()) == 0
+
+
+def test_batch_extraction_runs_are_concatenated(tmp_path):
+    journal = StudyJournal(tmp_path / "journal.jsonl")
+    journal.write_batch_extraction([{"group_id": "group_000"}])
+    journal.write_batch_extraction([{"group_id": "group_001"}])
+
+    assert [run["group_id"] for run in journal.batch_extraction_runs()] == ["group_000", "group_001"]
+
+
+def test_results_json_matches_json_dump(tmp_path):
+    journal = StudyJournal(tmp_path / "journal.jsonl")
+    journal.write_claim("claim_000", {"documents": {"A": {"evidence": ["x", 1.5, None]}}})
+    journal.write_claim("claim_001", {"documents": {}})
+    results = {"metadata": {"n": 2}, "claims": journal.claims(), "summary": {"empty": []}}
+
+    path = tmp_path / "results.json"
+    write_results_json(path, results)
+
+    expected = dict(results, claims=dict(journal.claims().items()))
+    assert path.read_text() == json.dumps(expected, indent=2)